@@ -25,6 +25,7 @@ Imports = {
     "alphaVantage-api": find_spec("alphaVantageAPI") is not None,
     "matplotlib": find_spec("matplotlib") is not None,
     "mplfinance": find_spec("mplfinance") is not None,
+    "numba": find_spec("numba") is not None,
     "scipy": find_spec("scipy") is not None,
     "sklearn": find_spec("sklearn") is not None,
     "statsmodels": find_spec("statsmodels") is not None,
@@ -85,6 +86,13 @@ Category = {
     ],
 }
 
+# Indicators that hold the GIL for most of their run, like Python loops over
+# the bars, or that are not thread safe. strategy(executor="threads") runs
+# them in the calling thread. The others spend their time in pandas
+# rolling/ewm, NumPy or numba kernels that release the GIL.
+GILBound = ["adx", "cdl_pattern", "fisher", "stc", "tsignals", "vp"]
+ThreadSafe = sorted(set(sum(Category.values(), [])) - set(GILBound))
+
 CANGLE_AGG = {
     "open": "first",
     "high": "max",
@@ -114,3 +122,4 @@ RATE = {
 }
 
 from pandas_ta.core import *
+from pandas_ta import stream
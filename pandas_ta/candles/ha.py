@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_engine, get_offset, linear_recurrence, verify_series
 
 
 def ha(open_, high, low, close, offset=None, **kwargs):
@@ -11,19 +11,22 @@ def ha(open_, high, low, close, offset=None, **kwargs):
     low = verify_series(low)
     close = verify_series(close)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     # Calculate Result
-    m = close.size
+    ha_close = 0.25 * (open_ + high + low + close)
+    # HA_open[i] = 0.5 * HA_close[i - 1] + 0.5 * HA_open[i - 1]
+    ha_open = linear_recurrence(
+        0.5, ha_close.shift(1).to_numpy(dtype=float),
+        y0=0.5 * (open_.iloc[0] + close.iloc[0]), start=1, engine=engine
+    )
     df = DataFrame({
-        "HA_open": 0.5 * (open_.iloc[0] + close.iloc[0]),
+        "HA_open": ha_open,
         "HA_high": high,
         "HA_low": low,
-        "HA_close": 0.25 * (open_ + high + low + close),
+        "HA_close": ha_close,
     })
 
-    for i in range(1, m):
-        df["HA_open"][i] = 0.5 * (df["HA_open"][i - 1] + df["HA_close"][i - 1])
-
     df["HA_high"] = df[["HA_open", "HA_high", "HA_close"]].max(axis=1)
     df["HA_low"] = df[["HA_open", "HA_low", "HA_close"]].min(axis=1)
 
@@ -88,6 +91,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy" for the HA_open filter.
+        Default: "numba" if installed, otherwise "numpy"
 
 Returns:
     pd.DataFrame: ha_open, ha_high,ha_low, ha_close columns.
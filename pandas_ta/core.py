@@ -1,16 +1,23 @@
 # -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from multiprocessing import cpu_count, Pool
+from functools import partial, wraps
+from inspect import Parameter, signature
+from multiprocessing import cpu_count, Pool, resource_tracker
+from os import name as os_name
 from pandas_ta.candles.cdl_pattern import ALL_PATTERNS
 from time import perf_counter
 from typing import List, Tuple
+from uuid import uuid4
 
 import pandas as pd
 from numpy import log10 as npLog10
+from numpy import NaN as npNaN
 from numpy import ndarray as npNdarray
 from pandas.core.base import PandasObject
 
-from pandas_ta import Category, version
+from pandas_ta import Category, ThreadSafe, version
 from pandas_ta.candles import *
 from pandas_ta.cycles import *
 from pandas_ta.momentum import *
@@ -24,6 +31,87 @@ from pandas_ta.utils import *
 
 
 df = pd.DataFrame()
+_executor = {"pool": None}  # The WorkerPool of strategy()
+
+
+class WorkerPool(object):
+    """Worker Pool
+
+    A long-lived pool of worker processes that strategy() reuses instead of
+    starting and joining a new Pool on every call. The workers stay warm:
+    pandas_ta is imported once per worker and each worker keeps its numba
+    kernels compiled between calls. Use it as a context manager or set it
+    with ta.set_executor().
+
+    >>> with ta.WorkerPool(cores=4):
+    >>>     for df in watchlist:
+    >>>         df.ta.strategy(ta.CommonStrategy)
+    >>> # Or
+    >>> ta.set_executor(ta.WorkerPool(cores=4))
+    >>> ...
+    >>> ta.set_executor(None).close()
+
+    Args:
+        cores (int): Number of worker processes. Default: cpu_count()
+    """
+
+    def __init__(self, cores: int = None):
+        cpus = cpu_count()
+        self.cores = int(cores) if isinstance(cores, int) and 0 < cores <= cpus else cpus
+        # Workers must share the resource tracker that unlinks SharedFrames
+        if os_name == "posix": resource_tracker.ensure_running()
+        self.pool = Pool(self.cores, initializer=_warm_worker)
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = set_executor(self)
+        return self
+
+    def __exit__(self, *args):
+        set_executor(self._previous)
+        self._previous = None
+        self.close()
+
+    def __repr__(self):
+        return f"WorkerPool(cores={self.cores}, closed={self.pool is None})"
+
+    def close(self) -> None:
+        """Stops the workers once their tasks are done."""
+        if self.pool is not None:
+            if _executor["pool"] is self:
+                _executor["pool"] = None
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+
+def set_executor(executor: WorkerPool = None) -> WorkerPool:
+    """Sets the WorkerPool that strategy() uses when multiprocessing. With
+    None, strategy() starts a Pool per call. Returns the previous one."""
+    if executor is not None and not isinstance(executor, WorkerPool):
+        raise TypeError("[X] The executor must be a WorkerPool or None.")
+    previous, _executor["pool"] = _executor["pool"], executor
+    return previous
+
+
+def get_executor() -> WorkerPool:
+    """Returns the WorkerPool set with set_executor() or None."""
+    return _executor["pool"]
+
+
+def _warm_worker() -> None:
+    """WorkerPool initializer: imports pandas_ta before the first task."""
+    import pandas_ta  # noqa: F401
+
+
+def _shm_worker(spec: dict, arguments: tuple):
+    """strategy() worker using a SharedFrame. The results are returned as
+    packed arrays and are appended by the main process."""
+    method, args, kwargs, token = arguments
+    df = SharedFrame.attach(spec)
+    result = df.ta._mp_worker((method, args, {**kwargs, "append": False}, token))
+    return pack_result(result, df.index)
+
 
 # Strategy DataClass
 @dataclass
@@ -243,6 +331,7 @@ class AnalysisIndicators(BasePandasObject):
     """
 
     _adjusted = None
+    _batch = None  # Columns pending to be appended by strategy()
     _cores = cpu_count()
     _df = DataFrame()
     _exchange = "NYSE"
@@ -399,6 +488,8 @@ class AnalysisIndicators(BasePandasObject):
             df = self._df
             if df is None or result is None: return
             else:
+                # While batching, the columns are appended by _flush()
+                df = self._batch if self._batch is not None else df
                 if isinstance(result, pd.DataFrame):
                     # If specified in kwargs, rename the columns.
                     # If not, use the default names.
@@ -419,6 +510,73 @@ class AnalysisIndicators(BasePandasObject):
                     )
                     df[ind_name] = result
 
+    def _flush(self) -> None:
+        """Appends the batched columns to self._df at once. Existing columns
+        are replaced in place. The new float columns are added together with
+        .loc as one consolidated block, which avoids fragmenting the
+        DataFrame. The few other columns are set one at a time."""
+        if not self._batch: return
+        df, batch, self._batch = self._df, self._batch, {}
+
+        for column in [c for c in batch if c in df.columns]:
+            df[column] = batch.pop(column)
+        if len(batch):
+            columns = list(batch)
+            others = {c: batch.pop(c) for c in columns if batch[c].dtype != "float64"}
+            if len(others):
+                df.loc[:, columns] = npNaN  # Keeps the column order
+            if len(batch):
+                new = pd.DataFrame(batch, index=df.index)
+                batch.clear()  # Release the results before they are copied
+                df.loc[:, list(new.columns)] = new
+            for column, values in others.items():
+                df[column] = values
+
+    def _cache_key(self, kind: str, sources: list, parameters, args: tuple, kwargs: dict, defaults=None) -> tuple:
+        """Returns the ResultCache key of an indicator call or None. The
+        arguments are bound by name and omitted ones take the defaults of the
+        indicator's signature. The sources and Series arguments are
+        fingerprinted. A call without any is not cached, its result does not
+        depend on the DataFrame."""
+        fingerprints = {}
+        for source in sources:
+            series = kwargs.get(source, source)
+            series = series if isinstance(series, pd.Series) else self._get_column(series)
+            if not isinstance(series, pd.Series): return None
+            fingerprints[source] = fingerprint(series)
+
+        try:
+            bound = parameters.bind(self, *args, **kwargs)
+        except TypeError:
+            return None
+        arguments = {}
+        for name, value in list(bound.arguments.items())[1:]:
+            for k, v in (value.items() if isinstance(value, dict) else [(name, value)]):
+                if k in _UNCACHED or k in sources: continue
+                arguments[k] = v
+
+        if defaults is not None:
+            try:
+                bound = defaults.bind_partial(**arguments)
+            except TypeError:
+                return None
+            bound.apply_defaults()
+            arguments = {}
+            for name, value in bound.arguments.items():
+                if defaults.parameters[name].kind == Parameter.VAR_KEYWORD:
+                    arguments.update(value)
+                else:
+                    arguments[name] = value
+
+        params = {}
+        for k, v in arguments.items():
+            if isinstance(v, pd.Series):
+                fingerprints[k] = fingerprint(v)
+            else:
+                params[k] = v
+        if len(fingerprints) == 0: return None
+        return ResultCache.key(kind, fingerprints, params)
+
     def _check_na_columns(self, stdout: bool = True):
         """Returns the columns in which all it's values are na."""
         return [x for x in self._df.columns if all(self._df[x].isna())]
@@ -436,9 +594,13 @@ class AnalysisIndicators(BasePandasObject):
             return df[self.adjusted] if self.adjusted is not None else None
         # Ok.  So it's a str.
         elif isinstance(series, str):
+            # A chained indicator of strategy() needs a batched column
+            if self._batch and series in self._batch:
+                self._flush()
             # Return the df column since it's in there.
             if series in df.columns:
-                return df[series]
+                plan = active_plan()
+                return df[series] if plan is None else plan.column(df, series)
             else:
                 # Attempt to match the 'series' because it was likely
                 # misspelled.
@@ -449,18 +611,39 @@ class AnalysisIndicators(BasePandasObject):
                 NOT_FOUND = f"[X] Ooops!!!: It's {series not in df.columns}, the series '{series}' was not found in {cols}"
                 return df.iloc[:, match[0]] if len(match) else print(NOT_FOUND)
 
+    def _chained(self, kwargs: dict) -> bool:
+        """Whether the kwargs of a strategy() task select a source column
+        that is not in the DataFrame yet, like one made by an earlier task."""
+        return any(
+            isinstance(kwargs.get(source), str) and kwargs[source] not in self._df.columns
+            for source in ["open", "high", "low", "close", "volume"]
+        )
+
     def _indicators_by_category(self, name: str) -> list:
         """Returns indicators by Categorical name."""
         return Category[name] if name in self.categories else None
 
     def _mp_worker(self, arguments: tuple):
         """Multiprocessing Worker to handle different Methods."""
-        method, args, kwargs = arguments
+        method, args, kwargs, token = arguments
 
-        if method != "ichimoku":
-            return getattr(self, method)(*args, **kwargs)
-        else:
-            return getattr(self, method)(*args, **kwargs)[0]
+        # A plan per task, so that its results do not outlive the task
+        plan = nullcontext() if token is None else StrategyPlan(self._df.columns, token)
+        try:
+            with plan:
+                if method != "ichimoku":
+                    return getattr(self, method)(*args, **kwargs)
+                else:
+                    return getattr(self, method)(*args, **kwargs)[0]
+        finally:
+            if token is not None: plan.close()
+
+    def _thread_worker(self, plan, arguments: tuple):
+        """Threads Worker: runs a task of strategy(executor="threads") under
+        the plan of its run, which is passed explicitly since a plan is
+        only active in the thread that entered it."""
+        with plan:
+            return self._mp_worker(arguments)
 
     def _post_process(self, result, **kwargs) -> Tuple[pd.Series, pd.DataFrame]:
         """Applies any additional modifications to the DataFrame
@@ -611,18 +794,38 @@ class AnalysisIndicators(BasePandasObject):
         Future implementations will allow more specific indicator generation
         with possibly as json, yaml config file or an sqlite3 table.
 
+        When multiprocessing, it uses the WorkerPool set with ta.set_executor(),
+        if any, instead of starting a new Pool. See: help(ta.WorkerPool).
 
         Kwargs:
+            batch (bool): Collect the columns of all the results and append
+                them at once in one consolidated block instead of one column
+                at a time. Default: True
             chunksize (bool): Adjust the chunksize for the Multiprocessing Pool.
                 Default: Number of cores of the OS
+            executor (str): "processes" or "threads". With "threads", the
+                indicators of ta.ThreadSafe run in a ThreadPoolExecutor of
+                df.ta.cores threads, without pickling, while the others run
+                in the calling thread. Indicators whose sources are columns
+                made by the strategy, like an ema of "CUMLOGRET_1", run
+                after them in the calling thread. Default: "processes"
             exclude (list): List of indicator names to exclude. Some are
                 excluded by default for various reasons; they require additional
-                sources, performance (td_seq), not a ohlcv chart (vp) etc.
+                sources, not a ohlcv chart (vp) etc.
             name (str): Select all indicators or indicators by
                 Category such as: "candles", "cycles", "momentum", "overlap",
                 "performance", "statistics", "trend", "volatility", "volume", or
                 "all". Default: "all"
             ordered (bool): Whether to run "all" in order. Default: True
+            shared_memory (bool): When multiprocessing, publish the numeric
+                columns once in shared memory for the workers instead of
+                pickling the DataFrame with every task. The results are
+                returned as arrays. Default: False
+            plan (bool): Share intermediate computations, like the ema, rsi
+                and atr, between the indicators. Their results are kept
+                until the run ends. With multiprocessing, they are only
+                shared within each indicator. See: help(ta.StrategyPlan).
+                Default: False
             timed (bool): Show the process time of the strategy().
                 Default: False
             verbose (bool): Provide some additional insight on the progress of
@@ -633,6 +836,10 @@ class AnalysisIndicators(BasePandasObject):
         kwargs["append"] = True
         all_ordered = kwargs.pop("ordered", True)
         mp_chunksize = kwargs.pop("chunksize", self.cores)
+        use_plan = kwargs.pop("plan", False)
+        use_shared_memory = kwargs.pop("shared_memory", False)
+        use_executor = kwargs.pop("executor", "processes")
+        use_batch = kwargs.pop("batch", True)
 
         # Initialize
         initial_column_count = len(self._df.columns)
@@ -646,7 +853,6 @@ class AnalysisIndicators(BasePandasObject):
             # "data", # reserved
             "long_run",
             "short_run",
-            "td_seq", # Performance exclusion
             "tsignals",
             "vp",
         ]
@@ -691,13 +897,15 @@ class AnalysisIndicators(BasePandasObject):
 
         timed = kwargs.pop("timed", False)
         results = []
-        use_multiprocessing = True if self.cores > 0 else False
+        use_threads = isinstance(use_executor, str) and use_executor.lower() == "threads"
+        use_multiprocessing = True if self.cores > 0 and not use_threads else False
+        token = uuid4().hex if use_plan else None
         has_col_names = False
 
         if timed:
             stime = perf_counter()
 
-        if use_multiprocessing and mode["custom"]:
+        if (use_multiprocessing or use_threads) and mode["custom"]:
             # Determine if the Custom Model has 'col_names' parameter
             has_col_names = (True if len([
                 True for x in ta
@@ -705,81 +913,155 @@ class AnalysisIndicators(BasePandasObject):
             ]) else False)
 
             if has_col_names:
-                use_multiprocessing = False
+                use_multiprocessing = use_threads = False
 
         if Imports["tqdm"]:
             # from tqdm import tqdm
             from tqdm import tqdm
 
-        if use_multiprocessing:
-            _total_ta = len(ta)
-            pool = Pool(self.cores)
-            # Some magic to optimize chunksize for speed based on total ta indicators
-            _chunksize = mp_chunksize - 1 if mp_chunksize > _total_ta else int(npLog10(_total_ta)) + 1
-            if verbose:
-                print(f"[i] Multiprocessing {_total_ta} indicators with {_chunksize} chunks and {self.cores}/{cpu_count()} cpus.")
-
-            results = None
-            if mode["custom"]:
-                # Create a list of all the custom indicators into a list
-                custom_ta = [(
-                    ind["kind"],
-                    ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else (),
-                    {**ind, **kwargs},
-                ) for ind in ta]
-                # Custom multiprocessing pool. Must be ordered for Chained Strategies
-                # May fix this to cpus if Chaining/Composition if it remains
-                results = pool.imap(self._mp_worker, custom_ta, _chunksize)
-            else:
-                default_ta = [(ind, tuple(), kwargs) for ind in ta]
-                # All and Categorical multiprocessing pool.
-                if all_ordered:
-                    if Imports["tqdm"]:
-                        results = tqdm(pool.imap(self._mp_worker, default_ta, _chunksize)) # Order over Speed
-                    else:
-                        results = pool.imap(self._mp_worker, default_ta, _chunksize) # Order over Speed
-                else:
-                    if Imports["tqdm"]:
-                        results = tqdm(pool.imap_unordered(self._mp_worker, default_ta, _chunksize)) # Speed over Order
-                    else:
-                        results = pool.imap_unordered(self._mp_worker, default_ta, _chunksize) # Speed over Order
-            if results is None:
-                print(f"[X] ta.strategy('{name}') has no results.")
-                return
-
-            pool.close()
-            pool.join()
-            self._last_run = get_time(self.exchange, to_string=True)
-
-        else:
-            # Without multiprocessing:
-            if verbose:
-                if has_col_names:
-                    print(f"[i] No mulitproccessing support for 'col_names' option.")
+        # Batch the appended columns and insert them at once
+        self._batch = {} if use_batch else None
+        try:
+            if use_threads:
+                if mode["custom"]:
+                    tasks = [(
+                        ind["kind"],
+                        ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else (),
+                        {**ind, **kwargs, "append": False},
+                        None,
+                    ) for ind in ta]
                 else:
-                    print(f"[i] No mulitproccessing (cores = 0).")
-
-            if mode["custom"]:
-                if Imports["tqdm"] and verbose:
-                    pbar = tqdm(ta, f"[i] Progress")
-                    for ind in pbar:
-                        params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
-                        getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
+                    tasks = [(ind, tuple(), {**kwargs, "append": False}, None) for ind in ta]
+                # Tasks reading columns made by the strategy wait for them
+                chained = [i for i, task in enumerate(tasks) if self._chained(task[2])]
+                threaded = [i for i, task in enumerate(tasks) if task[0] in ThreadSafe and i not in chained]
+                _threads = self.cores if self.cores > 0 else cpu_count()
+                if verbose:
+                    print(f"[i] Threading {len(threaded)}/{len(tasks)} indicators with {_threads} threads.")
+
+                # One plan shared by the threads of this run. The GIL bound
+                # indicators run in this thread meanwhile.
+                plan = StrategyPlan(self._df.columns, token) if use_plan else nullcontext()
+                results = [None] * len(tasks)
+                with plan, ThreadPoolExecutor(max_workers=_threads) as pool:
+                    futures = {i: pool.submit(self._thread_worker, plan, tasks[i]) for i in threaded}
+                    for i, task in enumerate(tasks):
+                        if i not in futures and i not in chained:
+                            results[i] = self._mp_worker(task)
+                    for i, future in futures.items():
+                        results[i] = future.result()
+
+                    # Appended in order, so that the chained tasks find
+                    # the columns of the earlier ones
+                    for i, (method, args, task_kwargs, _) in enumerate(tasks):
+                        if i in chained:
+                            self._mp_worker((method, args, {**task_kwargs, "append": True}, None))
+                        else:
+                            self._post_process(results[i], **kwargs)
+                    results = []
+                if use_plan:
+                    if verbose: print(f"[i] Shared computations: {plan}")
+                    plan.close()
+                self._last_run = get_time(self.exchange, to_string=True)
+
+            elif use_multiprocessing:
+                _total_ta = len(ta)
+                executor = get_executor()
+                if use_shared_memory:
+                    # Publish the DataFrame once instead of pickling it per task.
+                    # Before forking, so the workers share its resource tracker.
+                    frame = SharedFrame(self._df)
+                    worker = partial(_shm_worker, frame.spec)
                 else:
-                    for ind in ta:
-                        params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
-                        getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
-            else:
-                if Imports["tqdm"] and verbose:
-                    pbar = tqdm(ta, f"[i] Progress")
-                    for ind in pbar:
-                        getattr(self, ind)(*tuple(), **kwargs)
+                    worker = self._mp_worker
+                pool = Pool(self.cores) if executor is None else executor.pool
+                _cores = self.cores if executor is None else executor.cores
+                # Some magic to optimize chunksize for speed based on total ta indicators
+                _chunksize = mp_chunksize - 1 if mp_chunksize > _total_ta else int(npLog10(_total_ta)) + 1
+                if verbose:
+                    _pool = "WorkerPool" if executor is not None else "Pool"
+                    print(f"[i] Multiprocessing {_total_ta} indicators with {_chunksize} chunks and {_cores}/{cpu_count()} cpus ({_pool}).")
+
+                results = None
+                if mode["custom"]:
+                    # Create a list of all the custom indicators into a list
+                    custom_ta = [(
+                        ind["kind"],
+                        ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else (),
+                        {**ind, **kwargs},
+                        token,
+                    ) for ind in ta]
+                    # Custom multiprocessing pool. Must be ordered for Chained Strategies
+                    # May fix this to cpus if Chaining/Composition if it remains
+                    results = pool.imap(worker, custom_ta, _chunksize)
                 else:
-                    for ind in ta:
-                        getattr(self, ind)(*tuple(), **kwargs)
+                    default_ta = [(ind, tuple(), kwargs, token) for ind in ta]
+                    # All and Categorical multiprocessing pool.
+                    if all_ordered:
+                        if Imports["tqdm"]:
+                            results = tqdm(pool.imap(worker, default_ta, _chunksize)) # Order over Speed
+                        else:
+                            results = pool.imap(worker, default_ta, _chunksize) # Order over Speed
+                    else:
+                        if Imports["tqdm"]:
+                            results = tqdm(pool.imap_unordered(worker, default_ta, _chunksize)) # Speed over Order
+                        else:
+                            results = pool.imap_unordered(worker, default_ta, _chunksize) # Speed over Order
+                if results is None:
+                    print(f"[X] ta.strategy('{name}') has no results.")
+                    if use_shared_memory: frame.close()
+                    return
+
+                try:
+                    # Collect the results while the WorkerPool is still running
+                    results = list(results)
+                finally:
+                    if executor is None:
+                        pool.close()
+                        pool.join()
+                    if use_shared_memory:
+                        frame.close()
+                if use_shared_memory:
+                    results = [unpack_result(r, self._df.index) for r in results]
+                self._last_run = get_time(self.exchange, to_string=True)
 
-        # Apply prefixes/suffixes and appends indicator results to the  DataFrame
-        [self._post_process(r, **kwargs) for r in results]
+            else:
+                # Without multiprocessing:
+                if verbose:
+                    if has_col_names:
+                        print(f"[i] No mulitproccessing support for 'col_names' option.")
+                    else:
+                        print(f"[i] No mulitproccessing (cores = 0).")
+
+                plan = StrategyPlan(self._df.columns, token) if use_plan else nullcontext()
+                with plan:
+                    if mode["custom"]:
+                        if Imports["tqdm"] and verbose:
+                            pbar = tqdm(ta, f"[i] Progress")
+                            for ind in pbar:
+                                params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
+                                getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
+                        else:
+                            for ind in ta:
+                                params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
+                                getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
+                    else:
+                        if Imports["tqdm"] and verbose:
+                            pbar = tqdm(ta, f"[i] Progress")
+                            for ind in pbar:
+                                getattr(self, ind)(*tuple(), **kwargs)
+                        else:
+                            for ind in ta:
+                                getattr(self, ind)(*tuple(), **kwargs)
+                if use_plan:
+                    if verbose: print(f"[i] Shared computations: {plan}")
+                    plan.close()
+
+            # Apply prefixes/suffixes and appends indicator results to the  DataFrame
+            [self._post_process(r, **kwargs) for r in results]
+        finally:
+            self._flush()
+            self._batch = None
 
         if verbose:
             print(f"[i] Total indicators: {len(ta)}")
@@ -1695,3 +1977,40 @@ class AnalysisIndicators(BasePandasObject):
         volume = self._get_column(kwargs.pop("volume", "volume"))
         result = vp(close=close, volume=volume, width=width, percent=percent, **kwargs)
         return self._post_process(result, **kwargs)
+
+
+# Result Cache
+_SOURCES = ("open_", "high", "low", "close", "volume")
+_UNCACHED = ("append", "timed", "verbose")
+
+
+def _cached(method):
+    """Routes an indicator method of the DataFrame Extension through the
+    ResultCache set with ta.set_cache(), if any."""
+    kind = method.__name__
+    fn = globals().get(kind)
+    sources = [p.rstrip("_") for p in signature(fn).parameters if p in _SOURCES] if callable(fn) else []
+    parameters = signature(method)
+    defaults = signature(fn) if callable(fn) else None
+
+    @wraps(method)
+    def _method(self, *args, **kwargs):
+        cache = get_cache()
+        key = None if cache is None else self._cache_key(kind, sources, parameters, args, kwargs, defaults)
+        if key is None:
+            return method(self, *args, **kwargs)
+
+        result = cache.get(key)
+        if result is None:
+            result = method(self, *args, **kwargs)
+            if result is not self._df:  # Not an indicator result
+                cache.put(key, result)
+        else:
+            self._append(result=result, **kwargs)
+        return result
+
+    return _method
+
+
+for _kind in sorted(set(sum(Category.values(), [])) | {"vp"}):
+    setattr(AnalysisIndicators, _kind, _cached(getattr(AnalysisIndicators, _kind)))
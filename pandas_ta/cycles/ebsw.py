@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
+from numpy import concatenate as npConcatenate
 from numpy import cos as npCos
+from numpy import diff as npDiff
 from numpy import exp as npExp
+from numpy import full as npFull
 from numpy import NaN as npNaN
 from numpy import pi as npPi
 from numpy import sin as npSin
 from numpy import sqrt as npSqrt
+from numpy import zeros as npZeros
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_engine, get_offset, iir_filter, verify_series
+
+
+def _lag(x, n: int):
+    """Shifts x forward n bars, zero filling the first n."""
+    return npConcatenate((npZeros(n), x))[:x.size]
 
 
 def ebsw(close, length=None, bars=None, offset=None, **kwargs):
@@ -16,47 +25,39 @@ def ebsw(close, length=None, bars=None, offset=None, **kwargs):
     bars = int(bars) if bars and bars > 0 else 10
     close = verify_series(close, length)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     if close is None: return
 
-    # variables
-    alpha1 = HP = 0 # alpha and HighPass
-    a1 = b1 = c1 = c2 = c3 = 0
-    Filt = Pwr = Wave = 0
-
-    lastClose = lastHP = 0
-    FilterHist = [0, 0]   # Filter history
-
     # Calculate Result
     m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        # HighPass filter cyclic components whose periods are shorter than Duration input
-        alpha1 = (1 - npSin(360 / length)) / npCos(360 / length)
-        HP = 0.5 * (1 + alpha1) * (close[i] - lastClose) + alpha1 * lastHP
-
-        # Smooth with a Super Smoother Filter from equation 3-3
-        a1 = npExp(-npSqrt(2) * npPi / bars)
-        b1 = 2 * a1 * npCos(npSqrt(2) * 180 / bars)
-        c2 = b1
-        c3 = -1 * a1 * a1
-        c1 = 1 - c2 - c3
-        Filt = c1 * (HP + lastHP) / 2 + c2 * FilterHist[1] + c3 * FilterHist[0]
-        # Filt = float("{:.8f}".format(float(Filt))) # to fix for small scientific notations, the big ones fail
-
-        # 3 Bar average of Wave amplitude and power
-        Wave = (Filt + FilterHist[1] + FilterHist[0]) / 3
-        Pwr = (Filt * Filt + FilterHist[1] * FilterHist[1] + FilterHist[0] * FilterHist[0]) / 3
-
-        # Normalize the Average Wave to Square Root of the Average Power
-        Wave = Wave / npSqrt(Pwr)
-
-        # update storage, result
-        FilterHist.append(Filt)  # append new Filt value
-        FilterHist.pop(0)  # remove first element of list (left) -> updating/trim
-        lastHP = HP
-        lastClose = close[i]
-        result.append(Wave)
+    x = close.to_numpy(dtype=float)[length:]
+
+    # HighPass filter cyclic components whose periods are shorter than Duration input
+    alpha1 = (1 - npSin(360 / length)) / npCos(360 / length)
+    # HP[i] = 0.5 * (1 + alpha1) * (close[i] - close[i - 1]) + alpha1 * HP[i - 1]
+    HP = iir_filter([0.5 * (1 + alpha1)], [1, -alpha1], npDiff(x, prepend=0), engine=engine)
+
+    # Smooth with a Super Smoother Filter from equation 3-3
+    a1 = npExp(-npSqrt(2) * npPi / bars)
+    b1 = 2 * a1 * npCos(npSqrt(2) * 180 / bars)
+    c2 = b1
+    c3 = -1 * a1 * a1
+    c1 = 1 - c2 - c3
+    # Filt[i] = c1 * (HP[i] + HP[i - 1]) / 2 + c2 * Filt[i - 1] + c3 * Filt[i - 2]
+    Filt = iir_filter([c1 / 2], [1, -c2, -c3], HP + _lag(HP, 1), engine=engine)
+
+    # 3 Bar average of Wave amplitude and power
+    Filt1, Filt2 = _lag(Filt, 1), _lag(Filt, 2)
+    Wave = (Filt + Filt1 + Filt2) / 3
+    Pwr = (Filt * Filt + Filt1 * Filt1 + Filt2 * Filt2) / 3
+
+    # Normalize the Average Wave to Square Root of the Average Power
+    Wave = Wave / npSqrt(Pwr)
+
+    result = npFull(m, npNaN)
+    result[length - 1] = 0
+    result[length:] = Wave
 
     ebsw = Series(result, index=close.index)
 
@@ -109,6 +110,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.Series: New feature generated.
@@ -13,13 +13,14 @@ def cci(high, low, close, length=None, c=None, offset=None, **kwargs):
     low = verify_series(low, length)
     close = verify_series(close, length)
     offset = get_offset(offset)
+    chunk_size = kwargs.pop("chunk_size", None)
 
     if high is None or low is None or close is None: return
 
     # Calculate Result
     typical_price = hlc3(high=high, low=low, close=close)
     mean_typical_price = sma(typical_price, length=length)
-    mad_typical_price = mad(typical_price, length=length)
+    mad_typical_price = mad(typical_price, length=length, chunk_size=chunk_size)
 
     cci = typical_price - mean_typical_price
     cci /= c * mad_typical_price
@@ -71,6 +72,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    chunk_size (int, optional): Number of windows per batch of the rolling
+        MAD. Default: 16384
 
 Returns:
     pd.Series: New feature generated.
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series, weights
+from pandas import Series
+from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import weighted_window, window_weights
 
 
 def cg(close, length=None, offset=None, **kwargs):
@@ -12,8 +14,9 @@ def cg(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    coefficients = [length - i for i in range(0, length)]
-    numerator = -close.rolling(length).apply(weights(coefficients), raw=True)
+    coefficients = window_weights("linear", length)[::-1]
+    numerator = -weighted_window(close.to_numpy(dtype=float), coefficients)
+    numerator = Series(numerator, index=close.index)
     cg = numerator / close.rolling(length).sum()
 
     # Offset
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame, concat
 from pandas_ta.overlap import rma
-from pandas_ta.utils import get_drift, get_offset, verify_series, signals
+from pandas_ta.utils import get_drift, get_offset, shared, signals, verify_series
 
 
+@shared
 def rsi(close, length=None, scalar=None, drift=None, offset=None, **kwargs):
     """Indicator: Relative Strength Index (RSI)"""
     # Validate arguments
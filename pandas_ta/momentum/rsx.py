@@ -1,30 +1,25 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import NaN as npNaN
 from pandas import concat, DataFrame, Series
-from pandas_ta.utils import get_drift, get_offset, verify_series, signals
+from pandas_ta.utils import get_drift, get_engine, get_offset, kernel
+from pandas_ta.utils import verify_series, signals
 
 
-def rsx(close, length=None, drift=None, offset=None, **kwargs):
-    """Indicator: Relative Strength Xtra (inspired by Jurik RSX)"""
-    # Validate arguments
-    length = int(length) if length and length > 0 else 14
-    close = verify_series(close, length)
-    drift = get_drift(drift)
-    offset = get_offset(offset)
-
-    if close is None: return
-
+@kernel
+def _rsx(x, length):
+    """RSX state machine over a float64 array."""
     # variables
-    vC, v1C = 0, 0
-    v4, v8, v10, v14, v18, v20 = 0, 0, 0, 0, 0, 0
+    vC, v1C = 0.0, 0.0
+    v4, v8, v10, v14, v18, v20 = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
 
-    f0, f8, f10, f18, f20, f28, f30, f38 = 0, 0, 0, 0, 0, 0, 0, 0
-    f40, f48, f50, f58, f60, f68, f70, f78 = 0, 0, 0, 0, 0, 0, 0, 0
-    f80, f88, f90 = 0, 0, 0
+    f0, f8, f10, f18, f20, f28, f30, f38 = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    f40, f48, f50, f58, f60, f68, f70, f78 = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    f80, f88, f90 = 0.0, 0.0, 0.0
 
-    # Calculate Result
-    m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
+    m = x.size
+    result = npFull(m, npNaN)
+    result[length - 1] = 0
     for i in range(length, m):
         if f90 == 0:
             f90 = 1.0
@@ -33,7 +28,7 @@ def rsx(close, length=None, drift=None, offset=None, **kwargs):
                 f88 = length - 1.0
             else:
                 f88 = 5.0
-            f8 = 100.0 * close.iloc[i]
+            f8 = 100.0 * x[i]
             f18 = 3.0 / (length + 2.0)
             f20 = 1.0 - f18
         else:
@@ -42,7 +37,7 @@ def rsx(close, length=None, drift=None, offset=None, **kwargs):
             else:
                 f90 = f90 + 1
             f10 = f8
-            f8 = 100 * close.iloc[i]
+            f8 = 100 * x[i]
             v8 = f8 - f10
             f28 = f20 * f28 + f18 * v8
             f30 = f18 * f28 + f20 * f30
@@ -76,7 +71,23 @@ def rsx(close, length=None, drift=None, offset=None, **kwargs):
                 v4 = 0.0
         else:
             v4 = 50.0
-        result.append(v4)
+        result[i] = v4
+    return result
+
+
+def rsx(close, length=None, drift=None, offset=None, **kwargs):
+    """Indicator: Relative Strength Xtra (inspired by Jurik RSX)"""
+    # Validate arguments
+    length = int(length) if length and length > 0 else 14
+    close = verify_series(close, length)
+    drift = get_drift(drift)
+    offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
+
+    if close is None: return
+
+    # Calculate Result
+    result = _rsx(close.to_numpy(dtype=float), length, engine=engine)
     rsx = Series(result, index=close.index)
 
     # Offset
@@ -143,6 +154,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.Series: New feature generated.
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
-# import numpy as np
-from numpy import where as npWhere
+from numpy import minimum as npMinimum
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, run_length, verify_series
 
 
 def td_seq(close, asint=None, offset=None, **kwargs):
@@ -13,21 +12,11 @@ def td_seq(close, asint=None, offset=None, **kwargs):
     asint = asint if isinstance(asint, bool) else False
     show_all = kwargs.setdefault("show_all", True)
 
-    def true_sequence_count(series: Series):
-        index = series.where(series == False).last_valid_index()
-
-        if index is None:
-            return series.count()
-        else:
-            s = series[series.index > index]
-            return s.count()
-
     def calc_td(series: Series, direction: str, show_all: bool):
         td_bool = series.diff(4) > 0 if direction=="up" else series.diff(4) < 0
-        td_num = npWhere(
-            td_bool, td_bool.rolling(13, min_periods=0).apply(true_sequence_count), 0
-        )
-        td_num = Series(td_num)
+        # Consecutive bars of the sequence, up to 13
+        td_num = npMinimum(run_length(td_bool.to_numpy()), 13)
+        td_num = Series(td_num, index=series.index, dtype=float)
 
         if show_all:
             td_num = td_num.mask(td_num == 0)
@@ -87,6 +76,11 @@ Calculation:
     consecutive ascending or descending price sequence, display 6th to 9th day
     value.
 
+    up = close.diff(4) > 0
+    TD_SEQ_UP = min(run_length(up), 13)  # Consecutive up bars, 0 masked
+    down = close.diff(4) < 0
+    TD_SEQ_DN = min(run_length(down), 13)
+
 Args:
     close (pd.Series): Series of 'close's
     asint (bool): If True, fillnas with 0 and change type to int. Default: False
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from numpy import NaN as npNaN
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, shared, verify_series
 
 
+@shared
 def ema(close, length=None, offset=None, **kwargs):
     """Indicator: Exponential Moving Average (EMA)"""
     # Validate Arguments
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import fibonacci, get_offset, verify_series, weights
+from pandas import Series
+from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import weighted_window, window_weights
 
 
 def fwma(close, length=None, asc=None, offset=None, **kwargs):
@@ -13,8 +15,9 @@ def fwma(close, length=None, asc=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    fibs = fibonacci(n=length, weighted=True)
-    fwma = close.rolling(length, min_periods=length).apply(weights(fibs), raw=True)
+    fibs = window_weights("fibonacci", length)
+    fwma = weighted_window(close.to_numpy(dtype=float), fibs)
+    fwma = Series(fwma, index=close.index)
 
     # Offset
     if offset != 0:
@@ -1,8 +1,30 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import NaN as npNaN
-from pandas import DataFrame, Series
+from pandas import DataFrame
 from .ma import ma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_engine, get_offset, kernel, verify_series
+
+
+@kernel
+def _hilo(high_ma, low_ma, close):
+    """HiLo activator over float64 arrays. Returns hilo, long and short
+    arrays."""
+    m = close.size
+    hilo = npFull(m, npNaN)
+    long = npFull(m, npNaN)
+    short = npFull(m, npNaN)
+
+    for i in range(1, m):
+        if close[i] > high_ma[i - 1]:
+            hilo[i] = long[i] = low_ma[i]
+        elif close[i] < low_ma[i - 1]:
+            hilo[i] = short[i] = high_ma[i]
+        else:
+            hilo[i] = hilo[i - 1]
+            long[i] = short[i] = hilo[i - 1]
+
+    return hilo, long, short
 
 
 def hilo(high, low, close, high_length=None, low_length=None, mamode=None, offset=None, **kwargs):
@@ -16,47 +38,33 @@ def hilo(high, low, close, high_length=None, low_length=None, mamode=None, offse
     low = verify_series(low, _length)
     close = verify_series(close, _length)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     if high is None or low is None or close is None: return
 
     # Calculate Result
-    m = close.size
-    hilo = Series(npNaN, index=close.index)
-    long = Series(npNaN, index=close.index)
-    short = Series(npNaN, index=close.index)
-
     high_ma = ma(mamode, high, length=high_length)
     low_ma = ma(mamode, low, length=low_length)
 
-    for i in range(1, m):
-        if close.iloc[i] > high_ma.iloc[i - 1]:
-            hilo.iloc[i] = long.iloc[i] = low_ma.iloc[i]
-        elif close.iloc[i] < low_ma.iloc[i - 1]:
-            hilo.iloc[i] = short.iloc[i] = high_ma.iloc[i]
-        else:
-            hilo.iloc[i] = hilo.iloc[i - 1]
-            long.iloc[i] = short.iloc[i] = hilo.iloc[i - 1]
+    hilo, long, short = _hilo(
+        high_ma.to_numpy(dtype=float), low_ma.to_numpy(dtype=float),
+        close.to_numpy(dtype=float), engine=engine
+    )
+
+    # Name & Category
+    _props = f"_{high_length}_{low_length}"
+    data = {f"HILO{_props}": hilo, f"HILOl{_props}": long, f"HILOs{_props}": short}
+    df = DataFrame(data, index=close.index)
 
     # Offset
     if offset != 0:
-        hilo = hilo.shift(offset)
-        long = long.shift(offset)
-        short = short.shift(offset)
+        df = df.shift(offset)
 
     # Handle fills
     if "fillna" in kwargs:
-        hilo.fillna(kwargs["fillna"], inplace=True)
-        long.fillna(kwargs["fillna"], inplace=True)
-        short.fillna(kwargs["fillna"], inplace=True)
+        df.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        hilo.fillna(method=kwargs["fill_method"], inplace=True)
-        long.fillna(method=kwargs["fill_method"], inplace=True)
-        short.fillna(method=kwargs["fill_method"], inplace=True)
-
-    # Name & Category
-    _props = f"_{high_length}_{low_length}"
-    data = {f"HILO{_props}": hilo, f"HILOl{_props}": long, f"HILOs{_props}": short}
-    df = DataFrame(data, index=close.index)
+        df.fillna(method=kwargs["fill_method"], inplace=True)
 
     df.name = f"HILO{_props}"
     df.category = "overlap"
@@ -123,6 +131,8 @@ Kwargs:
     presma (bool, optional): If True, uses SMA for initial value.
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.DataFrame: HILO (line), HILOl (long), HILOs (short) columns.
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, shared, verify_series
 
 
+@shared
 def hlc3(high, low, close, offset=None, **kwargs):
     """Indicator: HLC3"""
     # Validate Arguments
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_engine, get_offset, holt_winters, verify_series
 
 
 def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
@@ -11,20 +11,10 @@ def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
     nc = float(nc) if nc and nc > 0 and nc < 1 else 0.1
     close = verify_series(close)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     # Calculate Result
-    last_a = last_v = 0
-    last_f = close.iloc[0]
-
-    result = []
-    m = close.size
-    for i in range(m):
-        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close.iloc[i]
-        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
-        A = (1.0 - nc) * last_a + nc * (V - last_v)
-        result.append((F + V + 0.5 * A))
-        last_a, last_f, last_v = A, F, V # update values
-
+    result = holt_winters(close.to_numpy(dtype=float), na, nb, nc, engine=engine)
     hwma = Series(result, index=close.index)
 
     # Offset
@@ -76,6 +66,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.Series: hwma
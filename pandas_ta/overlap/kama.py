@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-from numpy import NaN as npNaN
 from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import get_drift, get_engine, get_offset, linear_recurrence
+from pandas_ta.utils import non_zero_range, verify_series
 
 
 def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kwargs):
@@ -13,6 +13,7 @@ def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kw
     close = verify_series(close, max(fast, slow, length))
     drift = get_drift(drift)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     if close is None: return
 
@@ -30,11 +31,10 @@ def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kw
     x = er * (fr - sr) + sr
     sc = x * x
 
-    m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        result.append(sc.iloc[i] * close.iloc[i] + (1 - sc.iloc[i]) * result[i - 1])
-
+    result = linear_recurrence(
+        sc.to_numpy(dtype=float), close.to_numpy(dtype=float),
+        y0=0, start=length, engine=engine
+    )
     kama = Series(result, index=close.index)
 
     # Offset
@@ -82,6 +82,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.Series: New feature generated.
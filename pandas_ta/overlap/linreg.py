@@ -1,11 +1,36 @@
 # -*- coding: utf-8 -*-
-from numpy import array as npArray
 from numpy import arctan as npAtan
+from numpy import full as npFull
 from numpy import NaN as npNaN
 from numpy import pi as npPi
-from numpy.lib.stride_tricks import sliding_window_view
-from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from numpy import sqrt as npSqrt
+from pandas import DataFrame, Series
+from pandas_ta.utils import get_engine, get_offset, kernel, verify_series
+
+
+@kernel
+def _linreg_moments(y, length):
+    """Rolling sums of y, x * y and y * y with x = [1, 2, ..., length].
+    Each window is updated from the previous one in O(1). The sums are
+    recomputed from scratch every length bars, and after a window with a
+    NaN, so rounding errors of the updates can not accumulate."""
+    m = y.size
+    y_sum, xy_sum, y2_sum = npFull(m, npNaN), npFull(m, npNaN), npFull(m, npNaN)
+    sy = sxy = sy2 = npNaN
+    for i in range(length - 1, m):
+        if sy == sy and (i + 1) % length != 0:
+            sxy += length * y[i] - sy
+            sy += y[i] - y[i - length]
+            sy2 += y[i] * y[i] - y[i - length] * y[i - length]
+        else:
+            sy = sxy = sy2 = 0.0
+            for k in range(length):
+                v = y[i - length + 1 + k]
+                sy += v
+                sxy += (k + 1) * v
+                sy2 += v * v
+        y_sum[i], xy_sum[i], y2_sum[i] = sy, sxy, sy2
+    return y_sum, xy_sum, y2_sum
 
 
 def linreg(close, length=None, offset=None, **kwargs):
@@ -20,42 +45,46 @@ def linreg(close, length=None, offset=None, **kwargs):
     r = kwargs.pop("r", False)
     slope = kwargs.pop("slope", False)
     tsf = kwargs.pop("tsf", False)
+    variants = kwargs.pop("variants", False)
+    engine = get_engine(kwargs.pop("engine", None))
 
     if close is None: return
 
     # Calculate Result
-    x = range(1, length + 1)  # [1, 2, ..., n] from 1 to n keeps Sum(xy) low
-    x_sum = 0.5 * length * (length + 1)
+    x_sum = 0.5 * length * (length + 1)  # x = [1, 2, ..., n] keeps Sum(xy) low
     x2_sum = x_sum * (2 * length + 1) / 3
     divisor = length * x2_sum - x_sum * x_sum
 
-    def linear_regression(series):
-        y_sum = series.sum()
-        xy_sum = (x * series).sum()
-
-        m = (length * xy_sum - x_sum * y_sum) / divisor
-        if slope:
-            return m
-        b = (y_sum * x2_sum - x_sum * xy_sum) / divisor
-        if intercept:
-            return b
-
-        if angle:
-            theta = npAtan(m)
-            if degrees:
-                theta *= 180 / npPi
-            return theta
-
-        if r:
-            y2_sum = (series * series).sum()
-            rn = length * xy_sum - x_sum * y_sum
-            rd = (divisor * (length * y2_sum - y_sum * y_sum)) ** 0.5
-            return rn / rd
-
-        return m * length + b if tsf else m * (length - 1) + b
-
-    linreg_ = [linear_regression(_) for _ in sliding_window_view(npArray(close), length)]
-    linreg = Series([npNaN] * (length - 1) + linreg_, index=close.index)
+    y_sum, xy_sum, y2_sum = _linreg_moments(close.to_numpy(dtype=float), length, engine=engine)
+
+    m = (length * xy_sum - x_sum * y_sum) / divisor
+    b = (y_sum * x2_sum - x_sum * xy_sum) / divisor
+    theta = npAtan(m)
+    if degrees:
+        theta *= 180 / npPi
+
+    rn = length * xy_sum - x_sum * y_sum
+    rd = npSqrt(divisor * (length * y2_sum - y_sum * y_sum))
+
+    if variants:
+        _props = f"_{length}"
+        linreg = DataFrame({
+            f"LR{_props}": m * (length - 1) + b,
+            f"LRm{_props}": m,
+            f"LRb{_props}": b,
+            f"LRa{_props}": theta,
+            f"LRr{_props}": rn / rd,
+            f"TSF{_props}": m * length + b,
+        }, index=close.index)
+    elif slope: linreg = m
+    elif intercept: linreg = b
+    elif angle: linreg = theta
+    elif r: linreg = rn / rd
+    else:
+        linreg = m * length + b if tsf else m * (length - 1) + b
+
+    if not variants:
+        linreg = Series(linreg, index=close.index)
 
     # Offset
     if offset != 0:
@@ -68,6 +97,11 @@ def linreg(close, length=None, offset=None, **kwargs):
         linreg.fillna(method=kwargs["fill_method"], inplace=True)
 
     # Name and Categorize it
+    if variants:
+        linreg.name = f"LR_{length}"
+        linreg.category = "overlap"
+        return linreg
+
     linreg.name = f"LR"
     if slope: linreg.name += "m"
     if intercept: linreg.name += "b"
@@ -97,16 +131,14 @@ Calculation:
     x2_sum = length * (length + 1) * (2 * length + 1) / 6
     divisor = length * x2_sum - x_sum * x_sum
 
-    lr(series):
-        y_sum = series.sum()
-        y2_sum = (series* series).sum()
-        xy_sum = (x * series).sum()
-
-        m = (length * xy_sum - x_sum * y_sum) / divisor
-        b = (y_sum * x2_sum - x_sum * xy_sum) / divisor
-        return m * (length - 1) + b
+    # Rolling sums over each window y of close, updated in O(1) per bar
+    y_sum[i] = y_sum[i - 1] + close[i] - close[i - length]
+    y2_sum[i] = y2_sum[i - 1] + close[i]^2 - close[i - length]^2
+    xy_sum[i] = xy_sum[i - 1] + length * close[i] - y_sum[i - 1]
 
-    linreg = close.rolling(length).apply(lr)
+    m = (length * xy_sum - x_sum * y_sum) / divisor
+    b = (y_sum * x2_sum - x_sum * xy_sum) / divisor
+    linreg = m * (length - 1) + b
 
 Args:
     close (pd.Series): Series of 'close's
@@ -124,9 +156,13 @@ Kwargs:
     slope (bool, optional): If True, returns the slope. Default: False.
     tsf (bool, optional): If True, returns the Time Series Forecast value.
         Default: False.
+    variants (bool, optional): If True, returns a DataFrame of all the above
+        variants at once: LR, LRm, LRb, LRa, LRr and TSF. Default: False.
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
 Returns:
-    pd.Series: New feature generated.
+    pd.Series: New feature generated or pd.DataFrame if variants is True.
 """
@@ -1,5 +1,26 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from numpy import full as npFull
+from numpy import NaN as npNaN
+from pandas import Series
+from pandas_ta.utils import get_engine, get_offset, kernel, verify_series
+
+
+@kernel
+def _mcgd(x, length, c):
+    """McGinley Dynamic recurrence. The smoothing depends on the previous
+    value, so it is not a linear_recurrence. Like the former rolling(2)
+    window, it restarts from the next close after a NaN close."""
+    m = x.size
+    y = npFull(m, npNaN)
+    y[0] = prev = x[0]
+    for i in range(1, m):
+        if x[i - 1] == x[i - 1] and x[i] == x[i]:
+            denom = c * length * (x[i] / prev) ** 4.0
+            prev = prev + (x[i] - prev) / denom
+            y[i] = prev
+        else:
+            prev = x[i]
+    return y
 
 
 def mcgd(close, length=None, offset=None, c=None, **kwargs):
@@ -9,19 +30,13 @@ def mcgd(close, length=None, offset=None, c=None, **kwargs):
     c = float(c) if c and 0 < c <= 1 else 1
     close = verify_series(close, length)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     if close is None: return
 
     # Calculate Result
-    close = close.copy()
-
-    def mcg_(series):
-        denom = (c * length * (series.iloc[1] / series.iloc[0]) ** 4)
-        series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
-        return series.iloc[1]
-
-    mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
-    mcg_ds = close[:1].append(mcg_cell[1:])
+    mcg_ds = _mcgd(close.to_numpy(dtype=float), length, c, engine=engine)
+    mcg_ds = Series(mcg_ds, index=close.index)
 
     # Offset
     if offset != 0:
@@ -60,12 +75,9 @@ Calculation:
         offset=0
         c=1
 
-    def mcg_(series):
-        denom = (constant * length * (series.iloc[1] / series.iloc[0]) ** 4)
-        series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
-        return series.iloc[1]
-    mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
-    mcg_ds = close[:1].append(mcg_cell[1:])
+    MCGD[0] = close[0]
+    denom = c * length * (close[i] / MCGD[i - 1]) ** 4
+    MCGD[i] = MCGD[i - 1] + (close[i] - MCGD[i - 1]) / denom
 
 Args:
     close (pd.Series): Series of 'close's
@@ -76,6 +88,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.Series: New feature generated.
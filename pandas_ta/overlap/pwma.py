@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, pascals_triangle, verify_series, weights
+from pandas import Series
+from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import weighted_window, window_weights
 
 
 def pwma(close, length=None, asc=None, offset=None, **kwargs):
@@ -13,8 +15,9 @@ def pwma(close, length=None, asc=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    triangle = pascals_triangle(n=length - 1, weighted=True)
-    pwma = close.rolling(length, min_periods=length).apply(weights(triangle), raw=True)
+    triangle = window_weights("pascal", length)
+    pwma = weighted_window(close.to_numpy(dtype=float), triangle)
+    pwma = Series(pwma, index=close.index)
 
     # Offset
     if offset != 0:
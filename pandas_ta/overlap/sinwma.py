@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
-from numpy import pi as npPi
-from numpy import sin as npSin
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series, weights
+from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import weighted_window, window_weights
 
 
 def sinwma(close, length=None, offset=None, **kwargs):
@@ -15,10 +14,9 @@ def sinwma(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    sines = Series([npSin((i + 1) * npPi / (length + 1)) for i in range(0, length)])
-    w = sines / sines.sum()
-
-    sinwma = close.rolling(length, min_periods=length).apply(weights(w), raw=True)
+    w = window_weights("sine", length)
+    sinwma = weighted_window(close.to_numpy(dtype=float), w)
+    sinwma = Series(sinwma, index=close.index)
 
     # Offset
     if offset != 0:
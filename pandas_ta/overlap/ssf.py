@@ -3,7 +3,8 @@ from numpy import cos as npCos
 from numpy import exp as npExp
 from numpy import pi as npPi
 from numpy import sqrt as npSqrt
-from pandas_ta.utils import get_offset, verify_series
+from pandas import Series
+from pandas_ta.utils import get_engine, get_offset, iir_filter, verify_series
 
 
 def ssf(close, length=None, poles=None, offset=None, **kwargs):
@@ -13,12 +14,14 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
     poles = int(poles) if poles in [2, 3] else 2
     close = verify_series(close, length)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     if close is None: return
 
     # Calculate Result
-    m = close.size
-    ssf = close.copy()
+    # The first bars are seeded with the last closes as prior SSF values.
+    values = close.to_numpy(dtype=float)
+    y0 = values[::-1][:poles]
 
     if poles == 3:
         x = npPi / length # x = PI / n
@@ -31,8 +34,8 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
         c2 = c0 + b0 # e^(-2x) + 2e^(-x)*cos(3^(.5) * x)
         c1 = 1 - c2 - c3 - c4
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + c2 * ssf.iloc[i - 1] + c3 * ssf.iloc[i - 2] + c4 * ssf.iloc[i - 3]
+        # ssf[i] = c1 * close[i] + c2 * ssf[i - 1] + c3 * ssf[i - 2] + c4 * ssf[i - 3]
+        ssf = iir_filter([c1], [1, -c2, -c3, -c4], values, y0=y0, engine=engine)
 
     else: # poles == 2
         x = npPi * npSqrt(2) / length # x = PI * 2^(.5) / n
@@ -41,8 +44,10 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
         b1 = 2 * a0 * npCos(x) # 2e^(-x)*cos(x)
         c1 = 1 - a1 - b1 # e^(-2x) - 2e^(-x)*cos(x) + 1
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + b1 * ssf.iloc[i - 1] + a1 * ssf.iloc[i - 2]
+        # ssf[i] = c1 * close[i] + b1 * ssf[i - 1] + a1 * ssf[i - 2]
+        ssf = iir_filter([c1], [1, -b1, -a1], values, y0=y0, engine=engine)
+
+    ssf = Series(ssf, index=close.index)
 
     # Offset
     if offset != 0:
@@ -93,6 +98,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.Series: New feature generated.
@@ -1,9 +1,43 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
+from numpy import int64 as npInt64
 from numpy import NaN as npNaN
+from numpy import ones as npOnes
+from numpy import zeros as npZeros
 from pandas import DataFrame
 from pandas_ta.overlap import hl2
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_engine, get_offset, kernel, verify_series
+
+
+@kernel
+def _supertrend(hl2_, matr, close):
+    """Supertrend band ratchet over float64 arrays. Returns trend, direction,
+    long and short arrays."""
+    m = close.size
+    upperband = hl2_ + matr
+    lowerband = hl2_ - matr
+    dir_, trend = npOnes(m, dtype=npInt64), npZeros(m)
+    long, short = npFull(m, npNaN), npFull(m, npNaN)
+
+    for i in range(1, m):
+        if close[i] > upperband[i - 1]:
+            dir_[i] = 1
+        elif close[i] < lowerband[i - 1]:
+            dir_[i] = -1
+        else:
+            dir_[i] = dir_[i - 1]
+            if dir_[i] > 0 and lowerband[i] < lowerband[i - 1]:
+                lowerband[i] = lowerband[i - 1]
+            if dir_[i] < 0 and upperband[i] > upperband[i - 1]:
+                upperband[i] = upperband[i - 1]
+
+        if dir_[i] > 0:
+            trend[i] = long[i] = lowerband[i]
+        else:
+            trend[i] = short[i] = upperband[i]
+
+    return trend, dir_, long, short
 
 
 def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kwargs):
@@ -15,35 +49,17 @@ def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kw
     low = verify_series(low, length)
     close = verify_series(close, length)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     if high is None or low is None or close is None: return
 
     # Calculate Results
-    m = close.size
-    dir_, trend = [1] * m, [0] * m
-    long, short = [npNaN] * m, [npNaN] * m
-
     hl2_ = hl2(high, low)
     matr = multiplier * atr(high, low, close, length)
-    upperband = hl2_ + matr
-    lowerband = hl2_ - matr
-
-    for i in range(1, m):
-        if close.iloc[i] > upperband.iloc[i - 1]:
-            dir_[i] = 1
-        elif close.iloc[i] < lowerband.iloc[i - 1]:
-            dir_[i] = -1
-        else:
-            dir_[i] = dir_[i - 1]
-            if dir_[i] > 0 and lowerband.iloc[i] < lowerband.iloc[i - 1]:
-                lowerband.iloc[i] = lowerband.iloc[i - 1]
-            if dir_[i] < 0 and upperband.iloc[i] > upperband.iloc[i - 1]:
-                upperband.iloc[i] = upperband.iloc[i - 1]
-
-        if dir_[i] > 0:
-            trend[i] = long[i] = lowerband.iloc[i]
-        else:
-            trend[i] = short[i] = upperband.iloc[i]
+    trend, dir_, long, short = _supertrend(
+        hl2_.to_numpy(dtype=float), matr.to_numpy(dtype=float),
+        close.to_numpy(dtype=float), engine=engine
+    )
 
     # Prepare DataFrame to return
     _props = f"_{length}_{multiplier}"
@@ -118,6 +134,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.DataFrame: SUPERT (trend), SUPERTd (direction), SUPERTl (long), SUPERTs (short) columns.
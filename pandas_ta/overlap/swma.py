@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, symmetric_triangle, verify_series, weights
+from pandas import Series
+from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import weighted_window, window_weights
 
 
 def swma(close, length=None, asc=None, offset=None, **kwargs):
@@ -14,9 +16,9 @@ def swma(close, length=None, asc=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    triangle = symmetric_triangle(length, weighted=True)
-    swma = close.rolling(length, min_periods=length).apply(weights(triangle), raw=True)
-    # swma = close.rolling(length).apply(weights(triangle), raw=True)
+    triangle = window_weights("symmetric", length)
+    swma = weighted_window(close.to_numpy(dtype=float), triangle)
+    swma = Series(swma, index=close.index)
 
     # Offset
     if offset != 0:
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
 from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import get_drift, get_engine, get_offset, linear_recurrence
+from pandas_ta.utils import verify_series
 
 
 def vidya(close, length=None, drift=None, offset=None, **kwargs):
@@ -11,6 +12,7 @@ def vidya(close, length=None, drift=None, offset=None, **kwargs):
     close = verify_series(close, length)
     drift = get_drift(drift)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     if close is None: return
 
@@ -29,12 +31,13 @@ def vidya(close, length=None, drift=None, offset=None, **kwargs):
         return (pos_sum - neg_sum) / (pos_sum + neg_sum)
 
     # Calculate Result
-    m = close.size
     alpha = 2 / (length + 1)
     abs_cmo = _cmo(close, length, drift).abs()
-    vidya = Series(0, index=close.index)
-    for i in range(length, m):
-        vidya.iloc[i] = alpha * abs_cmo.iloc[i] * close.iloc[i] + vidya.iloc[i - 1] * (1 - alpha * abs_cmo.iloc[i])
+    vidya = linear_recurrence(
+        (alpha * abs_cmo).to_numpy(dtype=float), close.to_numpy(dtype=float),
+        y0=0, start=length, engine=engine
+    )
+    vidya = Series(vidya, index=close.index)
     vidya.replace({0: npNaN}, inplace=True)
 
     # Offset
@@ -87,6 +90,8 @@ Kwargs:
     talib (bool): If True, uses TA-Libs implementation for CMO. Otherwise uses EMA version. Default: True
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.Series: New feature generated.
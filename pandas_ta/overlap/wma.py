@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
-from numpy import arange as npArange
-from numpy import dot as npDot
 from pandas import Series
 from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import weighted_window, window_weights
 
 
 def wma(close, length=None, asc=None, offset=None, **kwargs):
@@ -17,16 +16,11 @@ def wma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     total_weight = 0.5 * length * (length + 1)
-    weights_ = Series(npArange(1, length + 1))
-    weights = weights_ if asc else weights_[::-1]
-
-    def linear(w):
-        def _compute(x):
-            return npDot(x, w) / total_weight
-        return _compute
+    weights = window_weights("linear", length)
+    weights = weights if asc else weights[::-1]
 
-    close_ = close.rolling(length, min_periods=length)
-    wma = close_.apply(linear(weights), raw=True)
+    wma = weighted_window(close.to_numpy(dtype=float), weights) / total_weight
+    wma = Series(wma, index=close.index)
 
     # Offset
     if offset != 0:
@@ -58,15 +52,10 @@ Calculation:
     Default Inputs:
         length=10, asc=True
     total_weight = 0.5 * length * (length + 1)
-    weights_ = [1, 2, ..., length + 1]  # Ascending
+    weights = [1, 2, ..., length]  # Ascending
     weights = weights if asc else weights[::-1]
 
-    def linear_weights(w):
-        def _compute(x):
-            return (w * x).sum() / total_weight
-        return _compute
-
-    WMA = close.rolling(length)_.apply(linear_weights(weights), raw=True)
+    WMA = close.rolling(length).apply(weights(weights), raw=True) / total_weight
 
 Args:
     close (pd.Series): Series of 'close's
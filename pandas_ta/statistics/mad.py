@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
-from numpy import fabs as npfabs
-from pandas_ta.utils import get_offset, verify_series
+from pandas import Series
+from pandas_ta.utils import get_offset, rolling_mad, verify_series
 
 
 def mad(close, length=None, offset=None, **kwargs):
@@ -10,15 +10,13 @@ def mad(close, length=None, offset=None, **kwargs):
     min_periods = int(kwargs["min_periods"]) if "min_periods" in kwargs and kwargs["min_periods"] is not None else length
     close = verify_series(close, max(length, min_periods))
     offset = get_offset(offset)
+    chunk_size = kwargs.pop("chunk_size", None)
 
     if close is None: return
 
     # Calculate Result
-    def mad_(series):
-        """Mean Absolute Deviation"""
-        return npfabs(series - series.mean()).mean()
-
-    mad = close.rolling(length, min_periods=min_periods).apply(mad_, raw=True)
+    mad = rolling_mad(close.to_numpy(dtype=float), length, min_periods, chunk_size)
+    mad = Series(mad, index=close.index)
 
     # Offset
     if offset != 0:
@@ -55,6 +53,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    chunk_size (int, optional): Number of windows reduced at a time, bounds
+        memory on long Series. Default: 16384
 
 Returns:
     pd.Series: New feature generated.
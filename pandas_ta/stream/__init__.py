@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+from ._base import *
+from ._overlap import *
+from ._momentum import *
+from ._statistics import *
+from ._trend import *
+from ._volatility import *
+from ._volume import *
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from math import copysign, inf
+from sys import float_info as sflt
+
+from numpy import asarray as npAsarray
+from numpy import generic as npGeneric
+from numpy import isnan as npIsNaN
+from numpy import NaN as npNaN
+from pandas import DataFrame, Series
+
+
+class Stream(object):
+    """Streaming Indicator
+
+    The base of the streaming indicators. A stream keeps the state of an
+    indicator so that each new bar is an O(1) update() instead of a new run
+    over the whole history. Its outputs match the batch indicator bar for
+    bar. from_history() computes the batch indicator once and seeds the
+    state from its tail.
+
+    >>> ema = ta.stream.EMA.from_history(df["close"], length=10)
+    >>> ema.update(price)  # On every new bar
+    """
+    name = None
+
+    def __call__(self, *args):
+        return self.update(*args)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name}, value={self.value})"
+
+    @property
+    def value(self):
+        """The last output."""
+        return self._value
+
+    def update(self, *args):
+        """Updates the state with the next bar and returns the new output."""
+        raise NotImplementedError
+
+    def extend(self, *args) -> Series:
+        """Updates the state with several bars and returns their outputs."""
+        index = next((x.index for x in args if isinstance(x, Series)), None)
+        outputs = self._replay(*args)
+        if len(outputs) and isinstance(outputs[0], tuple):
+            return DataFrame(outputs, index=index, columns=self.columns)
+        return Series(outputs, index=index, name=self.name, dtype=float)
+
+    def state(self) -> dict:
+        """Returns a snapshot of the parameters and state as plain Python
+        values, lists and dicts, so it can be stored, with json for
+        instance, and later resumed with restore()."""
+        return {k: _snapshot(v) for k, v in vars(self).items()}
+
+    def restore(self, state: dict) -> "Stream":
+        """Resumes from a state() snapshot of a stream of the same class and
+        parameters. Returns the stream."""
+        for k, v in state.items():
+            setattr(self, k, _restore(getattr(self, k, None), v))
+        return self
+
+    def _replay(self, *args) -> list:
+        """Updates the state with several bars and returns their outputs as
+        a list."""
+        return [self.update(*bar) for bar in zip(*[npAsarray(x, dtype=float).tolist() for x in args])]
+
+
+class RingBuffer(object):
+    """Ring Buffer
+
+    The last length values in a preallocated list. push() overwrites the
+    oldest value in place and returns it, so that a window statistic can
+    remove it in O(1). While the buffer fills up, push() returns nan.
+
+    Args:
+        length (int): The number of values kept.
+    """
+    __slots__ = ("length", "_values", "_i")
+
+    def __init__(self, length: int):
+        self.length = int(length)
+        self._values = [npNaN] * self.length
+        self._i = 0
+
+    def __iter__(self):
+        return iter(self._values[self._i:] + self._values[:self._i])
+
+    def push(self, x: float) -> float:
+        i = self._i
+        old, self._values[i] = self._values[i], x
+        self._i = i + 1 if i + 1 < self.length else 0
+        return old
+
+
+class RollingMax(Stream):
+    """Streaming Rolling Maximum
+
+    Matches x.rolling(length, min_periods=min_periods).max(). The window
+    candidates are kept in a monotonic deque of (bar, value): a new value
+    drops every smaller one from the back, and the front, the maximum,
+    expires after length bars. Each value is added and dropped once, so an
+    update is amortized O(1). Like pandas, nan values are skipped and only
+    count against min_periods.
+
+    Args:
+        length (int): The window size.
+        min_periods (int): Minimum number of observations. Default: length
+    """
+
+    def __init__(self, length: int, min_periods: int = None):
+        self.length = int(length)
+        self.min_periods = int(min_periods) if min_periods is not None else self.length
+        self.name = f"MAX_{self.length}"
+        self._window = RingBuffer(self.length)  # Counts the observations
+        self._deque = deque()
+        self._n = self._nobs = 0
+        self._value = npNaN
+
+    def _expire(self, x: float) -> None:
+        """Slides the window by one bar, dropping the expired candidate."""
+        old = self._window.push(x)
+        if old == old: self._nobs -= 1
+        if x == x: self._nobs += 1
+        self._n += 1
+        if self._deque and self._deque[0][0] <= self._n - 1 - self.length:
+            self._deque.popleft()
+
+    def _output(self) -> float:
+        nobs = self._nobs
+        self._value = self._deque[0][1] if nobs >= self.min_periods and nobs > 0 else npNaN
+        return self._value
+
+    def update(self, x: float) -> float:
+        self._expire(x)
+        if x == x:
+            candidates = self._deque
+            while candidates and candidates[-1][1] <= x:
+                candidates.pop()
+            candidates.append((self._n - 1, x))
+        return self._output()
+
+    @classmethod
+    def from_history(cls, x, length: int, min_periods: int = None):
+        """Returns the stream after x. Only the last length values are
+        needed."""
+        stream = cls(length, min_periods)
+        stream._replay(npAsarray(x, dtype=float)[-stream.length:])
+        return stream
+
+
+class RollingMin(RollingMax):
+    """Streaming Rolling Minimum
+
+    Matches x.rolling(length, min_periods=min_periods).min(). See
+    RollingMax.
+
+    Args:
+        length (int): The window size.
+        min_periods (int): Minimum number of observations. Default: length
+    """
+
+    def __init__(self, length: int, min_periods: int = None):
+        super().__init__(length, min_periods)
+        self.name = f"MIN_{self.length}"
+
+    def update(self, x: float) -> float:
+        self._expire(x)
+        if x == x:
+            candidates = self._deque
+            while candidates and candidates[-1][1] >= x:
+                candidates.pop()
+            candidates.append((self._n - 1, x))
+        return self._output()
+
+
+class EWM(Stream):
+    """Exponentially Weighted Mean
+
+    The recursion of pandas' ewm(com, adjust, min_periods).mean(), with
+    ignore_na=False, one observation at a time. The outputs are the same
+    floats as the batch mean.
+
+    Args:
+        com (float): Center of mass. alpha = 1 / (1 + com)
+        adjust (bool): Default: True
+        min_periods (int): Default: 0
+    """
+
+    def __init__(self, com: float, adjust: bool = True, min_periods: int = 0):
+        self.com, self.adjust = com, adjust
+        self.min_periods = max(int(min_periods), 1)
+        self._factor = 1.0 - 1.0 / (1.0 + com)
+        self._new_weight = 1.0 if adjust else 1.0 / (1.0 + com)
+        self._weighted = npNaN
+        self._old_weight = 1.0
+        self._nobs = 0
+        self._value = npNaN
+
+    def update(self, x: float) -> float:
+        observation = x == x
+        self._nobs += observation
+        if self._weighted == self._weighted:
+            self._old_weight *= self._factor
+            if observation:
+                if self._weighted != x:
+                    weighted = self._old_weight * self._weighted + self._new_weight * x
+                    self._weighted = weighted / (self._old_weight + self._new_weight)
+                if self.adjust:
+                    self._old_weight += self._new_weight
+                else:
+                    self._old_weight = 1.0
+        elif observation:
+            self._weighted = x
+
+        self._value = self._weighted if self._nobs >= self.min_periods else npNaN
+        return self._value
+
+    def seed(self, x, mean) -> "EWM":
+        """Sets the state after the inputs x given their batch ewm mean.
+        Only the weight recursion is replayed, and it stops as soon as its
+        weight no longer changes."""
+        x, mean = npAsarray(x, dtype=float), npAsarray(mean, dtype=float)
+        observed = ~npIsNaN(x)
+        self._nobs = int(observed.sum())
+        if self._nobs < self.min_periods or self._nobs == 0:
+            for v in x:  # Short history: the mean is not complete yet
+                self.update(v)
+            return self
+
+        first = observed.argmax()
+        last_nan = len(x) - 1 - (~observed[::-1]).argmax() if not observed[first:].all() else first
+        weight = 1.0
+        for i in range(first + 1, len(x)):
+            previous = weight
+            weight *= self._factor
+            if observed[i]:
+                weight = weight + self._new_weight if self.adjust else 1.0
+                if i > last_nan and weight == previous:
+                    break
+
+        self._weighted = self._value = mean[-1]
+        self._old_weight = weight
+        return self
+
+
+def _div(a: float, b: float) -> float:
+    """Divides like NumPy: a division by zero is a signed inf, or nan for
+    0 / 0, instead of raising ZeroDivisionError."""
+    if b == 0:
+        if a != a or a == 0: return npNaN
+        return copysign(inf, a) * copysign(1.0, b)
+    return a / b
+
+
+def _non_zero(x: float) -> float:
+    """The range of one bar as non_zero_range(): epsilon is added to a zero
+    range. Unlike the batch utility, which adds epsilon to every range of a
+    Series once any of them is zero, only that bar is changed."""
+    return x + sflt.epsilon if x == 0 else x
+
+
+def _snapshot(x):
+    """Converts a state attribute to plain Python values."""
+    if isinstance(x, Stream):
+        return x.state()
+    if isinstance(x, RingBuffer):
+        return {"values": list(x._values), "i": x._i}
+    if isinstance(x, (list, tuple, deque)):
+        return [_snapshot(v) for v in x]
+    if isinstance(x, npGeneric):
+        return x.item()
+    return x
+
+
+def _restore(current, x):
+    """Converts a _snapshot() value back to the type of the current
+    attribute."""
+    if isinstance(current, Stream):
+        return current.restore(x)
+    if isinstance(current, RingBuffer):
+        current._values, current._i = list(x["values"]), x["i"]
+        return current
+    if isinstance(current, deque):
+        return deque([tuple(v) if isinstance(v, list) else v for v in x], maxlen=current.maxlen)
+    if isinstance(current, list) and len(current) == len(x) and all(isinstance(v, Stream) for v in current):
+        return [_restore(c, v) for c, v in zip(current, x)]
+    if isinstance(current, tuple):
+        return tuple(x)
+    return x
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+
+from numpy import asarray as npAsarray
+from numpy import log as npLog
+from numpy import NaN as npNaN
+from pandas import Series
+from pandas_ta.utils import get_drift, non_zero_range
+from ._base import _div, _non_zero, RingBuffer, RollingMax, RollingMin, Stream
+from ._overlap import RMA, SMA
+
+
+class RSI(Stream):
+    """Streaming Relative Strength Index
+
+    Matches ta.rsi(close, length, scalar, drift).
+
+    >>> rsi = ta.stream.RSI.from_history(df["close"], length=14)
+    >>> rsi.update(price)
+
+    Args:
+        length (int): It's period. Default: 14
+        scalar (float): How much to magnify. Default: 100
+        drift (int): The difference period. Default: 1
+    """
+
+    def __init__(self, length: int = None, scalar: float = None, drift: int = None):
+        self.length = int(length) if length and length > 0 else 14
+        self.scalar = float(scalar) if scalar else 100
+        self.drift = get_drift(drift)
+        self.name = f"RSI_{self.length}"
+        self._closes = deque(maxlen=self.drift)
+        self._positive = RMA(self.length)
+        self._negative = RMA(self.length)
+        self._value = npNaN
+
+    def update(self, close: float) -> float:
+        diff = close - self._closes[0] if len(self._closes) == self.drift else npNaN
+        self._closes.append(close)
+
+        positive = self._positive.update(0.0 if diff < 0 else diff)
+        negative = self._negative.update(0.0 if diff > 0 else diff)
+        self._value = _div(self.scalar * positive, positive + abs(negative))
+        return self._value
+
+    @classmethod
+    def from_history(cls, close, length: int = None, scalar: float = None, drift: int = None):
+        """Returns an RSI that has seen close."""
+        stream = cls(length, scalar, drift)
+        close = Series(npAsarray(close, dtype=float))
+        negative = close.diff(stream.drift)
+        positive = negative.copy()
+        positive[positive < 0] = 0
+        negative[negative > 0] = 0
+
+        stream._positive, positive = RMA._from_history(positive, stream.length)
+        stream._negative, negative = RMA._from_history(negative, stream.length)
+        stream._closes.extend(close.iloc[-stream.drift:])
+        if close.size:
+            stream._value = _div(stream.scalar * positive[-1], positive[-1] + abs(negative[-1]))
+        return stream
+
+
+class KDJ(Stream):
+    """Streaming KDJ
+
+    Matches ta.kdj(high, low, close, length, signal), except that a zero
+    highest high - lowest low range only adds epsilon to its own bar. The
+    highest high and lowest low are a RollingMax and a RollingMin.
+
+    >>> kdj = ta.stream.KDJ.from_history(df["high"], df["low"], df["close"])
+    >>> k, d, j = kdj.update(high, low, close)
+
+    Args:
+        length (int): It's period. Default: 9
+        signal (int): It's signal period. Default: 3
+    """
+
+    def __init__(self, length: int = None, signal: int = None):
+        self.length = int(length) if length and length > 0 else 9
+        self.signal = int(signal) if signal and signal > 0 else 3
+        _params = f"_{self.length}_{self.signal}"
+        self.name = f"KDJ{_params}"
+        self.columns = [f"K{_params}", f"D{_params}", f"J{_params}"]
+        self._highest = RollingMax(self.length)
+        self._lowest = RollingMin(self.length)
+        self._k = RMA(self.signal)
+        self._d = RMA(self.signal)
+        self._value = (npNaN, npNaN, npNaN)
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        highest_high = self._highest.update(high)
+        lowest_low = self._lowest.update(low)
+        fastk = 100 * (close - lowest_low) / _non_zero(highest_high - lowest_low)
+        k = self._k.update(fastk)
+        d = self._d.update(k)
+        self._value = (k, d, 3 * k - 2 * d)
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close, length: int = None, signal: int = None):
+        """Returns a KDJ that has seen high, low and close."""
+        stream = cls(length, signal)
+        high, low, close = [Series(npAsarray(x, dtype=float)) for x in (high, low, close)]
+        highest_high = high.rolling(stream.length).max()
+        lowest_low = low.rolling(stream.length).min()
+        fastk = 100 * (close - lowest_low) / non_zero_range(highest_high, lowest_low)
+
+        stream._k, k = RMA._from_history(fastk, stream.signal)
+        stream._d, d = RMA._from_history(k, stream.signal)
+        stream._highest = RollingMax.from_history(high, stream.length)
+        stream._lowest = RollingMin.from_history(low, stream.length)
+        if close.size:
+            stream._value = (k[-1], d[-1], 3 * k[-1] - 2 * d[-1])
+        return stream
+
+
+class STOCH(Stream):
+    """Streaming Stochastic Oscillator
+
+    Matches ta.stoch(high, low, close, k, d, smooth_k), except that a zero
+    highest high - lowest low range only adds epsilon to its own bar. Each
+    update returns (stoch_k, stoch_d).
+
+    >>> stoch = ta.stream.STOCH.from_history(df["high"], df["low"], df["close"])
+    >>> stoch_k, stoch_d = stoch.update(high, low, close)
+
+    Args:
+        k (int): The Fast %K period. Default: 14
+        d (int): The Slow %K period. Default: 3
+        smooth_k (int): The Slow %D period. Default: 3
+    """
+
+    def __init__(self, k: int = None, d: int = None, smooth_k: int = None):
+        self.k = int(k) if k and k > 0 else 14
+        self.d = int(d) if d and d > 0 else 3
+        self.smooth_k = int(smooth_k) if smooth_k and smooth_k > 0 else 3
+        _props = f"_{self.k}_{self.d}_{self.smooth_k}"
+        self.name = f"STOCH{_props}"
+        self.columns = [f"STOCHk{_props}", f"STOCHd{_props}"]
+        self._lowest = RollingMin(self.k)
+        self._highest = RollingMax(self.k)
+        self._stoch_k = SMA(self.smooth_k)
+        self._stoch_d = SMA(self.d)
+        self._value = (npNaN, npNaN)
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        lowest_low = self._lowest.update(low)
+        highest_high = self._highest.update(high)
+        stoch = 100 * (close - lowest_low) / _non_zero(highest_high - lowest_low)
+
+        stoch_k = self._stoch_k.update(stoch)
+        self._value = (stoch_k, self._stoch_d.update(stoch_k))
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close, k: int = None, d: int = None, smooth_k: int = None):
+        """Returns a STOCH that has seen high, low and close."""
+        stream = cls(k, d, smooth_k)
+        high, low, close = [Series(npAsarray(x, dtype=float)) for x in (high, low, close)]
+        lowest_low = low.rolling(stream.k).min()
+        highest_high = high.rolling(stream.k).max()
+        stoch = 100 * (close - lowest_low)
+        stoch /= non_zero_range(highest_high, lowest_low)
+
+        stream._stoch_k, stoch_k = SMA._from_history(stoch, stream.smooth_k)
+        stream._stoch_d, stoch_d = SMA._from_history(stoch_k, stream.d)
+        stream._lowest = RollingMin.from_history(low, stream.k)
+        stream._highest = RollingMax.from_history(high, stream.k)
+        if close.size:
+            stream._value = (stoch_k[-1], stoch_d[-1])
+        return stream
+
+
+class WILLR(Stream):
+    """Streaming William's Percent R
+
+    Matches ta.willr(high, low, close, length, min_periods=min_periods).
+
+    Args:
+        length (int): It's period. Default: 14
+        min_periods (int): Minimum number of observations. Default: length
+    """
+
+    def __init__(self, length: int = None, min_periods: int = None):
+        self.length = int(length) if length and length > 0 else 14
+        self.name = f"WILLR_{self.length}"
+        self._lowest = RollingMin(self.length, min_periods)
+        self._highest = RollingMax(self.length, min_periods)
+        self._value = npNaN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        lowest_low = self._lowest.update(low)
+        highest_high = self._highest.update(high)
+        self._value = 100 * (_div(close - lowest_low, highest_high - lowest_low) - 1)
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close, length: int = None, min_periods: int = None):
+        """Returns a WILLR that has seen high, low and close. Only the last
+        length bars are needed."""
+        stream = cls(length, min_periods)
+        stream._replay(*[npAsarray(x, dtype=float)[-stream.length:] for x in (high, low, close)])
+        return stream
+
+
+class FISHER(Stream):
+    """Streaming Fisher Transform
+
+    Matches ta.fisher(high, low, length, signal), except that a zero range
+    only adds epsilon to its own bar. Each update returns (fisher, signal).
+    The transform is a recursion over every bar since the first length, so
+    from_history() replays the history once.
+
+    >>> fisher = ta.stream.FISHER.from_history(df["high"], df["low"])
+    >>> fisher, signal = fisher.update(high, low)
+
+    Args:
+        length (int): Fisher period. Default: 9
+        signal (int): Fisher Signal period. Default: 1
+    """
+
+    def __init__(self, length: int = None, signal: int = None):
+        self.length = int(length) if length and length > 0 else 9
+        self.signal = int(signal) if signal and signal > 0 else 1
+        _props = f"_{self.length}_{self.signal}"
+        self.name = f"FISHERT{_props}"
+        self.columns = [f"FISHERT{_props}", f"FISHERTs{_props}"]
+        self._highest = RollingMax(self.length)
+        self._lowest = RollingMin(self.length)
+        self._signal = RingBuffer(self.signal)  # The last signal transforms
+        self._n = 0
+        self._v = 0.0
+        self._fisher = npNaN
+        self._value = (npNaN, npNaN)
+
+    def update(self, high: float, low: float) -> tuple:
+        hl2 = 0.5 * (high + low)
+        highest_hl2 = self._highest.update(hl2)
+        lowest_hl2 = self._lowest.update(hl2)
+
+        n, self._n = self._n, self._n + 1
+        if n < self.length - 1:
+            fisher = npNaN
+        elif n == self.length - 1:
+            fisher = 0.0
+        else:
+            hlr = _non_zero(highest_hl2 - lowest_hl2)
+            if hlr < 0.001: hlr = 0.001
+            position = ((hl2 - lowest_hl2) / hlr) - 0.5
+
+            v = 0.66 * position + 0.67 * self._v
+            if v < -0.99: v = -0.999
+            if v > 0.99: v = 0.999
+            self._v = v
+            fisher = 0.5 * (npLog((1 + v) / (1 - v)) + self._fisher)
+
+        self._fisher = fisher
+        self._value = (fisher, self._signal.push(fisher))
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, length: int = None, signal: int = None):
+        """Returns a FISHER that has seen high and low."""
+        stream = cls(length, signal)
+        stream._replay(high, low)
+        return stream
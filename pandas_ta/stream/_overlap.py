@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+from math import copysign
+
+from numpy import array as npArray
+from numpy import asarray as npAsarray
+from numpy import NaN as npNaN
+from pandas import Series
+from pandas_ta.overlap import ema, rma
+from pandas_ta.overlap import ma as batch_ma
+from ._base import EWM, RingBuffer, RollingMax, RollingMin, Stream
+
+
+class EMA(Stream):
+    """Streaming Exponential Moving Average
+
+    Matches ta.ema(close, length, sma=sma, adjust=adjust). With sma=True, the
+    first output is the mean of the first length inputs.
+
+    >>> ema = ta.stream.EMA.from_history(df["close"], length=10)
+    >>> ema.update(price)
+
+    Args:
+        length (int): It's period. Default: 10
+        sma (bool): Seed with the SMA of the first length inputs.
+            Default: True
+        adjust (bool): Default: False
+    """
+
+    def __init__(self, length: int = None, sma: bool = True, adjust: bool = False):
+        self.length = int(length) if length and length > 0 else 10
+        self.sma, self.adjust = sma, adjust
+        self.name = f"EMA_{self.length}"
+        self._ewm = EWM(com=(self.length - 1) / 2.0, adjust=adjust)
+        self._window = []
+        self._n = 0
+        self._value = npNaN
+
+    def update(self, close: float) -> float:
+        self._n += 1
+        if self.sma and self._n <= self.length:
+            self._window.append(close)
+            if self._n < self.length:
+                return self._value
+            # The same mean as the batch close[0:length].mean()
+            close = Series(self._window, dtype=float).mean()
+            self._window = []
+        self._value = self._ewm.update(close)
+        return self._value
+
+    @classmethod
+    def from_history(cls, close, length: int = None, sma: bool = True, adjust: bool = False):
+        """Returns an EMA that has seen close."""
+        return cls._from_history(close, length, sma, adjust)[0]
+
+    @classmethod
+    def _from_history(cls, close, length=None, sma=True, adjust=False) -> tuple:
+        """Returns the seeded EMA and its outputs over close."""
+        stream = cls(length, sma, adjust)
+        x = npAsarray(close, dtype=float)
+        if x.size < stream.length:
+            return stream, npArray([stream.update(v) for v in x], dtype=float)
+
+        mean = ema(Series(x), stream.length, sma=sma, adjust=adjust).to_numpy()
+        if sma:  # The inputs of the ewm
+            x = x.copy()
+            x[:stream.length - 1] = npNaN
+            x[stream.length - 1] = mean[stream.length - 1]
+        stream._ewm.seed(x, mean)
+        stream._n, stream._value = x.size, mean[-1]
+        return stream, mean
+
+
+class RMA(Stream):
+    """Streaming wildeR's Moving Average
+
+    Matches ta.rma(close, length).
+
+    >>> rma = ta.stream.RMA.from_history(df["close"], length=14)
+    >>> rma.update(price)
+
+    Args:
+        length (int): It's period. Default: 10
+    """
+
+    def __init__(self, length: int = None):
+        self.length = int(length) if length and length > 0 else 10
+        self.name = f"RMA_{self.length}"
+        self._ewm = EWM(com=1.0 / (1.0 / self.length) - 1, min_periods=self.length)
+        self._value = npNaN
+
+    def update(self, close: float) -> float:
+        self._value = self._ewm.update(close)
+        return self._value
+
+    @classmethod
+    def from_history(cls, close, length: int = None):
+        """Returns an RMA that has seen close."""
+        return cls._from_history(close, length)[0]
+
+    @classmethod
+    def _from_history(cls, close, length=None) -> tuple:
+        """Returns the seeded RMA and its outputs over close."""
+        stream = cls(length)
+        x = npAsarray(close, dtype=float)
+        if x.size < stream.length:
+            return stream, npArray([stream.update(v) for v in x], dtype=float)
+
+        mean = rma(Series(x), stream.length).to_numpy()
+        stream._ewm.seed(x, mean)
+        stream._value = mean[-1]
+        return stream, mean
+
+
+class SMA(Stream):
+    """Streaming Simple Moving Average
+
+    Matches ta.sma(close, length, min_periods=min_periods). The window is a
+    RingBuffer and its sum is kept like pandas' rolling mean, with Kahan
+    compensated adds and removes. The rounding of that sum carries over
+    from the first bar, so from_history() replays the history once.
+
+    >>> sma = ta.stream.SMA.from_history(df["close"], length=10)
+    >>> sma.update(price)
+
+    Args:
+        length (int): It's period. Default: 10
+        min_periods (int): Minimum number of observations. Default: length
+    """
+
+    def __init__(self, length: int = None, min_periods: int = None):
+        self.length = int(length) if length and length > 0 else 10
+        self.min_periods = int(min_periods) if min_periods is not None else self.length
+        self.name = f"SMA_{self.length}"
+        self._window = RingBuffer(self.length)
+        self._nobs = self._neg_ct = self._same = 0
+        self._sum = self._add_c = self._remove_c = 0.0
+        self._prev = npNaN
+        self._value = npNaN
+
+    def update(self, close: float) -> float:
+        old = self._window.push(close)
+        if old == old:
+            self._nobs -= 1
+            y = -old - self._remove_c
+            t = self._sum + y
+            self._remove_c = t - self._sum - y
+            self._sum = t
+            if copysign(1.0, old) < 0: self._neg_ct -= 1
+        if close == close:
+            self._nobs += 1
+            y = close - self._add_c
+            t = self._sum + y
+            self._add_c = t - self._sum - y
+            self._sum = t
+            if copysign(1.0, close) < 0: self._neg_ct += 1
+            self._same = self._same + 1 if close == self._prev else 1
+            self._prev = close
+
+        nobs, mean = self._nobs, npNaN
+        if nobs >= self.min_periods and nobs > 0:
+            mean = self._sum / nobs
+            if self._same >= nobs:  # Repeated values have no rounding
+                mean = self._prev
+            elif (self._neg_ct == 0 and mean < 0) or (self._neg_ct == nobs and mean > 0):
+                mean = 0.0
+        self._value = mean
+        return self._value
+
+    @classmethod
+    def from_history(cls, close, length: int = None, min_periods: int = None):
+        """Returns an SMA that has seen close."""
+        return cls._from_history(close, length, min_periods)[0]
+
+    @classmethod
+    def _from_history(cls, close, length=None, min_periods=None) -> tuple:
+        """Returns the SMA after close and its outputs over close."""
+        stream = cls(length, min_periods)
+        return stream, npArray(stream._replay(close), dtype=float)
+
+
+class MIDPOINT(Stream):
+    """Streaming Midpoint
+
+    Matches ta.midpoint(close, length, min_periods=min_periods).
+
+    Args:
+        length (int): It's period. Default: 2
+        min_periods (int): Minimum number of observations. Default: length
+    """
+
+    def __init__(self, length: int = None, min_periods: int = None):
+        self.length = int(length) if length and length > 0 else 2
+        self.name = f"MIDPOINT_{self.length}"
+        self._lowest = RollingMin(self.length, min_periods)
+        self._highest = RollingMax(self.length, min_periods)
+        self._value = npNaN
+
+    def update(self, close: float) -> float:
+        self._value = 0.5 * (self._lowest.update(close) + self._highest.update(close))
+        return self._value
+
+    @classmethod
+    def from_history(cls, close, length: int = None, min_periods: int = None):
+        """Returns a MIDPOINT that has seen close. Only the last length
+        values are needed."""
+        stream = cls(length, min_periods)
+        stream._replay(npAsarray(close, dtype=float)[-stream.length:])
+        return stream
+
+    @classmethod
+    def _from_history(cls, close, length=None, min_periods=None) -> tuple:
+        """Returns the MIDPOINT after close and its outputs over close."""
+        stream = cls(length, min_periods)
+        return stream, npArray(stream._replay(close), dtype=float)
+
+
+class MIDPRICE(Stream):
+    """Streaming Midprice
+
+    Matches ta.midprice(high, low, length, min_periods=min_periods).
+
+    Args:
+        length (int): It's period. Default: 2
+        min_periods (int): Minimum number of observations. Default: length
+    """
+
+    def __init__(self, length: int = None, min_periods: int = None):
+        self.length = int(length) if length and length > 0 else 2
+        self.name = f"MIDPRICE_{self.length}"
+        self._lowest = RollingMin(self.length, min_periods)
+        self._highest = RollingMax(self.length, min_periods)
+        self._value = npNaN
+
+    def update(self, high: float, low: float) -> float:
+        self._value = 0.5 * (self._lowest.update(low) + self._highest.update(high))
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, length: int = None, min_periods: int = None):
+        """Returns a MIDPRICE that has seen high and low. Only the last
+        length bars are needed."""
+        stream = cls(length, min_periods)
+        stream._replay(*[npAsarray(x, dtype=float)[-stream.length:] for x in (high, low)])
+        return stream
+
+
+class ICHIMOKU(Stream):
+    """Streaming Ichimoku Kinkō Hyō
+
+    Matches the Span A, Span B, Tenkan and Kijun Sen columns of
+    ta.ichimoku(high, low, close, tenkan, kijun, senkou). Each update
+    returns (span_a, span_b, tenkan_sen, kijun_sen). The Chikou Span is the
+    close kijun bars back, it is not known on the current bar and is not an
+    output. The spans the batch returns ahead of the last bar are the
+    spans property.
+
+    >>> ichimoku = ta.stream.ICHIMOKU.from_history(df["high"], df["low"], df["close"])
+    >>> span_a, span_b, tenkan_sen, kijun_sen = ichimoku.update(high, low, close)
+
+    Args:
+        tenkan (int): Tenkan period. Default: 9
+        kijun (int): Kijun period. Default: 26
+        senkou (int): Senkou period. Default: 52
+    """
+
+    def __init__(self, tenkan: int = None, kijun: int = None, senkou: int = None):
+        self.tenkan = int(tenkan) if tenkan and tenkan > 0 else 9
+        self.kijun = int(kijun) if kijun and kijun > 0 else 26
+        self.senkou = int(senkou) if senkou and senkou > 0 else 52
+        self.name = f"ICHIMOKU_{self.tenkan}_{self.kijun}_{self.senkou}"
+        self.columns = [f"ISA_{self.tenkan}", f"ISB_{self.kijun}", f"ITS_{self.tenkan}", f"IKS_{self.kijun}"]
+        self._tenkan_sen = MIDPRICE(self.tenkan)
+        self._kijun_sen = MIDPRICE(self.kijun)
+        self._span_b = MIDPRICE(self.senkou)
+        self._spans_a = RingBuffer(self.kijun)  # The spans of the last kijun bars
+        self._spans_b = RingBuffer(self.kijun)
+        self._value = (npNaN, npNaN, npNaN, npNaN)
+
+    @property
+    def spans(self) -> list:
+        """The (span_a, span_b) of the next kijun bars."""
+        return list(zip(self._spans_a, self._spans_b))
+
+    def update(self, high: float, low: float, close: float = None) -> tuple:
+        tenkan_sen = self._tenkan_sen.update(high, low)
+        kijun_sen = self._kijun_sen.update(high, low)
+        span_a = self._spans_a.push(0.5 * (tenkan_sen + kijun_sen))
+        span_b = self._spans_b.push(self._span_b.update(high, low))
+        self._value = (span_a, span_b, tenkan_sen, kijun_sen)
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close=None, tenkan: int = None, kijun: int = None, senkou: int = None):
+        """Returns an ICHIMOKU that has seen high and low. Only the last
+        kijun + max(tenkan, kijun, senkou) bars are needed."""
+        stream = cls(tenkan, kijun, senkou)
+        n = stream.kijun + max(stream.tenkan, stream.kijun, stream.senkou)
+        stream._replay(*[npAsarray(x, dtype=float)[-n:] for x in (high, low)])
+        return stream
+
+
+class _EMAChain(Stream):
+    """A chain of EMAs, each one smoothing the previous one, that outputs a
+    combination of their values. The base of DEMA, TEMA and T3."""
+    depth = 1
+
+    def __init__(self, length: int = None, sma: bool = True, adjust: bool = False):
+        self.length = int(length) if length and length > 0 else 10
+        self._emas = [EMA(self.length, sma, adjust) for _ in range(self.depth)]
+        self._value = npNaN
+
+    def _combine(self, e: list) -> float:
+        raise NotImplementedError
+
+    def update(self, close: float) -> float:
+        e = []
+        for stream in self._emas:
+            close = stream.update(close)
+            e.append(close)
+        self._value = self._combine(e)
+        return self._value
+
+    @classmethod
+    def _from_history(cls, close, length=None, **kwargs) -> tuple:
+        """Returns the seeded chain and its outputs over close."""
+        chain = cls(length, **kwargs)
+        sma, adjust = chain._emas[0].sma, chain._emas[0].adjust
+        e = []
+        for i in range(chain.depth):
+            chain._emas[i], close = EMA._from_history(close, chain.length, sma, adjust)
+            e.append(close)
+        outputs = chain._combine(e)
+        chain._value = outputs[-1] if len(outputs) else npNaN
+        return chain, outputs
+
+
+class DEMA(_EMAChain):
+    """Streaming Double Exponential Moving Average
+
+    Matches ta.dema(close, length).
+
+    Args:
+        length (int): It's period. Default: 10
+    """
+    depth = 2
+
+    def __init__(self, length: int = None):
+        super().__init__(length)
+        self.name = f"DEMA_{self.length}"
+
+    def _combine(self, e):
+        return 2 * e[0] - e[1]
+
+    @classmethod
+    def from_history(cls, close, length: int = None):
+        """Returns a DEMA that has seen close."""
+        return cls._from_history(close, length)[0]
+
+
+class TEMA(_EMAChain):
+    """Streaming Triple Exponential Moving Average
+
+    Matches ta.tema(close, length, sma=sma, adjust=adjust).
+
+    Args:
+        length (int): It's period. Default: 10
+        sma (bool): See EMA. Default: True
+        adjust (bool): See EMA. Default: False
+    """
+    depth = 3
+
+    def __init__(self, length: int = None, sma: bool = True, adjust: bool = False):
+        super().__init__(length, sma, adjust)
+        self.name = f"TEMA_{self.length}"
+
+    def _combine(self, e):
+        return 3 * (e[0] - e[1]) + e[2]
+
+    @classmethod
+    def from_history(cls, close, length: int = None, sma: bool = True, adjust: bool = False):
+        """Returns a TEMA that has seen close."""
+        return cls._from_history(close, length, sma=sma, adjust=adjust)[0]
+
+
+class T3(_EMAChain):
+    """Streaming T3
+
+    Matches ta.t3(close, length, a, sma=sma, adjust=adjust).
+
+    Args:
+        length (int): It's period. Default: 10
+        a (float): 0 < a < 1. Default: 0.7
+        sma (bool): See EMA. Default: True
+        adjust (bool): See EMA. Default: False
+    """
+    depth = 6
+
+    def __init__(self, length: int = None, a: float = None, sma: bool = True, adjust: bool = False):
+        super().__init__(length, sma, adjust)
+        self.a = a = float(a) if a and a > 0 and a < 1 else 0.7
+        self.name = f"T3_{self.length}_{a}"
+        self._c = (
+            -a * a**2,
+            3 * a**2 + 3 * a**3,
+            -6 * a**2 - 3 * a - 3 * a**3,
+            a**3 + 3 * a**2 + 3 * a + 1,
+        )
+
+    def _combine(self, e):
+        c1, c2, c3, c4 = self._c
+        return c1 * e[5] + c2 * e[4] + c3 * e[3] + c4 * e[2]
+
+    @classmethod
+    def from_history(cls, close, length: int = None, a: float = None, sma: bool = True, adjust: bool = False):
+        """Returns a T3 that has seen close."""
+        return cls._from_history(close, length, a=a, sma=sma, adjust=adjust)[0]
+
+
+_MAS = {"dema": DEMA, "ema": EMA, "midpoint": MIDPOINT, "rma": RMA, "sma": SMA, "t3": T3, "tema": TEMA}
+
+
+def ma(name: str = None, length: int = None, **kwargs) -> Stream:
+    """Streaming MA Utility, the counterpart of ta.ma()
+
+    Returns the streaming MA called name. Like ta.ma(), an unknown name is
+    an EMA.
+
+    >>> rma = ta.stream.ma("rma", length=14)
+
+    Args:
+        name (str): One of the streaming MAs. Default: "ema"
+        length (int): It's period.
+
+    Kwargs:
+        Any additional kwargs the MA may require.
+
+    Returns:
+        Stream: The streaming MA.
+    """
+    return _ma_class(name)(length, **kwargs)
+
+
+def _ma_class(name: str) -> type:
+    """Returns the class of the streaming MA called name."""
+    name = name.lower() if isinstance(name, str) else "ema"
+    if name in _MAS:
+        return _MAS[name]
+    if name in batch_ma():
+        raise ValueError(f"[X] The {name} MA has no streaming version. Use one of {sorted(_MAS)}.")
+    return EMA
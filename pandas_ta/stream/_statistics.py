@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+from math import sqrt
+
+from numpy import NaN as npNaN
+from ._base import _div, RingBuffer, Stream
+from ._overlap import SMA
+
+
+class VARIANCE(Stream):
+    """Streaming Rolling Variance
+
+    Matches ta.variance(close, length, ddof, min_periods=min_periods). The
+    window is a RingBuffer and its variance is updated with Welford's method
+    like pandas' rolling var, so adds and removes are O(1) and numerically
+    stable. The rounding carries over from the first bar, so from_history()
+    replays the history once.
+
+    >>> var = ta.stream.VARIANCE.from_history(df["close"], length=30)
+    >>> var.update(price)
+
+    Args:
+        length (int): It's period. Default: 30
+        ddof (int): Delta Degrees of Freedom. Default: 0
+        min_periods (int): Minimum number of observations. Default: length
+    """
+
+    def __init__(self, length: int = None, ddof: int = None, min_periods: int = None):
+        self.length = int(length) if length and length > 1 else 30
+        self.ddof = int(ddof) if ddof and ddof >= 0 and ddof < self.length else 0
+        self.min_periods = max(int(min_periods) if min_periods is not None else self.length, 1)
+        self.name = f"VAR_{self.length}"
+        self._window = RingBuffer(self.length)
+        self._nobs = self._mean = self._ssqdm = 0.0
+        self._add_c = self._remove_c = 0.0
+        self._same = 0
+        self._prev = npNaN
+        self._value = npNaN
+
+    def update(self, close: float) -> float:
+        old = self._window.push(close)
+        if old == old:
+            self._nobs -= 1
+            if self._nobs:
+                prev_mean = self._mean - self._remove_c
+                y = old - self._remove_c
+                t = y - self._mean
+                self._remove_c = t + self._mean - y
+                self._mean -= t / self._nobs
+                self._ssqdm -= (old - prev_mean) * (old - self._mean)
+            else:
+                self._mean = self._ssqdm = 0.0
+        if close == close:
+            self._nobs += 1
+            self._same = self._same + 1 if close == self._prev else 1
+            self._prev = close
+            prev_mean = self._mean - self._add_c
+            y = close - self._add_c
+            t = y - self._mean
+            self._add_c = t + self._mean - y
+            self._mean += t / self._nobs
+            self._ssqdm += (close - prev_mean) * (close - self._mean)
+
+        nobs, var = self._nobs, npNaN
+        if nobs >= self.min_periods and nobs > self.ddof:
+            # Repeated values have no variance
+            var = 0.0 if nobs == 1 or self._same >= nobs else self._ssqdm / (nobs - self.ddof)
+        self._value = var
+        return self._value
+
+    @classmethod
+    def from_history(cls, close, length: int = None, ddof: int = None, min_periods: int = None):
+        """Returns a VARIANCE that has seen close."""
+        stream = cls(length, ddof, min_periods)
+        stream._replay(close)
+        return stream
+
+
+class STDEV(Stream):
+    """Streaming Rolling Standard Deviation
+
+    Matches ta.stdev(close, length, ddof). The square root of VARIANCE.
+
+    Args:
+        length (int): It's period. Default: 30
+        ddof (int): Delta Degrees of Freedom. Default: 1
+    """
+
+    def __init__(self, length: int = None, ddof: int = None):
+        self.length = int(length) if length and length > 0 else 30
+        self.ddof = int(ddof) if ddof and ddof >= 0 and ddof < self.length else 1
+        self.name = f"STDEV_{self.length}"
+        self._var = VARIANCE(self.length, self.ddof)
+        self._value = npNaN
+
+    def update(self, close: float) -> float:
+        var = self._var.update(close)
+        self._value = sqrt(var) if var >= 0 else npNaN
+        return self._value
+
+    @classmethod
+    def from_history(cls, close, length: int = None, ddof: int = None):
+        """Returns a STDEV that has seen close."""
+        stream = cls(length, ddof)
+        stream._replay(close)
+        return stream
+
+
+class ZSCORE(Stream):
+    """Streaming Rolling Z Score
+
+    Matches ta.zscore(close, length, std, ddof=ddof).
+
+    Args:
+        length (int): It's period. Default: 30
+        std (float): The number of standard deviations. Default: 1
+        ddof (int): Delta Degrees of Freedom of the STDEV. Default: 1
+    """
+
+    def __init__(self, length: int = None, std: float = None, ddof: int = None):
+        self.length = int(length) if length and length > 1 else 30
+        self.std = float(std) if std and std > 1 else 1
+        self.name = f"Z_{self.length}"
+        self._stdev = STDEV(self.length, ddof)
+        self._sma = SMA(self.length)
+        self._value = npNaN
+
+    def update(self, close: float) -> float:
+        std = self.std * self._stdev.update(close)
+        self._value = _div(close - self._sma.update(close), std)
+        return self._value
+
+    @classmethod
+    def from_history(cls, close, length: int = None, std: float = None, ddof: int = None):
+        """Returns a ZSCORE that has seen close."""
+        stream = cls(length, std, ddof)
+        stream._replay(close)
+        return stream
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from sys import float_info as sflt
+
+from numpy import asarray as npAsarray
+from numpy import NaN as npNaN
+from pandas import Series
+from pandas_ta.utils import get_drift, zero
+from ._base import _div, Stream
+from ._overlap import _ma_class, ma
+from ._volatility import ATR
+
+
+class ADX(Stream):
+    """Streaming Average Directional Movement
+
+    Matches ta.adx(high, low, close, length, lensig, mamode, scalar, drift).
+    Each update returns (adx, dmp, dmn).
+
+    >>> adx = ta.stream.ADX.from_history(df["high"], df["low"], df["close"])
+    >>> adx, dmp, dmn = adx.update(high, low, close)
+
+    Args:
+        length (int): It's period. Default: 14
+        lensig (int): Signal Length. Like TradingView's default ADX.
+            Default: length
+        mamode (str): A streaming MA, see ta.stream.ma(). Default: "rma"
+        scalar (float): How much to magnify. Default: 100
+        drift (int): The difference period. Default: 1
+    """
+
+    def __init__(self, length: int = None, lensig: int = None, mamode: str = None, scalar: float = None, drift: int = None):
+        self.length = int(length) if length and length > 0 else 14
+        self.lensig = int(lensig) if lensig and lensig > 0 else self.length
+        self.mamode = mamode if isinstance(mamode, str) else "rma"
+        self.scalar = float(scalar) if scalar else 100
+        self.drift = get_drift(drift)
+        self.name = f"ADX_{self.lensig}"
+        self.columns = [f"ADX_{self.lensig}", f"DMP_{self.length}", f"DMN_{self.length}"]
+        self._atr = ATR(self.length)
+        self._highs = deque(maxlen=self.drift)
+        self._lows = deque(maxlen=self.drift)
+        self._pos = ma(self.mamode, self.length)
+        self._neg = ma(self.mamode, self.length)
+        self._adx = ma(self.mamode, self.lensig)
+        self._value = (npNaN, npNaN, npNaN)
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        atr = self._atr.update(high, low, close)
+        pos = neg = npNaN
+        if len(self._highs) == self.drift:
+            up, dn = high - self._highs[0], self._lows[0] - low
+            pos, neg = _directional_movement(up, dn), _directional_movement(dn, up)
+        self._highs.append(high)
+        self._lows.append(low)
+
+        k = _div(self.scalar, atr)
+        dmp = k * self._pos.update(pos)
+        dmn = k * self._neg.update(neg)
+        dx = _div(self.scalar * abs(dmp - dmn), dmp + dmn)
+        self._value = (self._adx.update(dx), dmp, dmn)
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close, length: int = None, lensig: int = None, mamode: str = None, scalar: float = None, drift: int = None):
+        """Returns an ADX that has seen high, low and close."""
+        stream = cls(length, lensig, mamode, scalar, drift)
+        high, low, close = [Series(npAsarray(x, dtype=float)) for x in (high, low, close)]
+        stream._atr, atr = ATR._from_history(high, low, close, stream.length)
+
+        up = high - high.shift(stream.drift)
+        dn = low.shift(stream.drift) - low
+        pos = (((up > dn) & (up > 0)) * up).apply(zero)
+        neg = (((dn > up) & (dn > 0)) * dn).apply(zero)
+
+        ma_class = _ma_class(stream.mamode)
+        k = stream.scalar / Series(atr)
+        stream._pos, pos = ma_class._from_history(pos, stream.length)
+        stream._neg, neg = ma_class._from_history(neg, stream.length)
+        dmp, dmn = k * pos, k * neg
+        dx = stream.scalar * (dmp - dmn).abs() / (dmp + dmn)
+        stream._adx, adx = ma_class._from_history(dx, stream.lensig)
+
+        stream._highs.extend(high.iloc[-stream.drift:])
+        stream._lows.extend(low.iloc[-stream.drift:])
+        if close.size:
+            stream._value = (adx[-1], dmp.iloc[-1], dmn.iloc[-1])
+        return stream
+
+
+class PSAR(Stream):
+    """Streaming Parabolic Stop and Reverse
+
+    Matches ta.psar(high, low, close, af, max_af). Each update returns
+    (long, short, af, reversal). The trend, acceleration factor and
+    extreme points that the batch keeps in loop variables are the state of
+    this stream, so state() can be saved and restore() resumes it on the
+    next bar without the history.
+
+    >>> psar = ta.stream.PSAR.from_history(df["high"], df["low"], df["close"])
+    >>> long, short, af, reversal = psar.update(high, low, close)
+    >>> snapshot = psar.state()  # json.dumps(snapshot)
+    >>> psar = ta.stream.PSAR().restore(snapshot)
+
+    Args:
+        af (float): Acceleration Factor. Default: 0.02
+        max_af (float): Maximum Acceleration Factor. Default: 0.2
+    """
+
+    def __init__(self, af: float = None, max_af: float = None):
+        self.af0 = float(af) if af and af > 0 else 0.02
+        self.max_af = float(max_af) if max_af and max_af > 0 else 0.2
+        _params = f"_{self.af0}_{self.max_af}"
+        self.name = f"PSAR{_params}"
+        self.columns = [f"PSARl{_params}", f"PSARs{_params}", f"PSARaf{_params}", f"PSARr{_params}"]
+        self._n = 0
+        self._af = self.af0
+        self._bullish = True
+        self._high_point = self._low_point = npNaN
+        self._sar = npNaN
+        self._highs = [npNaN, npNaN]  # The previous two bars, oldest first
+        self._lows = [npNaN, npNaN]
+        self._value = (npNaN, npNaN, self.af0, False)
+
+    def update(self, high: float, low: float, close: float = None) -> tuple:
+        if self._n < 2:
+            if self._n == 0:
+                self._high_point, self._low_point = high, low
+            self._sar = low if close is None else close
+            self._value = (npNaN, npNaN, self.af0, False)
+        else:
+            self._value = self._step(high, low)
+        self._n += 1
+        self._highs = [self._highs[1], high]
+        self._lows = [self._lows[1], low]
+        return self._value
+
+    def _step(self, high: float, low: float) -> tuple:
+        """One bar of the state machine of ta.psar()."""
+        af0, af, reverse = self.af0, self._af, False
+        bullish, high_point, low_point = self._bullish, self._high_point, self._low_point
+
+        if bullish:
+            sar = self._sar + af * (high_point - self._sar)
+            if low < sar:
+                bullish, reverse, af = False, True, af0
+                sar, low_point = high_point, low
+        else:
+            sar = self._sar + af * (low_point - self._sar)
+            if high > sar:
+                bullish, reverse, af = True, True, af0
+                sar, high_point = low_point, high
+
+        if not reverse:
+            if bullish:
+                if high > high_point:
+                    high_point = high
+                    af = min(af + af0, self.max_af)
+                if self._lows[1] < sar: sar = self._lows[1]
+                if self._lows[0] < sar: sar = self._lows[0]
+            else:
+                if low < low_point:
+                    low_point = low
+                    af = min(af + af0, self.max_af)
+                if self._highs[1] > sar: sar = self._highs[1]
+                if self._highs[0] > sar: sar = self._highs[0]
+
+        output = (sar if bullish else npNaN, npNaN if bullish else sar, self._af, reverse)
+        self._af, self._sar = af, sar
+        self._bullish, self._high_point, self._low_point = bullish, high_point, low_point
+        return output
+
+    @classmethod
+    def from_history(cls, high, low, close=None, af: float = None, max_af: float = None):
+        """Returns a PSAR that has seen high, low and close. Its path depends
+        on every bar, so the history is replayed once. Save state() to
+        resume later without it."""
+        stream = cls(af, max_af)
+        stream._replay(*[x for x in (high, low, close) if x is not None])
+        return stream
+
+
+class SUPERTREND(Stream):
+    """Streaming Supertrend
+
+    Matches ta.supertrend(high, low, close, length, multiplier). Each
+    update returns (trend, direction, long, short). The direction and the
+    ratcheted bands are the state of this stream along with its ATR, so
+    state() can be saved and restore() resumes it on the next bar without
+    the history.
+
+    >>> st = ta.stream.SUPERTREND.from_history(df["high"], df["low"], df["close"])
+    >>> trend, direction, long, short = st.update(high, low, close)
+    >>> st = ta.stream.SUPERTREND().restore(st.state())
+
+    Args:
+        length (int) : length for ATR calculation. Default: 7
+        multiplier (float): Coefficient for upper and lower band distance to
+            midrange. Default: 3.0
+    """
+
+    def __init__(self, length: int = None, multiplier: float = None):
+        self.length = int(length) if length and length > 0 else 7
+        self.multiplier = float(multiplier) if multiplier and multiplier > 0 else 3.0
+        _props = f"_{self.length}_{self.multiplier}"
+        self.name = f"SUPERT{_props}"
+        self.columns = [f"SUPERT{_props}", f"SUPERTd{_props}", f"SUPERTl{_props}", f"SUPERTs{_props}"]
+        self._atr = ATR(self.length)
+        self._n = 0
+        self._dir = 1
+        self._upperband = self._lowerband = npNaN
+        self._value = (npNaN, 1, npNaN, npNaN)
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        matr = self.multiplier * self._atr.update(high, low, close)
+        return self._step(0.5 * (high + low), matr, close)
+
+    def _step(self, hl2: float, matr: float, close: float) -> tuple:
+        """One bar of the band ratchet of ta.supertrend()."""
+        upperband, lowerband = hl2 + matr, hl2 - matr
+        if self._n == 0:
+            self._value = (0.0, 1, npNaN, npNaN)
+        else:
+            if close > self._upperband:
+                dir_ = 1
+            elif close < self._lowerband:
+                dir_ = -1
+            else:
+                dir_ = self._dir
+                if dir_ > 0 and lowerband < self._lowerband:
+                    lowerband = self._lowerband
+                if dir_ < 0 and upperband > self._upperband:
+                    upperband = self._upperband
+
+            if dir_ > 0:
+                self._value = (lowerband, dir_, lowerband, npNaN)
+            else:
+                self._value = (upperband, dir_, npNaN, upperband)
+            self._dir = dir_
+
+        self._n += 1
+        self._upperband, self._lowerband = upperband, lowerband
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close, length: int = None, multiplier: float = None):
+        """Returns a SUPERTREND that has seen high, low and close. The ATR is
+        seeded from the batch and the band ratchet is replayed once."""
+        stream = cls(length, multiplier)
+        high, low, close = [Series(npAsarray(x, dtype=float)) for x in (high, low, close)]
+        stream._atr, atr = ATR._from_history(high, low, close, stream.length)
+        hl2 = 0.5 * (high + low)
+        matr = stream.multiplier * Series(atr)
+        for bar in zip(hl2.tolist(), matr.tolist(), close.tolist()):
+            stream._step(*bar)
+        return stream
+
+
+def _directional_movement(up: float, dn: float) -> float:
+    """The directional movement of one bar as in ta.adx()."""
+    if up != up: return npNaN
+    return up if up > dn and up > 0 and up >= sflt.epsilon else 0.0
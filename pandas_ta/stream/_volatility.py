@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+
+from numpy import asarray as npAsarray
+from numpy import NaN as npNaN
+from pandas import Series
+from pandas_ta.utils import get_drift
+from pandas_ta.volatility import true_range
+from ._base import _div, _non_zero, RollingMax, RollingMin, Stream
+from ._overlap import _ma_class, ma
+from ._statistics import STDEV
+
+
+class TrueRange(Stream):
+    """Streaming True Range
+
+    Matches ta.true_range(high, low, close, drift), except that a zero
+    high - low range only adds epsilon to its own bar.
+
+    Args:
+        drift (int): The shift period. Default: 1
+    """
+
+    def __init__(self, drift: int = None):
+        self.drift = get_drift(drift)
+        self.name = f"TRUERANGE_{self.drift}"
+        self._closes = deque(maxlen=self.drift)
+        self._value = npNaN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        if len(self._closes) < self.drift:
+            self._value = npNaN
+        else:
+            prev_close = self._closes[0]
+            ranges = [abs(x) for x in (_non_zero(high - low), high - prev_close, prev_close - low) if x == x]
+            self._value = max(ranges) if len(ranges) else npNaN
+        self._closes.append(close)
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close, drift: int = None):
+        """Returns a TrueRange that has seen high, low and close."""
+        return cls._from_history(high, low, close, drift)[0]
+
+    @classmethod
+    def _from_history(cls, high, low, close, drift=None) -> tuple:
+        """Returns the seeded TrueRange and its outputs."""
+        stream = cls(drift)
+        high, low, close = [Series(npAsarray(x, dtype=float)) for x in (high, low, close)]
+        tr = true_range(high, low, close, drift=stream.drift).to_numpy()
+        stream._closes.extend(close.iloc[-stream.drift:])
+        stream._value = tr[-1] if tr.size else npNaN
+        return stream, tr
+
+
+class ATR(Stream):
+    """Streaming Average True Range
+
+    Matches ta.atr(high, low, close, length, mamode, drift, percent=percent).
+
+    >>> atr = ta.stream.ATR.from_history(df["high"], df["low"], df["close"])
+    >>> atr.update(high, low, close)
+
+    Args:
+        length (int): It's period. Default: 14
+        mamode (str): A streaming MA, see ta.stream.ma(). Default: "rma"
+        drift (int): The difference period. Default: 1
+        percent (bool): Return as percentage. Default: False
+    """
+
+    def __init__(self, length: int = None, mamode: str = None, drift: int = None, percent: bool = False):
+        self.length = int(length) if length and length > 0 else 14
+        self.mamode = mamode.lower() if mamode and isinstance(mamode, str) else "rma"
+        self.percent = percent
+        self.name = f"ATR{self.mamode[0]}_{self.length}{'p' if percent else ''}"
+        self._tr = TrueRange(drift)
+        self._ma = ma(self.mamode, self.length)
+        self._value = npNaN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        atr = self._ma.update(self._tr.update(high, low, close))
+        if self.percent:
+            atr *= _div(100, close)
+        self._value = atr
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close, length: int = None, mamode: str = None, drift: int = None, percent: bool = False):
+        """Returns an ATR that has seen high, low and close."""
+        return cls._from_history(high, low, close, length, mamode, drift, percent)[0]
+
+    @classmethod
+    def _from_history(cls, high, low, close, length=None, mamode=None, drift=None, percent=False) -> tuple:
+        """Returns the seeded ATR and its outputs."""
+        stream = cls(length, mamode, drift, percent)
+        stream._tr, tr = TrueRange._from_history(high, low, close, stream._tr.drift)
+        stream._ma, atr = _ma_class(stream.mamode)._from_history(tr, stream.length)
+        if percent:
+            atr = (Series(atr) * (100 / Series(npAsarray(close, dtype=float)))).to_numpy()
+        stream._value = atr[-1] if atr.size else npNaN
+        return stream, atr
+
+
+class DONCHIAN(Stream):
+    """Streaming Donchian Channels
+
+    Matches ta.donchian(high, low, lower_length, upper_length,
+    lower_min_periods=lower_min_periods, upper_min_periods=upper_min_periods).
+    Each update returns (lower, mid, upper).
+
+    >>> dc = ta.stream.DONCHIAN.from_history(df["high"], df["low"])
+    >>> lower, mid, upper = dc.update(high, low)
+
+    Args:
+        lower_length (int): The short period. Default: 20
+        upper_length (int): The short period. Default: 20
+        lower_min_periods (int): Default: lower_length
+        upper_min_periods (int): Default: upper_length
+    """
+
+    def __init__(self, lower_length: int = None, upper_length: int = None, lower_min_periods: int = None, upper_min_periods: int = None):
+        self.lower_length = int(lower_length) if lower_length and lower_length > 0 else 20
+        self.upper_length = int(upper_length) if upper_length and upper_length > 0 else 20
+        _props = f"_{self.lower_length}_{self.upper_length}"
+        self.name = f"DC{_props}"
+        self.columns = [f"DCL{_props}", f"DCM{_props}", f"DCU{_props}"]
+        self._lower = RollingMin(self.lower_length, lower_min_periods)
+        self._upper = RollingMax(self.upper_length, upper_min_periods)
+        self._value = (npNaN, npNaN, npNaN)
+
+    def update(self, high: float, low: float) -> tuple:
+        lower, upper = self._lower.update(low), self._upper.update(high)
+        self._value = (lower, 0.5 * (lower + upper), upper)
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, lower_length: int = None, upper_length: int = None, lower_min_periods: int = None, upper_min_periods: int = None):
+        """Returns a DONCHIAN that has seen high and low. Only the last
+        max(lower_length, upper_length) bars are needed."""
+        stream = cls(lower_length, upper_length, lower_min_periods, upper_min_periods)
+        n = max(stream.lower_length, stream.upper_length)
+        stream._replay(*[npAsarray(x, dtype=float)[-n:] for x in (high, low)])
+        return stream
+
+
+class NATR(Stream):
+    """Streaming Normalized Average True Range
+
+    Matches ta.natr(high, low, close, length, mamode, scalar, drift).
+
+    Args:
+        length (int): It's period. Default: 14
+        mamode (str): A streaming MA, see ta.stream.ma(). Default: "ema"
+        scalar (float): How much to magnify. Default: 100
+        drift (int): The difference period. Default: 1
+    """
+
+    def __init__(self, length: int = None, mamode: str = None, scalar: float = None, drift: int = None):
+        self.length = int(length) if length and length > 0 else 14
+        self.mamode = mamode if isinstance(mamode, str) else "ema"
+        self.scalar = float(scalar) if scalar else 100
+        self.name = f"NATR_{self.length}"
+        self._atr = ATR(self.length, self.mamode, drift)
+        self._value = npNaN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        self._value = _div(self.scalar, close) * self._atr.update(high, low, close)
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close, length: int = None, mamode: str = None, scalar: float = None, drift: int = None):
+        """Returns a NATR that has seen high, low and close."""
+        stream = cls(length, mamode, scalar, drift)
+        stream._atr, atr = ATR._from_history(high, low, close, stream.length, stream.mamode, drift)
+        if atr.size:
+            stream._value = _div(stream.scalar, float(npAsarray(close, dtype=float)[-1])) * atr[-1]
+        return stream
+
+
+class BBANDS(Stream):
+    """Streaming Bollinger Bands
+
+    Matches ta.bbands(close, length, std, mamode, ddof). Each update returns
+    (lower, mid, upper, bandwidth).
+
+    >>> bbands = ta.stream.BBANDS.from_history(df["close"], length=20)
+    >>> lower, mid, upper, bandwidth = bbands.update(price)
+
+    Args:
+        length (int): The short period. Default: 5
+        std (float): The number of standard deviations. Default: 2
+        mamode (str): A streaming MA, see ta.stream.ma(). Default: "sma"
+        ddof (int): Degrees of Freedom to use. Default: 0
+    """
+
+    def __init__(self, length: int = None, std: float = None, mamode: str = None, ddof: int = 0):
+        self.length = int(length) if length and length > 0 else 5
+        self.std = float(std) if std and std > 0 else 2.0
+        self.mamode = mamode if isinstance(mamode, str) else "sma"
+        self.ddof = int(ddof) if ddof >= 0 and ddof < self.length else 1
+        _props = f"_{self.length}_{self.std}"
+        self.name = f"BBANDS{_props}"
+        self.columns = [f"BBL{_props}", f"BBM{_props}", f"BBU{_props}", f"BBB{_props}"]
+        self._stdev = STDEV(self.length, self.ddof)
+        self._mid = ma(self.mamode, self.length)
+        self._value = (npNaN, npNaN, npNaN, npNaN)
+
+    def update(self, close: float) -> tuple:
+        deviations = self.std * self._stdev.update(close)
+        mid = self._mid.update(close)
+        lower, upper = mid - deviations, mid + deviations
+        self._value = (lower, mid, upper, _div(100 * (upper - lower), mid))
+        return self._value
+
+    @classmethod
+    def from_history(cls, close, length: int = None, std: float = None, mamode: str = None, ddof: int = 0):
+        """Returns a BBANDS that has seen close."""
+        stream = cls(length, std, mamode, ddof)
+        stream._replay(close)
+        return stream
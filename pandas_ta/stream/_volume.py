@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from numpy import NaN as npNaN
+from ._base import _div, _non_zero, RingBuffer, Stream
+
+
+class _RollingSum(Stream):
+    """The sum of a RingBuffer window, kept like pandas' rolling sum with
+    Kahan compensated adds and removes. A Stream, so that its state() is
+    part of the state() of the indicator that uses it."""
+
+    def __init__(self, length: int, min_periods: int):
+        self.min_periods = min_periods
+        self._window = RingBuffer(length)
+        self._nobs = self._same = 0
+        self._sum = self._add_c = self._remove_c = 0.0
+        self._prev = self._value = npNaN
+
+    def update(self, x: float) -> float:
+        old = self._window.push(x)
+        if old == old:
+            self._nobs -= 1
+            y = -old - self._remove_c
+            t = self._sum + y
+            self._remove_c = t - self._sum - y
+            self._sum = t
+        if x == x:
+            self._nobs += 1
+            y = x - self._add_c
+            t = self._sum + y
+            self._add_c = t - self._sum - y
+            self._sum = t
+            self._same = self._same + 1 if x == self._prev else 1
+            self._prev = x
+
+        nobs = self._nobs
+        if nobs == 0 == self.min_periods:
+            self._value = 0.0
+        elif nobs >= self.min_periods:
+            self._value = self._prev * nobs if self._same >= nobs else self._sum
+        else:
+            self._value = npNaN
+        return self._value
+
+
+class CMF(Stream):
+    """Streaming Chaikin Money Flow
+
+    Matches ta.cmf(high, low, close, volume, open_, length,
+    min_periods=min_periods), except that a zero range only adds epsilon to
+    its own bar. The open is optional in update().
+
+    >>> cmf = ta.stream.CMF.from_history(df["high"], df["low"], df["close"], df["volume"])
+    >>> cmf.update(high, low, close, volume)
+
+    Args:
+        length (int): The short period. Default: 20
+        min_periods (int): Minimum number of observations. Default: length
+    """
+
+    def __init__(self, length: int = None, min_periods: int = None):
+        self.length = int(length) if length and length > 0 else 20
+        self.min_periods = int(min_periods) if min_periods is not None else self.length
+        self.name = f"CMF_{self.length}"
+        self._ad = _RollingSum(self.length, self.min_periods)
+        self._volume = _RollingSum(self.length, self.min_periods)
+        self._value = npNaN
+
+    def update(self, high: float, low: float, close: float, volume: float, open_: float = None) -> float:
+        if open_ is None:
+            ad = 2 * close - (high + low)
+        else:
+            ad = _non_zero(close - open_)
+        ad *= volume / _non_zero(high - low)
+        self._value = _div(self._ad.update(ad), self._volume.update(volume))
+        return self._value
+
+    @classmethod
+    def from_history(cls, high, low, close, volume, open_=None, length: int = None, min_periods: int = None):
+        """Returns a CMF that has seen high, low, close, volume and open_."""
+        stream = cls(length, min_periods)
+        sources = (high, low, close, volume) if open_ is None else (high, low, close, volume, open_)
+        stream._replay(*sources)
+        return stream
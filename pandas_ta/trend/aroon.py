@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
-from pandas_ta.utils import recent_maximum_index, recent_minimum_index
+from pandas import DataFrame, Series
+from pandas_ta.utils import get_engine, get_offset, verify_series
+from pandas_ta.utils import rolling_argmax, rolling_argmin
 
 
 def aroon(high, low, length=None, scalar=None, offset=None, **kwargs):
@@ -12,12 +12,15 @@ def aroon(high, low, length=None, scalar=None, offset=None, **kwargs):
     high = verify_series(high, length)
     low = verify_series(low, length)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     if high is None or low is None: return
 
     # Calculate Result
-    periods_from_hh = high.rolling(length + 1).apply(recent_maximum_index, raw=True)
-    periods_from_ll = low.rolling(length + 1).apply(recent_minimum_index, raw=True)
+    periods_from_hh = rolling_argmax(high.to_numpy(dtype=float), length + 1, engine=engine)
+    periods_from_hh = Series(periods_from_hh, index=high.index)
+    periods_from_ll = rolling_argmin(low.to_numpy(dtype=float), length + 1, engine=engine)
+    periods_from_ll = Series(periods_from_ll, index=low.index)
 
     aroon_up = aroon_down = scalar
     aroon_up *= 1 - (periods_from_hh / length)
@@ -73,13 +76,11 @@ Calculation:
     Default Inputs:
         length=1, scalar=100
 
-    recent_maximum_index(x): return int(np.argmax(x[::-1]))
-    recent_minimum_index(x): return int(np.argmin(x[::-1]))
-
-    periods_from_hh = high.rolling(length + 1).apply(recent_maximum_index, raw=True)
+    # Bars since the highest high and lowest low of the last length + 1 bars
+    periods_from_hh = utils.rolling_argmax(high, length + 1)
     AROON_UP = scalar * (1 - (periods_from_hh / length))
 
-    periods_from_ll = low.rolling(length + 1).apply(recent_minimum_index, raw=True)
+    periods_from_ll = utils.rolling_argmin(low, length + 1)
     AROON_DN = scalar * (1 - (periods_from_ll / length))
 
     AROON_OSC = AROON_UP - AROON_DN
@@ -93,6 +94,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.DataFrame: aroon_up, aroon_down, aroon_osc columns.
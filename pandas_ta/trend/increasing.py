@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas import Series
+from pandas_ta.utils import get_offset, run_length, verify_series
 
 
 def increasing(close, length=None, strict=None, asint=None, offset=None, **kwargs):
@@ -13,16 +14,11 @@ def increasing(close, length=None, strict=None, asint=None, offset=None, **kwarg
 
     if close is None: return
 
-    def stricly_increasing(series, n):
-        return all([i < j for i,j in zip(series[-n:], series[1:])])
-
     # Calculate Result
     if strict:
-        # Returns value as float64? Have to cast to bool
-        increasing = close.rolling(length, min_periods=length) \
-            .apply(stricly_increasing, args=(length,), raw=False)
-        increasing.fillna(0, inplace=True)
-        increasing = increasing.astype(bool)
+        # The last length - 1 differences are all positive
+        run = run_length((close.diff() > 0).to_numpy())
+        increasing = Series(run >= length - 1, index=close.index) & close.notna()
     else:
         increasing = close.diff(length) > 0
 
@@ -56,7 +52,8 @@ or 0 for False.
 
 Calculation:
     if strict:
-        increasing = all(i < j for i, j in zip(close[-length:], close[1:]))
+        # The last length - 1 differences are all positive
+        increasing = run_length(close.diff() > 0) >= length - 1
     else:
         increasing = close.diff(length) > 0
 
@@ -1,81 +1,103 @@
 # -*- coding: utf-8 -*-
+from numpy import bool_ as npBool
+from numpy import full as npFull
 from numpy import NaN as npNaN
+from numpy import zeros as npZeros
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series
-
-
-def psar(high, low, close=None, af=None, max_af=None, offset=None, **kwargs):
-    """Indicator: Parabolic Stop and Reverse (PSAR)"""
-    # Validate Arguments
-    high = verify_series(high)
-    low = verify_series(low)
-    af = float(af) if af and af > 0 else 0.02
-    max_af = float(max_af) if max_af and max_af > 0 else 0.2
-    offset = get_offset(offset)
-
-    # Initialize
-    m = high.shape[0]
-    af0 = af
+from pandas_ta.utils import get_engine, get_offset, kernel, verify_series
+
+
+@kernel
+def _psar(high, low, sar, af0, max_af):
+    """PSAR state machine over float64 arrays. Returns long, short, af and
+    reversal arrays."""
+    m = high.size
+    sar = sar.copy()
+    long = npFull(m, npNaN)
+    short = npFull(m, npNaN)
+    _af = npFull(m, npNaN)
+    reversal = npZeros(m, dtype=npBool)
+    _af[0:2] = af0
+
+    af = af0
     bullish = True
-    high_point = high.iloc[0]
-    low_point = low.iloc[0]
+    high_point = high[0]
+    low_point = low[0]
 
-    if close is not None:
-        close = verify_series(close)
-        sar = close.copy()
-    else:
-        sar = low.copy()
-
-    long = Series(npNaN, index=sar.index)
-    short = long.copy()
-    reversal = Series(False, index=sar.index)
-    _af = long.copy()
-    _af.iloc[0:2] = af0
-
-    # Calculate Result
     for i in range(2, m):
         reverse = False
-        _af.iloc[i] = af
+        _af[i] = af
 
         if bullish:
-            sar.iloc[i] = sar.iloc[i - 1] + af * (high_point - sar.iloc[i - 1])
+            sar[i] = sar[i - 1] + af * (high_point - sar[i - 1])
 
-            if low.iloc[i] < sar.iloc[i]:
+            if low[i] < sar[i]:
                 bullish, reverse, af = False, True, af0
-                sar.iloc[i] = high_point
-                low_point = low.iloc[i]
+                sar[i] = high_point
+                low_point = low[i]
         else:
-            sar.iloc[i] = sar.iloc[i - 1] + af * (low_point - sar.iloc[i - 1])
+            sar[i] = sar[i - 1] + af * (low_point - sar[i - 1])
 
-            if high.iloc[i] > sar.iloc[i]:
+            if high[i] > sar[i]:
                 bullish, reverse, af = True, True, af0
-                sar.iloc[i] = low_point
-                high_point = high.iloc[i]
+                sar[i] = low_point
+                high_point = high[i]
 
-        reversal.iloc[i] = reverse
+        reversal[i] = reverse
 
         if not reverse:
             if bullish:
-                if high.iloc[i] > high_point:
-                    high_point = high.iloc[i]
+                if high[i] > high_point:
+                    high_point = high[i]
                     af = min(af + af0, max_af)
-                if low.iloc[i - 1] < sar.iloc[i]:
-                    sar.iloc[i] = low.iloc[i - 1]
-                if low.iloc[i - 2] < sar.iloc[i]:
-                    sar.iloc[i] = low.iloc[i - 2]
+                if low[i - 1] < sar[i]:
+                    sar[i] = low[i - 1]
+                if low[i - 2] < sar[i]:
+                    sar[i] = low[i - 2]
             else:
-                if low.iloc[i] < low_point:
-                    low_point = low.iloc[i]
+                if low[i] < low_point:
+                    low_point = low[i]
                     af = min(af + af0, max_af)
-                if high.iloc[i - 1] > sar.iloc[i]:
-                    sar.iloc[i] = high.iloc[i - 1]
-                if high.iloc[i - 2] > sar.iloc[i]:
-                    sar.iloc[i] = high.iloc[i - 2]
+                if high[i - 1] > sar[i]:
+                    sar[i] = high[i - 1]
+                if high[i - 2] > sar[i]:
+                    sar[i] = high[i - 2]
 
         if bullish:
-            long.iloc[i] = sar.iloc[i]
+            long[i] = sar[i]
         else:
-            short.iloc[i] = sar.iloc[i]
+            short[i] = sar[i]
+
+    return long, short, _af, reversal
+
+
+def psar(high, low, close=None, af=None, max_af=None, offset=None, **kwargs):
+    """Indicator: Parabolic Stop and Reverse (PSAR)"""
+    # Validate Arguments
+    high = verify_series(high)
+    low = verify_series(low)
+    af = float(af) if af and af > 0 else 0.02
+    max_af = float(max_af) if max_af and max_af > 0 else 0.2
+    offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
+
+    # Initialize
+    af0 = af
+    if close is not None:
+        close = verify_series(close)
+        sar = close
+    else:
+        sar = low
+
+    # Calculate Result
+    long, short, _af, reversal = _psar(
+        high.to_numpy(dtype=float), low.to_numpy(dtype=float),
+        sar.to_numpy(dtype=float), af0, max_af, engine=engine
+    )
+    long = Series(long, index=sar.index)
+    short = Series(short, index=sar.index)
+    _af = Series(_af, index=sar.index)
+    reversal = Series(reversal, index=sar.index)
 
     # Offset
     if offset != 0:
@@ -135,6 +157,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 
 Returns:
     pd.DataFrame: long, short, af, and reversal columns.
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
+from ._cache import *
 from ._candles import *
 from ._core import *
 from ._data import *
+from ._kernels import *
 from ._math import *
+from ._plan import *
+from ._shared_memory import *
 from ._signals import *
 from ._time import *
 from ._metrics import *
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from hashlib import blake2b
+from os import makedirs, remove
+from os.path import exists, join
+from pickle import dump, load
+from threading import RLock
+
+from numpy import ascontiguousarray as npAscontiguousarray
+from pandas import DataFrame, Index, Series
+from pandas.util import hash_pandas_object
+
+_active = {"cache": None}
+
+
+def fingerprint(x) -> str:
+    """Returns a fast hash of the values, dtype and index of a Series, or of
+    an Index. Changing any value changes the fingerprint."""
+    h = blake2b(digest_size=16)
+    for values in [x] if isinstance(x, Index) else [x.index, x]:
+        h.update(str(values.dtype).encode())
+        values = values.to_numpy()
+        if values.dtype.kind in "biufcmM":
+            h.update(npAscontiguousarray(values).view("u1"))
+        else:
+            h.update(hash_pandas_object(Series(values), index=False).to_numpy())
+    return h.hexdigest()
+
+
+class ResultCache(object):
+    """Result Cache
+
+    An opt-in, size bounded LRU cache of indicator results in front of the
+    DataFrame Extension, df.ta.rsi() or df.ta(kind="rsi"). An entry is keyed
+    by the indicator, the fingerprints of its source columns, like close,
+    and its arguments bound by name with the defaults of the indicator's
+    signature, so rsi(14) and rsi(length=14, scalar=None) are the same call.
+    Repeated calls on an unchanged DataFrame return a copy of the cached
+    result, while any change to the sources is a new key. Calls without
+    sources are not cached. When a directory is given, the least recently
+    used entries are spilled to it instead of being dropped.
+
+    >>> with ta.ResultCache(maxsize=256) as cache:
+    >>>     df.ta.rsi(14); df.ta(kind="rsi", length=14)
+    >>> cache.stats()
+    >>> # Or
+    >>> ta.set_cache(ta.ResultCache(maxsize=256, directory="ta_cache"))
+
+    Args:
+        maxsize (int): Number of results kept in memory. Default: 128
+        directory (str): Where to spill the evicted results. Default: None
+    """
+
+    def __init__(self, maxsize: int = 128, directory: str = None):
+        self.maxsize = int(maxsize) if maxsize and maxsize > 0 else 128
+        self.directory = directory
+        self.hits = self.misses = self.disk_hits = self.spilled = 0
+        self._entries = OrderedDict()  # key: (result, fingerprints)
+        self._disk = {}                # key: (file, kind, fingerprints)
+        self._lock = RLock()
+        self._previous = None
+        if directory is not None:
+            makedirs(directory, exist_ok=True)
+
+    def __enter__(self):
+        self._previous = set_cache(self)
+        return self
+
+    def __exit__(self, *args):
+        set_cache(self._previous)
+        self._previous = None
+
+    def __len__(self):
+        return len(self._entries) + len(self._disk)
+
+    def __repr__(self):
+        return f"ResultCache(maxsize={self.maxsize}, size={len(self._entries)}, hits={self.hits}, misses={self.misses})"
+
+    @staticmethod
+    def key(kind: str, sources: dict, params: dict) -> tuple:
+        """Returns the key of an indicator call or None when a parameter
+        is not hashable. sources maps a source name to its fingerprint."""
+        params = tuple(sorted((k, v) for k, v in params.items() if v is not None))
+        try:
+            hash(params)
+        except TypeError:
+            return None
+        return (kind, tuple(sorted(sources.items())), params)
+
+    def get(self, key: tuple):
+        """Returns a copy of the cached result of key or None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy(self._entries[key][0])
+            if key in self._disk:
+                file, _, fingerprints = self._disk.pop(key)
+                with open(file, "rb") as f:
+                    result = load(f)
+                remove(file)
+                self.hits += 1
+                self.disk_hits += 1
+                self._store(key, result, fingerprints)
+                return _copy(result)
+            self.misses += 1
+
+    def put(self, key: tuple, result) -> None:
+        """Caches a copy of result under key."""
+        if not isinstance(result, (Series, DataFrame)): return
+        with self._lock:
+            self._store(key, _copy(result), frozenset(v for _, v in key[1]))
+
+    def _store(self, key, result, fingerprints) -> None:
+        self._entries[key] = (result, fingerprints)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            old_key, (old, old_fingerprints) = self._entries.popitem(last=False)
+            if self.directory is not None:
+                file = join(self.directory, f"{blake2b(repr(old_key).encode(), digest_size=16).hexdigest()}.pkl")
+                with open(file, "wb") as f:
+                    dump(old, f)
+                self._disk[old_key] = (file, old_key[0], old_fingerprints)
+                self.spilled += 1
+
+    def invalidate(self, df: DataFrame = None, kind: str = None) -> int:
+        """Removes the results computed from the columns of df and/or of the
+        indicator kind, or all of them when both are None. Returns the
+        number of removed results."""
+        fingerprints = None
+        if isinstance(df, DataFrame):
+            fingerprints = {fingerprint(df[c]) for c in df.columns if isinstance(df[c], Series)}
+
+        def stale(key, entry_fingerprints):
+            if kind is not None and key[0] != kind: return False
+            if fingerprints is not None and fingerprints.isdisjoint(entry_fingerprints): return False
+            return True
+
+        with self._lock:
+            keys = [k for k, (_, f) in self._entries.items() if stale(k, f)]
+            for k in keys:
+                del self._entries[k]
+            disk = [k for k, (_, _, f) in self._disk.items() if stale(k, f)]
+            for k in disk:
+                file = self._disk.pop(k)[0]
+                if exists(file): remove(file)
+        return len(keys) + len(disk)
+
+    def clear(self) -> None:
+        """Removes every result and resets the statistics."""
+        self.invalidate()
+        self.hits = self.misses = self.disk_hits = self.spilled = 0
+
+    def stats(self) -> dict:
+        """Returns the hit and miss statistics of the cache."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._entries),
+            "disk_hits": self.disk_hits,
+            "spilled": self.spilled,
+            "disk_size": len(self._disk),
+        }
+
+
+def get_cache() -> ResultCache:
+    """Returns the ResultCache set with set_cache() or None."""
+    return _active["cache"]
+
+
+def set_cache(cache: ResultCache = None) -> ResultCache:
+    """Sets the ResultCache of the DataFrame Extension. With None, results
+    are not cached. Returns the previous one."""
+    if cache is not None and not isinstance(cache, ResultCache):
+        raise TypeError("[X] The cache must be a ResultCache or None.")
+    previous, _active["cache"] = _active["cache"], cache
+    return previous
+
+
+def _copy(result):
+    """Copies a result with its name and category."""
+    copy = result.copy()
+    for attr in ["name", "category"]:
+        if attr in result.__dict__:
+            setattr(copy, attr, getattr(result, attr))
+    return copy
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+
+from numpy import asarray as npAsarray
+from numpy import empty as npEmpty
+from numpy import full as npFull
+from numpy import int64 as npInt64
+from numpy import NaN as npNaN
+from numpy import ndarray as npNdArray
+from numpy import zeros as npZeros
+
+from pandas_ta import Imports
+
+
+def get_engine(x: str = None) -> str:
+    """Returns the kernel engine: "numba" or "numpy". If None, it defaults to
+    "numba" when installed. Falls back to "numpy" when numba is not installed.
+    Raises a ValueError for any other engine."""
+    if x is None:
+        return "numba" if Imports["numba"] else "numpy"
+    engine = x.lower() if isinstance(x, str) else x
+    if engine == "numpy":
+        return engine
+    if engine == "numba":
+        return "numba" if Imports["numba"] else "numpy"
+    raise ValueError(f"Unknown engine: {x}. Use \"numba\" or \"numpy\".")
+
+
+def kernel(fn):
+    """Kernel Decorator
+
+    Wraps a function that loops over NumPy float64 arrays so it can either be
+    run as is ("numpy") or compiled with numba.njit ("numba"). Compilation is
+    lazy, it only happens on the first "numba" call, and is then reused.
+    Compiled kernels release the GIL, so they run in parallel in threads.
+
+    >>> @kernel
+    >>> def _cumsum(x):
+    >>>     ...
+    >>> _cumsum(x, engine="numpy")
+    """
+    compiled = {}
+
+    @wraps(fn)
+    def _kernel(*args, engine: str = None):
+        if get_engine(engine) == "numba":
+            if "numba" not in compiled:
+                from numba import njit
+                compiled["numba"] = njit(cache=True, error_model="numpy", nogil=True)(fn)
+            return compiled["numba"](*args)
+        return fn(*args)
+
+    return _kernel
+
+
+@kernel
+def _holt_winters(x, na, nb, nc):
+    m = x.size
+    y = npZeros(m)
+    last_a = last_v = 0.0
+    last_f = x[0]
+    for i in range(m):
+        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * x[i]
+        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
+        A = (1.0 - nc) * last_a + nc * (V - last_v)
+        y[i] = F + V + 0.5 * A
+        last_a, last_f, last_v = A, F, V
+    return y
+
+
+def holt_winters(x: npNdArray, na: float, nb: float, nc: float, engine: str = None) -> npNdArray:
+    """Holt-Winters Smoothing
+
+    The three-parameter Holt-Winters smoother of HWMA and HWC.
+        F[i] = (1-na) * (F[i-1] + V[i-1] + 0.5 * A[i-1]) + na * x[i]
+        V[i] = (1-nb) * (V[i-1] + A[i-1]) + nb * (F[i] - F[i-1])
+        A[i] = (1-nc) * A[i-1] + nc * (V[i] - V[i-1])
+        y[i] = F[i] + V[i] + 0.5 * A[i]
+    with F[-1] = x[0] and V[-1] = A[-1] = 0.
+
+    Args:
+        x (np.ndarray): The input values.
+        na (float): Smoothed series parameter.
+        nb (float): Trend parameter.
+        nc (float): Seasonality parameter.
+        engine (str): "numba" or "numpy". Default: None
+
+    Returns:
+        np.ndarray: y
+    """
+    x = npAsarray(x, dtype=float)
+    return _holt_winters(x, float(na), float(nb), float(nc), engine=engine)
+
+
+@kernel
+def _iir_filter(b, a, x, x0, y0):
+    m, nb, na = x.size, b.size, a.size
+    y = npZeros(m)
+    for n in range(m):
+        acc = b[0] * x[n]
+        for k in range(1, nb):
+            acc += b[k] * (x[n - k] if n >= k else x0[k - n - 1])
+        for k in range(1, na):
+            acc -= a[k] * (y[n - k] if n >= k else y0[k - n - 1])
+        y[n] = acc
+    return y
+
+
+def iir_filter(b, a, x: npNdArray, x0=None, y0=None, engine: str = None) -> npNdArray:
+    """IIR Filter
+
+    Evaluates the constant-coefficient difference equation
+        a[0]*y[n] = b[0]*x[n] + ... + b[M]*x[n-M] - a[1]*y[n-1] - ... - a[N]*y[n-N]
+    Ehlers' filters like the Super Smoother are of this form.
+
+    By default, it uses scipy.signal.lfilter when scipy is installed. Otherwise
+    or when an engine is given, it runs the loop kernel with that engine.
+
+    Args:
+        b (list, np.ndarray): Numerator (input) coefficients.
+        a (list, np.ndarray): Denominator (output) coefficients.
+        x (np.ndarray): The input values.
+        x0 (list, np.ndarray): Prior inputs, most recent first:
+            [x[-1], x[-2], ...]. Default: zeros
+        y0 (list, np.ndarray): Prior outputs, most recent first:
+            [y[-1], y[-2], ...]. Default: zeros
+        engine (str): "numba" or "numpy". Default: None
+
+    Returns:
+        np.ndarray: y
+    """
+    b, a = npAsarray(b, dtype=float), npAsarray(a, dtype=float)
+    x = npAsarray(x, dtype=float)
+    if a[0] != 1:
+        b, a = b / a[0], a / a[0]
+
+    _x0, _y0 = npZeros(max(b.size - 1, 1)), npZeros(max(a.size - 1, 1))
+    if x0 is not None:
+        x0 = npAsarray(x0, dtype=float)
+        _x0[:x0.size] = x0
+    if y0 is not None:
+        y0 = npAsarray(y0, dtype=float)
+        _y0[:y0.size] = y0
+
+    if engine is None and Imports["scipy"]:
+        from scipy.signal import lfilter, lfiltic
+        zi = lfiltic(b, a, _y0[:a.size - 1], _x0[:b.size - 1])
+        return lfilter(b, a, x, zi=zi)[0]
+
+    return _iir_filter(b, a, x, _x0, _y0, engine=engine)
+
+
+@kernel
+def _linear_recurrence(a, x, y0, start):
+    m = x.size
+    y = npFull(m, npNaN)
+    prev = y0
+    for i in range(start, m):
+        prev = a[i] * x[i] + (1 - a[i]) * prev
+        y[i] = prev
+    if start > 0:
+        y[start - 1] = y0
+    return y
+
+
+def linear_recurrence(a, x: npNdArray, y0: float = 0.0, start: int = 0, engine: str = None) -> npNdArray:
+    """Linear Recurrence
+
+    Evaluates the first-order time-varying recurrence
+        y[i] = a[i] * x[i] + (1 - a[i]) * y[i - 1]
+    for i >= start, where y[start - 1] = y0. Values before start - 1 are NaN.
+    Adaptive Moving Averages like KAMA and VIDYA are of this form.
+
+    When 'a' is a constant, it is evaluated with iir_filter. Otherwise it runs
+    the loop kernel with the selected engine.
+
+    Args:
+        a (float, np.ndarray): The smoothing coefficient(s).
+        x (np.ndarray): The input values.
+        y0 (float): The seed value y[start - 1]. Default: 0.0
+        start (int): Index of the first recurrence value. Default: 0
+        engine (str): "numba" or "numpy". Default: None
+
+    Returns:
+        np.ndarray: y
+    """
+    x = npAsarray(x, dtype=float)
+    start = int(start) if start and start > 0 else 0
+    if start > x.size: return npFull(x.size, npNaN)
+
+    if isinstance(a, (int, float)):
+        y = npFull(x.size, npNaN)
+        if start > 0: y[start - 1] = y0
+        y[start:] = iir_filter([a], [1, a - 1], x[start:], y0=[y0], engine=engine)
+        return y
+
+    return _linear_recurrence(npAsarray(a, dtype=float), x, float(y0), start, engine=engine)
+
+
+@kernel
+def _rolling_argmax(x, length):
+    m = x.size
+    result = npFull(m, npNaN)
+    deque = npEmpty(m, dtype=npInt64)  # Indices of decreasing values
+    head = tail = 0
+    last_nan = -length
+    for i in range(m):
+        if x[i] != x[i]:
+            head = tail = 0
+            last_nan = i
+        else:
+            while tail > head and x[deque[tail - 1]] <= x[i]:
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+            if deque[head] <= i - length:
+                head += 1
+        if i >= length - 1 and i - last_nan >= length:
+            result[i] = i - deque[head]
+    return result
+
+
+def rolling_argmax(x: npNdArray, length: int, engine: str = None) -> npNdArray:
+    """Rolling Arg Max
+
+    The number of bars since the highest value of each rolling window of
+    size length, the most recent one when tied. It is the equivalent of
+    x.rolling(length).apply(recent_maximum_index, raw=True) in O(n) with a
+    monotonic deque. Windows that are incomplete or contain a NaN are NaN.
+
+    Args:
+        x (np.ndarray): The input values.
+        length (int): The window size.
+        engine (str): "numba" or "numpy". Default: None
+
+    Returns:
+        np.ndarray: Bars since the window's highest value.
+    """
+    x = npAsarray(x, dtype=float)
+    return _rolling_argmax(x, int(length), engine=engine)
+
+
+def rolling_argmin(x: npNdArray, length: int, engine: str = None) -> npNdArray:
+    """Rolling Arg Min
+
+    The number of bars since the lowest value of each rolling window of
+    size length, the most recent one when tied. See rolling_argmax.
+
+    Args:
+        x (np.ndarray): The input values.
+        length (int): The window size.
+        engine (str): "numba" or "numpy". Default: None
+
+    Returns:
+        np.ndarray: Bars since the window's lowest value.
+    """
+    x = npAsarray(x, dtype=float)
+    return _rolling_argmax(-x, int(length), engine=engine)
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from functools import reduce
+from functools import lru_cache, reduce
 from math import floor as mfloor
 from operator import mul
 from sys import float_info as sflt
@@ -8,18 +8,28 @@ from typing import List, Optional, Tuple
 from numpy import ones, triu
 from numpy import all as npAll
 from numpy import append as npAppend
+from numpy import arange as npArange
 from numpy import array as npArray
+from numpy import convolve as npConvolve
 from numpy import corrcoef as npCorrcoef
+from numpy import cumsum as npCumsum
 from numpy import dot as npDot
 from numpy import fabs as npFabs
 from numpy import floor as npFloor
+from numpy import full as npFull
 from numpy import exp as npExp
 from numpy import log as npLog
+from numpy import maximum as npMaximum
+from numpy import mean as npMean
 from numpy import NaN as npNaN
 from numpy import ndarray as npNdArray
+from numpy import pi as npPi
 from numpy import seterr
+from numpy import sin as npSin
 from numpy import sqrt as npSqrt
+from numpy import where as npWhere
 from numpy import sum as npSum
+from numpy.lib.stride_tricks import sliding_window_view
 
 from pandas import DataFrame, Series
 
@@ -164,6 +174,59 @@ def pascals_triangle(n: int = None, **kwargs: dict) -> npNdArray:
     return triangle
 
 
+def rolling_mad(x: npNdArray, length: int, min_periods: int = None, chunk_size: int = None) -> npNdArray:
+    """Rolling Mean Absolute Deviation
+
+    The equivalent of
+        x.rolling(length, min_periods).apply(lambda w: fabs(w - w.mean()).mean())
+    The full windows are reduced in batches of chunk_size windows at a time so
+    the temporary arrays stay bounded on very long series.
+
+    Args:
+        x (np.ndarray): The input values.
+        length (int): The window size.
+        min_periods (int): Minimum size of the first windows. Default: length
+        chunk_size (int): Windows per batch. Default: 16384
+
+    Returns:
+        np.ndarray: The rolling MAD. Windows with a NaN are NaN.
+    """
+    x = npArray(x, dtype=float)
+    length = int(length)
+    min_periods = int(min_periods) if min_periods and min_periods > 0 else length
+    chunk_size = int(chunk_size) if chunk_size and chunk_size > 0 else 16384
+
+    m = x.size
+    result = npFull(m, npNaN)
+
+    # Partial windows
+    for i in range(max(min_periods, 1) - 1, min(length - 1, m)):
+        w = x[:i + 1]
+        result[i] = npFabs(w - w.mean()).mean()
+
+    if m < length: return result
+
+    windows = sliding_window_view(x, length)
+    for start in range(0, windows.shape[0], chunk_size):
+        w = windows[start:start + chunk_size]
+        mean = npMean(w, axis=1, keepdims=True)
+        result[start + length - 1:start + length - 1 + w.shape[0]] = npMean(npFabs(w - mean), axis=1)
+    return result
+
+
+def run_length(x: npNdArray) -> npNdArray:
+    """Run Length
+
+    Returns, for each position, the number of consecutive True values of the
+    boolean array x ending there. Computed in O(n) from cumulative sums.
+    [F, T, T, F, T] => [0, 1, 2, 0, 1]
+    """
+    x = npArray(x, dtype=bool)
+    count = npCumsum(x)
+    reset = npMaximum.accumulate(npWhere(x, 0, count))
+    return count - reset
+
+
 def symmetric_triangle(n: int = None, **kwargs: dict) -> Optional[List[int]]:
     """Symmetric Triangle with n >= 2
 
@@ -202,6 +265,49 @@ def weights(w: npNdArray):
     return _dot
 
 
+def weighted_window(x: npNdArray, w: npNdArray) -> npNdArray:
+    """Weighted Window
+
+    The rolling dot product of the weights w with each window of x, the
+    equivalent of x.rolling(w.size).apply(weights(w), raw=True) as a single
+    convolution. w[0] weighs the oldest value of the window. The first
+    w.size - 1 values are NaN.
+    """
+    x, w = npArray(x, dtype=float), npArray(w, dtype=float)
+    n = w.size
+    result = npFull(x.size, npNaN)
+    if 0 < n <= x.size:
+        result[n - 1:] = npConvolve(x, w[::-1], mode="valid")
+    return result
+
+
+@lru_cache(maxsize=None)
+def window_weights(kind: str, n: int) -> npNdArray:
+    """Window Weights
+
+    Returns the cached, read-only weight vector of size n for weighted_window.
+    kind: "fibonacci", "linear", "pascal", "sine" or "symmetric"
+    """
+    n = int(n)
+    if kind == "fibonacci":
+        w = fibonacci(n=n, weighted=True)
+    elif kind == "linear":
+        w = npArange(1, n + 1)
+    elif kind == "pascal":
+        w = pascals_triangle(n=n - 1, weighted=True)
+    elif kind == "sine":
+        sines = npSin(npArange(1, n + 1) * npPi / (n + 1))
+        w = sines / sines.sum()
+    elif kind == "symmetric":
+        w = symmetric_triangle(n, weighted=True)
+    else:
+        raise ValueError(f"Unknown window weights: {kind}")
+
+    w = npArray(w, dtype=float)
+    w.setflags(write=False)
+    return w
+
+
 def zero(x: Tuple[int, float]) -> Tuple[int, float]:
     """If the value is close to zero, then return zero. Otherwise return itself."""
     return 0 if abs(x) < sflt.epsilon else x
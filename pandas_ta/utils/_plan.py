@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+from contextvars import ContextVar
+from functools import wraps
+from inspect import signature
+from threading import local, RLock
+
+from pandas import DataFrame, Series
+
+# Accessor and Strategy kwargs that do not change an indicator's values
+_UNKEYED = ("append", "col_names", "col_numbers", "delimiter", "kind", "params", "prefix", "suffix", "timed", "verbose")
+
+# The active plan is local to each thread (and asyncio task), so concurrent
+# strategy() runs never see each other's plan. Threads of one run receive
+# their plan explicitly.
+_active = ContextVar("pandas_ta_plan", default=None)
+
+
+class StrategyPlan(object):
+    """Strategy Plan
+
+    Shares the intermediate computations of a Strategy run. Each call of a
+    @shared indicator, like ema, rsi or atr, is a node of a DAG keyed by the
+    function, its sources and its parameters. While the plan is active, a
+    node is evaluated once and dependents reuse it. For instance, atr is
+    computed once for atr, natr, adx, chop, aberration, ... with the same
+    length.
+
+    Sources are identified by the DataFrame and column they came from or by
+    the node that produced them. Dependents receive copies of the cached
+    results, so renaming or filling them does not alter the node. A plan is
+    only active in the thread that entered it; a thread that works for the
+    same run enters it too and tracks its own dependency edges.
+
+    The results and sources are kept until close(), which strategy() calls
+    when its run ends. A multiprocessing worker uses a plan per task, so
+    nothing outlives a task.
+
+    >>> with StrategyPlan(df.columns) as plan:
+    >>>     df.ta.natr(); df.ta.adx()
+    >>> plan.close()
+    >>> plan.hits, plan.misses
+
+    Args:
+        columns (list): The DataFrame columns that are sources of the run.
+            Default: None
+        token (str): Identifies the run. Default: None
+    """
+
+    def __init__(self, columns=None, token: str = None):
+        self.token = token
+        self.columns = set(columns) if columns is not None else set()
+        self.nodes = {}     # key: result
+        self.edges = {}     # key: set of dependent keys
+        self.hits = self.misses = 0
+        self._columns = {}  # (frame, column name): Series
+        self._alias = {}    # id(Series): source
+        self._refs = []     # Keep the sources alive so their ids are unique
+        self._local = local()
+        self._lock = RLock()
+
+    def close(self) -> None:
+        """Releases the cached results and sources. The statistics are
+        kept."""
+        with self._lock:
+            self.nodes.clear()
+            self.edges.clear()
+            self._columns.clear()
+            self._alias.clear()
+            self._refs.clear()
+
+    def __enter__(self):
+        if not hasattr(self._local, "tokens"):
+            self._local.tokens = []
+        self._local.tokens.append(_active.set(self))
+        return self
+
+    def __exit__(self, *args):
+        _active.reset(self._local.tokens.pop())
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __repr__(self):
+        return f"StrategyPlan(nodes={len(self.nodes)}, hits={self.hits}, misses={self.misses})"
+
+    @property
+    def _stack(self) -> list:
+        """The nodes being evaluated by the current thread."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def column(self, df: DataFrame, name: str) -> Series:
+        """Returns the same Series for a source column of df during the
+        run. Columns of different DataFrames are different sources."""
+        if name not in self.columns:
+            return df[name]
+        frame = id(df)
+        with self._lock:
+            if (frame, name) not in self._columns:
+                self._columns[(frame, name)] = df[name]
+                self._alias[id(self._columns[(frame, name)])] = ("column", frame, name)
+                self._refs.append(df)  # Keep the frame alive so its id is unique
+            return self._columns[(frame, name)]
+
+    def _source(self, x):
+        """The hashable identity of an argument or None."""
+        if isinstance(x, Series):
+            with self._lock:
+                if id(x) not in self._alias:
+                    self._alias[id(x)] = ("series", id(x))
+                    self._refs.append(x)
+                return self._alias[id(x)]
+        try:
+            hash(x)
+        except TypeError:
+            return None
+        return ("value", x)
+
+    def key(self, fn, args: tuple, kwargs: dict):
+        """Returns the node key of fn(*args, **kwargs) or None when it has
+        arguments that can not be keyed. Omitted arguments take the defaults
+        of fn's signature."""
+        kwargs = {k: v for k, v in kwargs.items() if k not in _UNKEYED}
+        try:
+            bound = _signature(fn).bind(*args, **kwargs)
+        except TypeError:
+            return None
+        bound.apply_defaults()
+
+        params = []
+        for name, value in bound.arguments.items():
+            if isinstance(value, dict):  # **kwargs
+                items = [(k, self._source(v)) for k, v in sorted(value.items())]
+                if any(v is None for _, v in items): return None
+                params.append((name, tuple(items)))
+            else:
+                source = self._source(value)
+                if source is None: return None
+                params.append((name, source))
+        return (fn.__module__, fn.__qualname__, tuple(params))
+
+    def evaluate(self, fn, args: tuple, kwargs: dict):
+        """Evaluates the node of fn(*args, **kwargs) once and returns a copy."""
+        key = self.key(fn, args, kwargs)
+        if key is None:
+            return fn(*args, **kwargs)
+
+        stack = self._stack
+        with self._lock:
+            if len(stack):
+                self.edges.setdefault(key, set()).add(stack[-1])
+            cached = key in self.nodes
+            if cached:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if not cached:
+            # Evaluated outside the lock. Threads that miss the same node
+            # at once compute the same result, the last one is kept.
+            stack.append(key)
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                stack.pop()
+            with self._lock:
+                self.nodes[key] = result
+
+        result = self.nodes[key]
+        if not isinstance(result, (Series, DataFrame)):
+            return result
+
+        copy = result.copy()
+        for attr in ["name", "category"]:
+            if attr in result.__dict__:
+                setattr(copy, attr, getattr(result, attr))
+        with self._lock:
+            self._alias[id(copy)] = ("node", key)
+            self._refs.append(copy)
+        return copy
+
+
+def active_plan():
+    """Returns the StrategyPlan active in this thread or None."""
+    return _active.get()
+
+
+def shared(fn):
+    """Shared Decorator
+
+    Marks an indicator whose results can be shared by its dependents during
+    a StrategyPlan. Without an active plan, it calls the indicator as is.
+    Calls are keyed with the defaults of the indicator's signature.
+
+    >>> @shared
+    >>> def ema(close, length=None, offset=None, **kwargs):
+    """
+    @wraps(fn)
+    def _shared(*args, **kwargs):
+        plan = _active.get()
+        if plan is None:
+            return fn(*args, **kwargs)
+        return plan.evaluate(fn, args, kwargs)
+
+    return _shared
+
+
+_signatures = {}
+def _signature(fn):
+    if fn not in _signatures:
+        _signatures[fn] = signature(fn)
+    return _signatures[fn]
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+from gc import collect
+from multiprocessing import shared_memory
+from pickle import dumps, loads
+
+from numpy import dtype as npDtype
+from numpy import ndarray as npNdArray
+from pandas import DataFrame, Series, concat
+
+_attached = {"name": None, "shm": None, "df": None}  # The last attached frame
+
+
+class SharedFrame(object):
+    """Shared Frame
+
+    Publishes the numeric columns of a DataFrame once in shared memory, so
+    that worker processes can rebuild it as zero-copy views instead of
+    receiving a pickled copy with every task. Columns of the same dtype are
+    stored as one contiguous (columns, rows) block, followed by the pickled
+    index. The spec is small enough to be sent with every task.
+
+    >>> with SharedFrame(df) as frame:
+    >>>     pool.map(partial(worker, frame.spec), tasks)
+    >>> # In the worker
+    >>> df = SharedFrame.attach(spec)
+
+    Args:
+        df (pd.DataFrame): The DataFrame to publish.
+    """
+
+    def __init__(self, df: DataFrame):
+        groups, offset = [], 0
+        for dtype in df.dtypes.unique():
+            if dtype.kind not in "biuf": continue
+            columns = [c for c in df.columns if df[c].dtype == dtype]
+            nbytes = dtype.itemsize * len(columns) * df.shape[0]
+            groups.append((columns, dtype.str, offset))
+            offset += -(-nbytes // 64) * 64  # Aligned
+        index = dumps(df.index)
+
+        self.shm = shared_memory.SharedMemory(create=True, size=offset + len(index))
+        self.shm.buf[offset:offset + len(index)] = index
+        for columns, dtype, start in groups:
+            block = npNdArray((len(columns), df.shape[0]), dtype=dtype, buffer=self.shm.buf, offset=start)
+            for i, column in enumerate(columns):
+                block[i] = df[column].to_numpy()
+            del block
+
+        self.spec = {
+            "name": self.shm.name,
+            "groups": groups,
+            "index": (offset, len(index)),
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """Releases the shared memory."""
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    @staticmethod
+    def attach(spec: dict) -> DataFrame:
+        """Returns the published DataFrame as read-only views of the shared
+        memory. Columns that were not numeric are not published. A process
+        keeps the last frame it attached, so tasks of the same run share
+        it."""
+        name = spec["name"]
+        if _attached["name"] == name:
+            return _attached["df"]
+        _detach()
+
+        # Workers share the resource tracker of the publisher, which unlinks
+        # the memory on close()
+        shm = shared_memory.SharedMemory(name=name)
+        offset, nbytes = spec["index"]
+        index = loads(shm.buf[offset:offset + nbytes])
+
+        frames = []
+        for columns, dtype, offset in spec["groups"]:
+            block = npNdArray((len(columns), index.size), dtype=npDtype(dtype), buffer=shm.buf, offset=offset)
+            block.flags.writeable = False
+            frames.append(DataFrame(block.T, index=index, columns=columns, copy=False))
+        if len(frames) == 0:
+            df = DataFrame(index=index)
+        else:
+            df = concat(frames, axis=1, copy=False) if len(frames) > 1 else frames[0]
+
+        _attached.update(name=name, shm=shm, df=df)
+        return df
+
+
+def _detach():
+    """Releases the last attached frame of this process. Its views must be
+    released before the shared memory can be closed."""
+    shm = _attached["shm"]
+    _attached.update(name=None, shm=None, df=None)
+    if shm is not None:
+        collect()  # DataFrames can hold their blocks in reference cycles
+        shm.close()
+
+
+class PackedResult(object):
+    """Packed Result
+
+    An indicator result packed by pack_result as compact NumPy arrays. The
+    type tells packed results apart from results that are returned as is.
+
+    Args:
+        kind (str): "series" or "frame".
+        names (list): The name of the Series or the DataFrame columns.
+        arrays (list): The values of each column.
+        attrs (dict): The "name" and "category" attributes of the result.
+    """
+    __slots__ = ["kind", "names", "arrays", "attrs"]
+
+    def __init__(self, kind: str, names: list, arrays: list, attrs: dict):
+        self.kind, self.names, self.arrays, self.attrs = kind, names, arrays, attrs
+
+
+def pack_result(result, index):
+    """Packs an indicator result that shares the index as a PackedResult.
+    Otherwise it returns the result."""
+    if not isinstance(result, (Series, DataFrame)) or not result.index.equals(index):
+        return result
+    attrs = {k: result.__dict__[k] for k in ["name", "category"] if k in result.__dict__}
+    if isinstance(result, Series):
+        return PackedResult("series", [result.name], [result.to_numpy()], attrs)
+    arrays = [result.iloc[:, i].to_numpy() for i in range(result.shape[1])]
+    return PackedResult("frame", list(result.columns), arrays, attrs)
+
+
+def unpack_result(packed, index):
+    """Rebuilds a result packed by pack_result with the given index."""
+    if not isinstance(packed, PackedResult):
+        return packed
+    if packed.kind == "series":
+        result = Series(packed.arrays[0], index=index, name=packed.names[0])
+    else:
+        result = DataFrame(dict(enumerate(packed.arrays)), index=index)
+        result.columns = packed.names
+    for k, v in packed.attrs.items():
+        setattr(result, k, v)
+    return result
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from .true_range import true_range
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import get_drift, get_offset, shared, verify_series
 
 
+@shared
 def atr(high, low, close, length=None, mamode=None, drift=None, offset=None, **kwargs):
     """Indicator: Average True Range (ATR)"""
     # Validate arguments
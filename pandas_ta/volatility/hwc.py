@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
+from numpy import concatenate as npConcatenate
 from numpy import sqrt as npSqrt
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_engine, get_offset, holt_winters, iir_filter, verify_series
 
 
 def hwc(close, na=None, nb=None, nc=None, nd=None, scalar=None, channel_eval=None, offset=None, **kwargs):
@@ -15,47 +16,27 @@ def hwc(close, na=None, nb=None, nc=None, nd=None, scalar=None, channel_eval=Non
     channel_eval = bool(channel_eval) if channel_eval and channel_eval else False
     close = verify_series(close)
     offset = get_offset(offset)
+    engine = get_engine(kwargs.pop("engine", None))
 
     # Calculate Result
-    last_a = last_v = last_var = 0
-    last_f = last_price = last_result = close[0]
-    lower, result, upper = [], [], []
-    chan_pct_width, chan_width = [], []
-
-    m = close.size
-    for i in range(m):
-        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close[i]
-        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
-        A = (1.0 - nc) * last_a + nc * (V - last_v)
-        result.append((F + V + 0.5 * A))
-
-        var = (1.0 - nd) * last_var + nd * (last_price - last_result) * (last_price - last_result)
-        stddev = npSqrt(last_var)
-        upper.append(result[i] + scalar * stddev)
-        lower.append(result[i] - scalar * stddev)
+    x = close.to_numpy(dtype=float)
+    result = holt_winters(x, na, nb, nc, engine=engine)
 
-        if channel_eval:
-            # channel width
-            chan_width.append(upper[i] - lower[i])
-            # channel percentage price position
-            chan_pct_width.append((close[i] - lower[i]) / (upper[i] - lower[i]))
-            # print('channel_eval (width|percentageWidth):', chan_width[i], chan_pct_width[i])
-
-        # update values
-        last_price = close[i]
-        last_a = A
-        last_f = F
-        last_v = V
-        last_var = var
-        last_result = result[i]
+    # var[i] = (1 - nd) * var[i - 1] + nd * (close[i - 1] - hwma[i - 1]) ** 2
+    diff = npConcatenate(([0.0], x[:-1] - result[:-1]))
+    var = iir_filter([1], [1, -(1.0 - nd)], nd * diff * diff, engine=engine)
+    stddev = npSqrt(npConcatenate(([0.0], var[:-1])))
+    upper = result + scalar * stddev
+    lower = result - scalar * stddev
 
     # Aggregate
     hwc = Series(result, index=close.index)
     hwc_upper = Series(upper, index=close.index)
     hwc_lower = Series(lower, index=close.index)
     if channel_eval:
-        hwc_width = Series(chan_width, index=close.index)
-        hwc_pctwidth = Series(chan_pct_width, index=close.index)
+        # channel width and percentage price position
+        hwc_width = Series(upper - lower, index=close.index)
+        hwc_pctwidth = Series((x - lower) / (upper - lower), index=close.index)
 
     # Offset
     if offset != 0:
@@ -148,6 +129,8 @@ Args:
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
+    engine (str, optional): "numba" or "numpy". Default: "numba" if
+        installed, otherwise "numpy"
 Returns:
     pd.DataFrame: HW-MID, HW-UPPER, HW-LOWER columns.
 """
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from numpy import NaN as npNaN
 from pandas import DataFrame, concat
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import get_drift, get_offset, non_zero_range, shared, verify_series
 
 
+@shared
 def true_range(high, low, close, drift=None, offset=None, **kwargs):
     """Indicator: True Range"""
     # Validate arguments
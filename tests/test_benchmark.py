@@ -0,0 +1,195 @@
+# Kernel Benchmarks
+# Times the kernel based indicators for each engine on a longer Series and
+# prints a speed table. The engines must return the same results, and the
+# results of the indicators before they ran on kernels, frozen every 250th
+# row of the data in data/benchmark.csv.
+from os import environ
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from warnings import catch_warnings, simplefilter
+
+from .config import sample_data
+from .context import pandas_ta
+
+from unittest import TestCase
+import pandas.testing as pdt
+from pandas import concat, DataFrame, date_range, read_csv
+from pandas.errors import PerformanceWarning
+
+# Benchmark Parameters
+engines = ["numpy", "numba"]
+tiles = 10  # Length of the benchmark data in multiples of sample_data
+frozen = read_csv("data/benchmark.csv", index_col=0)  # Pre-kernel results
+sma_factor = 10  # Max run time of a vectorized indicator in multiples of sma's
+speed_check = "PANDAS_TA_SPEED_CHECK" in environ  # Opt-in, run times are noisy
+timed = True
+
+
+class TestBenchmark(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        data = sample_data[["open", "high", "low", "close", "volume"]]
+        cls.data = concat([data] * tiles, ignore_index=True)
+        cls.open = cls.data["open"]
+        cls.high = cls.data["high"]
+        cls.low = cls.data["low"]
+        cls.close = cls.data["close"]
+        cls.volume = cls.data["volume"]
+        cls.speed_test = DataFrame(columns=engines)
+
+    @classmethod
+    def tearDownClass(cls):
+        if timed:
+            cls.speed_test.index.name = "Indicator"
+            print(f"\n[i] Total Datapoints: {cls.data.shape[0]}")
+            print(cls.speed_test.sort_index())
+        del cls.data
+
+    def setUp(self): pass
+    def tearDown(self): pass
+
+    def assertFrozen(self, result):
+        """Asserts that the columns of result match their frozen values."""
+        result = result.to_frame() if not isinstance(result, DataFrame) else result
+        columns = [c for c in result.columns if c in frozen.columns]
+        self.assertGreater(len(columns), 0)
+        pdt.assert_frame_equal(
+            result[columns].iloc[frozen.index], frozen[columns],
+            check_index_type=False, check_names=False, rtol=1e-9, atol=1e-9
+        )
+
+    def benchmark(self, name: str, fn):
+        """Runs fn(engine=engine) for each engine after a warm up run (JIT
+        compilation), records the run times in the speed table and checks the
+        results against their frozen values."""
+        results, times = [], []
+        for engine in engines:
+            fn(engine=engine)
+            stime = perf_counter()
+            results.append(fn(engine=engine))
+            times.append(perf_counter() - stime)
+        self.speed_test.loc[name] = times
+
+        for result in results:
+            self.assertFrozen(result)
+        for result in results[1:]:
+            if isinstance(result, DataFrame):
+                pdt.assert_frame_equal(results[0], result)
+            else:
+                pdt.assert_series_equal(results[0], result)
+
+    def vectorized(self, name: str, fn):
+        """Times fn() against sma() on the same data, records the run time in
+        the speed table and checks the result against its frozen values. With
+        speed_check, it fails if fn() is over sma_factor times slower."""
+        times = []
+        for f in [lambda: pandas_ta.sma(self.close), fn]:
+            f()
+            stime = perf_counter()
+            result = f()
+            times.append(perf_counter() - stime)
+        self.speed_test.loc[name] = [times[1]] * len(engines)
+
+        self.assertFrozen(result)
+        if speed_check:
+            self.assertLess(times[1], sma_factor * times[0])
+
+    def test_all_strategy(self):
+        """Times the AllStrategy without and with the StrategyPlan, which
+        shares intermediate computations like the ema, rsi and atr."""
+        data = self.data.copy()
+        data.index = date_range("2000-01-01", periods=data.shape[0], freq="H")
+        warmup = sample_data.copy()
+        warmup.ta.cores = 0
+        warmup.ta.strategy(pandas_ta.AllStrategy, plan=False)
+
+        results, times = [], []
+        for plan in [False, True]:
+            df = data.copy()
+            df.ta.cores = 0
+            stime = perf_counter()
+            df.ta.strategy(pandas_ta.AllStrategy, plan=plan)
+            times.append(perf_counter() - stime)
+            results.append(df)
+
+        if timed:
+            print(f"\n[i] AllStrategy: {times[0]:.3f}s, with StrategyPlan: {times[1]:.3f}s")
+        pdt.assert_frame_equal(results[0], results[1])
+
+    def test_batch_append(self):
+        """Times a strategy that appends 300 columns one at a time and in one
+        batch, and records their peak memory. The batch must not fragment the
+        DataFrame."""
+        lengths = range(2, 102)
+        custom = pandas_ta.Strategy("300 Columns", [
+            {"kind": kind, "length": length} for kind in ["sma", "ema", "rsi"] for length in lengths
+        ])
+
+        results, times, peaks = [], [], []
+        for batch in [False, True]:
+            df = self.data.copy()
+            df.ta.cores = 0
+            start()
+            with catch_warnings(record=True) as warnings:
+                simplefilter("always", PerformanceWarning)
+                stime = perf_counter()
+                df.ta.strategy(custom, batch=batch)
+                times.append(perf_counter() - stime)
+            peaks.append(get_traced_memory()[1] / 2 ** 20)
+            stop()
+            results.append(df)
+        fragmented = [w for w in warnings if issubclass(w.category, PerformanceWarning)]
+        self.assertEqual(len(fragmented), 0)
+
+        if timed:
+            print(f"\n[i] 300 Columns: {times[0]:.3f}s {peaks[0]:.0f}MB, batched: {times[1]:.3f}s {peaks[1]:.0f}MB")
+        self.assertEqual(results[1].shape[1], 305)
+        pdt.assert_frame_equal(results[0], results[1])
+
+    def test_alma(self):
+        self.vectorized("alma", lambda: pandas_ta.alma(self.close))
+
+    def test_aroon(self):
+        self.benchmark("aroon", lambda **kwargs: pandas_ta.aroon(self.high, self.low, **kwargs))
+
+    def test_ebsw(self):
+        self.benchmark("ebsw", lambda **kwargs: pandas_ta.ebsw(self.close, **kwargs))
+
+    def test_ha(self):
+        self.benchmark("ha", lambda **kwargs: pandas_ta.ha(self.open, self.high, self.low, self.close, **kwargs))
+
+    def test_hilo(self):
+        self.benchmark("hilo", lambda **kwargs: pandas_ta.hilo(self.high, self.low, self.close, **kwargs))
+
+    def test_hwc(self):
+        self.benchmark("hwc", lambda **kwargs: pandas_ta.hwc(self.close, **kwargs))
+
+    def test_hwma(self):
+        self.benchmark("hwma", lambda **kwargs: pandas_ta.hwma(self.close, **kwargs))
+
+    def test_kama(self):
+        self.benchmark("kama", lambda **kwargs: pandas_ta.kama(self.close, **kwargs))
+
+    def test_linreg(self):
+        self.benchmark("linreg", lambda **kwargs: pandas_ta.linreg(self.close, variants=True, **kwargs))
+
+    def test_mcgd(self):
+        self.benchmark("mcgd", lambda **kwargs: pandas_ta.mcgd(self.close, **kwargs))
+
+    def test_psar(self):
+        self.benchmark("psar", lambda **kwargs: pandas_ta.psar(self.high, self.low, **kwargs))
+
+    def test_qqe(self):
+        self.benchmark("qqe", lambda **kwargs: pandas_ta.qqe(self.close, **kwargs))
+
+    def test_rsx(self):
+        self.benchmark("rsx", lambda **kwargs: pandas_ta.rsx(self.close, **kwargs))
+
+    def test_ssf(self):
+        self.benchmark("ssf", lambda **kwargs: pandas_ta.ssf(self.close, **kwargs))
+
+    def test_supertrend(self):
+        self.benchmark("supertrend", lambda **kwargs: pandas_ta.supertrend(self.high, self.low, self.close, **kwargs))
+
+    def test_vidya(self):
+        self.benchmark("vidya", lambda **kwargs: pandas_ta.vidya(self.close, **kwargs))
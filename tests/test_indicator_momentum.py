@@ -305,6 +305,14 @@ class TestMomentum(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "RSX_14")
 
+    def test_rsx_engine(self):
+        result = pandas_ta.rsx(self.close, engine="numpy")
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "RSX_14")
+
+        expected = pandas_ta.rsx(self.close, engine="numba")
+        pdt.assert_series_equal(result, expected)
+
     def test_rvgi(self):
         result = pandas_ta.rvgi(self.open, self.high, self.low, self.close)
         self.assertIsInstance(result, DataFrame)
@@ -376,6 +384,12 @@ class TestMomentum(TestCase):
         result = pandas_ta.td_seq(self.close)
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "TD_SEQ")
+        pdt.assert_index_equal(result.index, self.close.index)
+
+        close = Series([1, 2, 3, 4, 5, 6, 7, 8, 7, 6, 5, 4, 3, 2, 1, 2])
+        result = pandas_ta.td_seq(close)
+        self.assertEqual(list(result["TD_SEQ_UPa"].fillna(0)), [0, 0, 0, 0, 1, 2, 3, 4, 5, 0, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(list(result["TD_SEQ_DNa"].fillna(0)), [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 5, 6])
 
     def test_trix(self):
         result = pandas_ta.trix(self.close)
@@ -2,6 +2,9 @@ from .config import CORRELATION, CORRELATION_THRESHOLD, error_analysis, sample_d
 from .context import pandas_ta
 
 from unittest import TestCase
+from numpy import arange, sqrt
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.random import default_rng
 import pandas.testing as pdt
 from pandas import DataFrame, Series
 
@@ -109,6 +112,14 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "HWMA_0.2_0.1_0.1")
 
+    def test_hwma_engine(self):
+        result = pandas_ta.hwma(self.close, engine="numpy")
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "HWMA_0.2_0.1_0.1")
+
+        expected = pandas_ta.hwma(self.close, engine="numba")
+        pdt.assert_series_equal(result, expected)
+
     def test_kama(self):
         result = pandas_ta.kama(self.close)
         self.assertIsInstance(result, Series)
@@ -151,6 +162,37 @@ class TestOverlap(TestCase):
             except Exception as ex:
                 error_analysis(result, CORRELATION, ex)
 
+    def test_linreg_engine(self):
+        result = pandas_ta.linreg(self.close, r=True, engine="numpy")
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "LRr_14")
+
+        expected = pandas_ta.linreg(self.close, r=True, engine="numba")
+        pdt.assert_series_equal(result, expected)
+
+    def test_linreg_drift(self):
+        # Long, high-priced series: the rolling sums must not drift away
+        # from the sums of each window
+        length = 12
+        close = Series(30000 + default_rng(0).normal(0, 5, 200_000).cumsum())
+        x = arange(1, length + 1)
+        x_sum, x2_sum = x.sum(), (x * x).sum()
+        divisor = length * x2_sum - x_sum * x_sum
+
+        windows = sliding_window_view(close.to_numpy(), length)
+        y_sum, xy_sum = windows.sum(axis=1), (windows * x).sum(axis=1)
+        y2_sum = (windows * windows).sum(axis=1)
+        m = (length * xy_sum - x_sum * y_sum) / divisor
+        b = (y_sum * x2_sum - x_sum * xy_sum) / divisor
+        r = (length * xy_sum - x_sum * y_sum) / sqrt(divisor * (length * y2_sum - y_sum * y_sum))
+
+        for engine in ["numpy", "numba"]:
+            result = pandas_ta.linreg(close, length=length, engine=engine)
+            self.assertLess(abs(result.to_numpy()[length - 1:] - (m * (length - 1) + b)).max(), 1e-8)
+
+            result = pandas_ta.linreg(close, length=length, r=True, engine=engine)
+            self.assertLess(abs(result.to_numpy()[length - 1:] - r).max(), 1e-6)
+
     def test_linreg_intercept(self):
         result = pandas_ta.linreg(self.close, intercept=True)
         self.assertIsInstance(result, Series)
@@ -186,6 +228,17 @@ class TestOverlap(TestCase):
             except Exception as ex:
                 error_analysis(result, CORRELATION, ex)
 
+    def test_linreg_variants(self):
+        result = pandas_ta.linreg(self.close, variants=True)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "LR_14")
+        self.assertEqual(list(result.columns), ["LR_14", "LRm_14", "LRb_14", "LRa_14", "LRr_14", "TSF_14"])
+
+        pdt.assert_series_equal(result["LR_14"], pandas_ta.linreg(self.close))
+        pdt.assert_series_equal(result["LRm_14"], pandas_ta.linreg(self.close, slope=True))
+        pdt.assert_series_equal(result["LRr_14"], pandas_ta.linreg(self.close, r=True))
+        pdt.assert_series_equal(result["TSF_14"], pandas_ta.linreg(self.close, tsf=True), check_names=False)
+
     def test_ma(self):
         result = pandas_ta.ma()
         self.assertIsInstance(result, list)
@@ -204,6 +257,24 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "MCGD_10")
 
+    def test_mcgd_gaps(self):
+        # The former rolling(2) implementation restarts after a NaN
+        close = self.close.iloc[:600].copy()
+        close.iloc[[0, 100, 250, 251, 400]] = None
+
+        def mcg_(series):
+            denom = 1 * 10 * (series.iloc[1] / series.iloc[0]) ** 4
+            series.iloc[1] = series.iloc[0] + (series.iloc[1] - series.iloc[0]) / denom
+            return series.iloc[1]
+
+        expected = close.copy().rolling(2, min_periods=2).apply(mcg_, raw=False)
+        expected.iloc[0] = close.iloc[0]
+
+        for engine in ["numpy", "numba"]:
+            result = pandas_ta.mcgd(close, engine=engine)
+            self.assertEqual(result.isna().sum(), 9)
+            pdt.assert_series_equal(result, expected, check_names=False)
+
     def test_midpoint(self):
         result = pandas_ta.midpoint(self.close)
         self.assertIsInstance(result, Series)
@@ -288,6 +359,14 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "SUPERT_7_3.0")
 
+    def test_supertrend_engine(self):
+        result = pandas_ta.supertrend(self.high, self.low, self.close, engine="numpy")
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "SUPERT_7_3.0")
+
+        expected = pandas_ta.supertrend(self.high, self.low, self.close, engine="numba")
+        pdt.assert_frame_equal(result, expected)
+
     def test_t3(self):
         result = pandas_ta.t3(self.close)
         self.assertIsInstance(result, Series)
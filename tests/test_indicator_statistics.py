@@ -49,6 +49,14 @@ class TestStatistics(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "MAD_30")
 
+    def test_mad_chunk_size(self):
+        result = pandas_ta.mad(self.close, chunk_size=100)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "MAD_30")
+
+        expected = self.close.rolling(30).apply(lambda x: abs(x - x.mean()).mean(), raw=True)
+        pdt.assert_series_equal(result, expected, check_names=False)
+
     def test_median(self):
         result = pandas_ta.median(self.close)
         self.assertIsInstance(result, Series)
@@ -76,6 +76,14 @@ class TestTrend(TestCase):
             except Exception as ex:
                 error_analysis(result.iloc[:, 1], CORRELATION, ex, newline=False)
 
+    def test_aroon_engine(self):
+        result = pandas_ta.aroon(self.high, self.low, engine="numpy")
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "AROON_14")
+
+        expected = pandas_ta.aroon(self.high, self.low, engine="numba")
+        pdt.assert_frame_equal(result, expected)
+
     def test_aroon_osc(self):
         result = pandas_ta.aroon(self.high, self.low)
 
@@ -126,6 +134,10 @@ class TestTrend(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "SDEC_3")
 
+        close = Series([5, 4, 3, 3, 2, 1, 0, 1])
+        result = pandas_ta.decreasing(close, length=3, strict=True)
+        self.assertEqual(list(result), [0, 0, 1, 0, 0, 1, 1, 0])
+
     def test_dpo(self):
         result = pandas_ta.dpo(self.close)
         self.assertIsInstance(result, Series)
@@ -140,6 +152,10 @@ class TestTrend(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "SINC_3")
 
+        close = Series([1, 2, 3, 3, 4, 5, 6, 5])
+        result = pandas_ta.increasing(close, length=3, strict=True)
+        self.assertEqual(list(result), [0, 0, 1, 0, 0, 1, 1, 0])
+
     def test_long_run(self):
         result = pandas_ta.long_run(self.close, self.open)
         self.assertIsInstance(result, Series)
@@ -165,6 +181,14 @@ class TestTrend(TestCase):
             except Exception as ex:
                 error_analysis(psar, CORRELATION, ex)
 
+    def test_psar_engine(self):
+        result = pandas_ta.psar(self.high, self.low, engine="numpy")
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "PSAR_0.02_0.2")
+
+        expected = pandas_ta.psar(self.high, self.low, engine="numba")
+        pdt.assert_frame_equal(result, expected)
+
     def test_qstick(self):
         result = pandas_ta.qstick(self.open, self.close)
         self.assertIsInstance(result, Series)
@@ -96,6 +96,23 @@ class TestVolatility(TestCase):
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "DC_20_5")
 
+    def test_hwc(self):
+        result = pandas_ta.hwc(self.close)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "hwc")
+
+        result = pandas_ta.hwc(self.close, channel_eval=True)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(list(result.columns), ["HW-MID", "HW-UPPER", "HW-LOWER", "HW-WIDTH", "HW-PCTW"])
+
+    def test_hwc_engine(self):
+        result = pandas_ta.hwc(self.close, engine="numpy")
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "hwc")
+
+        expected = pandas_ta.hwc(self.close, engine="numba")
+        pdt.assert_frame_equal(result, expected)
+
     def test_kc(self):
         result = pandas_ta.kc(self.high, self.low, self.close)
         self.assertIsInstance(result, DataFrame)
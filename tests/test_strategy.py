@@ -1,5 +1,6 @@
 # Must run seperately from the rest of the tests
 # in order to successfully run
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import cpu_count
 from time import perf_counter
 
@@ -8,6 +9,7 @@ from .context import pandas_ta
 
 from unittest import skip, skipUnless, TestCase
 from pandas import DataFrame
+import pandas.testing as pdt
 
 # Strategy Testing Parameters
 cores = cpu_count()
@@ -256,3 +258,166 @@ class TestStrategyMethods(TestCase):
         )
         self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
         self.data.ta.cores = cores
+
+    def test_batch(self):
+        self.category = "Batch"
+
+        custom = pandas_ta.Strategy("Batch", [
+            {"kind": "sma", "length": 50}, {"kind": "bbands"},
+            {"kind": "log_return", "cumulative": True},
+            {"kind": "ema", "close": "CUMLOGRET_1", "length": 5, "suffix": "CLR"},
+        ])
+
+        ohlcv = self.data[["open", "high", "low", "close", "volume"]]
+        expected = ohlcv.copy()
+        expected.ta.cores = 0
+        expected.ta.strategy(custom, batch=False)
+
+        # The chained ema flushes the batch to read CUMLOGRET_1
+        result = ohlcv.copy()
+        result.ta.cores = 0
+        result.ta.strategy(custom, verbose=verbose)
+        pdt.assert_frame_equal(result, expected)
+        self.assertIsNone(result.ta._batch)
+        self.assertLess(result._mgr.nblocks, expected._mgr.nblocks)
+
+        custom = pandas_ta.Strategy("Batch", custom.ta[:2])
+        self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
+
+    def test_concurrent_plans(self):
+        """Strategies run on different DataFrames at once in threads each
+        use their own plan and sources."""
+        self.category = "Concurrent Plans"
+        custom = pandas_ta.Strategy("Concurrent Plans", [
+            {"kind": kind} for kind in ["sma", "rsi", "atr", "natr", "adx", "macd"]
+        ])
+        frames = [self.data[["open", "high", "low", "close"]] * (i + 1) for i in range(8)]
+
+        def run(df, plan):
+            df = df.copy()
+            df.ta.cores = 0
+            df.ta.strategy(custom, plan=plan)
+            return df
+
+        expected = [run(df, False) for df in frames]
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(run, frames, [True] * len(frames)))
+        for result, df in zip(results, expected):
+            pdt.assert_frame_equal(result, df)
+
+        self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
+
+    def test_threads(self):
+        self.category = "Threads"
+        self.assertNotIn("fisher", pandas_ta.ThreadSafe)
+        self.assertIn("ema", pandas_ta.ThreadSafe)
+
+        custom = pandas_ta.Strategy("Threads", [
+            {"kind": "sma", "length": 50}, {"kind": "bbands"}, {"kind": "macd"},
+            {"kind": "fisher"}, {"kind": "ichimoku"}, {"kind": "atr"}, {"kind": "natr"},
+            {"kind": "rsi", "prefix": "A"},
+        ])
+
+        expected = self.data.copy()
+        expected.ta.cores = 0
+        expected.ta.strategy(custom)
+
+        result = self.data.copy()
+        result.ta.strategy(custom, executor="threads", plan=True, verbose=verbose)
+        pdt.assert_frame_equal(result, expected)
+
+        # Indicators of columns made by the strategy run after them
+        chained = pandas_ta.Strategy("Chained Threads", [
+            {"kind": "ema", "close": "CUMLOGRET_1", "length": 5, "suffix": "CLR"},
+            {"kind": "log_return", "cumulative": True},
+            {"kind": "ema", "close": "CUMLOGRET_1", "length": 10, "suffix": "CLR"},
+            {"kind": "rsi"},
+        ])
+        expected = self.data.copy()
+        expected.ta.cores = 0
+        expected.ta.strategy(chained)
+        result = self.data.copy()
+        result.ta.strategy(chained, executor="threads", verbose=verbose)
+        self.assertIn("EMA_10_CLR", result.columns)
+        pdt.assert_frame_equal(result, expected)
+
+        # Two threaded strategies on different DataFrames at once
+        frames = [self.data.copy(), self.data[["open", "high", "low", "close", "volume"]] * 3]
+        expected = []
+        for df in frames:
+            df = df.copy()
+            df.ta.cores = 0
+            df.ta.strategy(custom)
+            expected.append(df)
+        with ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(df.ta.strategy, custom, executor="threads", plan=True) for df in frames]
+            [future.result() for future in futures]
+        for result, df in zip(frames, expected):
+            pdt.assert_frame_equal(result, df)
+
+        self.data.ta.strategy("momentum", executor="threads", verbose=verbose, timed=strategy_timed)
+
+    def test_worker_pool(self):
+        self.category = "Worker Pool"
+
+        custom = pandas_ta.Strategy("Worker Pool", [
+            {"kind": "sma", "length": 50}, {"kind": "bbands"}, {"kind": "macd"},
+            {"kind": "rsi", "prefix": "A"},
+        ])
+
+        expected = self.data.copy()
+        expected.ta.cores = 0
+        expected.ta.strategy(custom)
+
+        with pandas_ta.WorkerPool() as executor:
+            self.assertIs(pandas_ta.get_executor(), executor)
+            for shared_memory in [False, True, False]:
+                result = self.data.copy()
+                result.ta.strategy(custom, shared_memory=shared_memory, verbose=verbose)
+                pdt.assert_frame_equal(result, expected)
+            self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
+
+        self.assertIsNone(pandas_ta.get_executor())
+        self.assertIsNone(executor.pool)
+        self.assertRaises(TypeError, pandas_ta.set_executor, "threads")
+
+    def test_shared_memory(self):
+        self.category = "Shared Memory"
+
+        custom = pandas_ta.Strategy("Shared Memory", [
+            {"kind": "sma", "length": 50}, {"kind": "bbands"}, {"kind": "macd"},
+            {"kind": "ichimoku"}, {"kind": "vwap"}, {"kind": "rsi", "prefix": "A"},
+        ])
+
+        expected = self.data.copy()
+        expected.ta.cores = 0
+        expected.ta.strategy(custom)
+
+        result = self.data.copy()
+        result.ta.strategy(custom, shared_memory=True, verbose=verbose, timed=strategy_timed)
+        pdt.assert_frame_equal(result, expected)
+
+        self.data.ta.strategy(custom, shared_memory=True, verbose=verbose, timed=strategy_timed)
+
+    def test_shared_plan(self):
+        self.category = "Shared Plan"
+
+        shared_ta = [
+            {"kind": "atr"}, {"kind": "natr"}, {"kind": "adx"}, {"kind": "chop"},
+            {"kind": "rsi"}, {"kind": "stochrsi"}, {"kind": "qqe"},
+            {"kind": "macd"}, {"kind": "dema"}, {"kind": "tema"}, {"kind": "t3"},
+        ]
+        custom = pandas_ta.Strategy("Shared Computations", shared_ta)
+
+        expected = self.data.copy()
+        expected.ta.cores = 0
+        expected.ta.strategy(custom, plan=False)
+
+        cores = self.data.ta.cores
+        for cores_ in [0, cores]:
+            result = self.data.copy()
+            result.ta.cores = cores_
+            result.ta.strategy(custom, plan=True, verbose=verbose, timed=strategy_timed)
+            pdt.assert_frame_equal(result, expected)
+
+        self.data.ta.strategy(custom, plan=True, verbose=verbose, timed=strategy_timed)
@@ -0,0 +1,313 @@
+from .config import sample_data
+from .context import pandas_ta
+
+from json import dumps, loads
+from unittest import TestCase
+import pandas.testing as pdt
+from numpy import NaN as npNaN
+from pandas import DataFrame, Series
+
+# Number of bars streamed after from_history()
+tail = 200
+
+
+class TestStream(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = sample_data
+        cls.data.columns = cls.data.columns.str.lower()
+        cls.open = cls.data["open"]
+        cls.high = cls.data["high"]
+        cls.low = cls.data["low"]
+        cls.close = cls.data["close"]
+        if "volume" in cls.data.columns:
+            cls.volume = cls.data["volume"]
+        cls.stream = pandas_ta.stream
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.open
+        del cls.high
+        del cls.low
+        del cls.close
+        if hasattr(cls, "volume"):
+            del cls.volume
+        del cls.data
+
+    def setUp(self): pass
+    def tearDown(self): pass
+
+    def streamed(self, expected, stream, from_history, *sources):
+        """Asserts that a stream from the first bar and a stream seeded with
+        from_history() both output the batch result bar for bar."""
+        result = stream.extend(*sources)
+        if isinstance(expected, DataFrame):
+            result.columns = expected.columns
+            pdt.assert_frame_equal(result, expected, check_exact=True, check_names=False)
+        else:
+            pdt.assert_series_equal(result, expected, check_exact=True, check_names=False)
+
+        seeded = from_history(*[x.iloc[:-tail] for x in sources])
+        result = seeded.extend(*[x.iloc[-tail:] for x in sources])
+        if isinstance(expected, DataFrame):
+            result.columns = expected.columns
+            pdt.assert_frame_equal(result, expected.iloc[-tail:], check_exact=True, check_names=False)
+        else:
+            pdt.assert_series_equal(result, expected.iloc[-tail:], check_exact=True, check_names=False)
+        self.assertEqual(stream.name, expected.name)
+
+
+    def test_ewm(self):
+        close = self.close.copy()
+        close.iloc[[3, 50, 51]] = npNaN
+        for kwargs in [{"com": 4.5, "adjust": False}, {"com": 13, "min_periods": 14}]:
+            ewm = self.stream.EWM(**kwargs)
+            expected = close.ewm(**kwargs).mean()
+            pdt.assert_series_equal(ewm.extend(close), expected, check_exact=True, check_names=False)
+
+            seeded = self.stream.EWM(**kwargs).seed(close.iloc[:-tail], expected.iloc[:-tail])
+            result = seeded.extend(close.iloc[-tail:])
+            pdt.assert_series_equal(result, expected.iloc[-tail:], check_exact=True, check_names=False)
+
+    def test_ema(self):
+        expected = pandas_ta.ema(self.close, 10)
+        self.streamed(expected, self.stream.EMA(10), lambda x: self.stream.EMA.from_history(x, 10), self.close)
+
+        expected = pandas_ta.ema(self.close, 10, sma=False, adjust=True)
+        stream = self.stream.EMA(10, sma=False, adjust=True)
+        from_history = lambda x: self.stream.EMA.from_history(x, 10, sma=False, adjust=True)
+        self.streamed(expected, stream, from_history, self.close)
+
+        close = self.close.copy()
+        close.iloc[[3, 50, 51]] = npNaN
+        expected = pandas_ta.ema(close, 10)
+        self.streamed(expected, self.stream.EMA(10), lambda x: self.stream.EMA.from_history(x, 10), close)
+
+        stream = self.stream.EMA(3)
+        self.assertEqual(stream.extend(Series([1.0, 2.0, 3.0, 4.0])).tolist()[2:], [2.0, 3.0])
+        self.assertEqual(stream.update(5.0), 4.0)
+
+    def test_rma(self):
+        expected = pandas_ta.rma(self.close, 14)
+        self.streamed(expected, self.stream.RMA(14), lambda x: self.stream.RMA.from_history(x, 14), self.close)
+
+    def test_dema(self):
+        expected = pandas_ta.dema(self.close, 10)
+        self.streamed(expected, self.stream.DEMA(10), lambda x: self.stream.DEMA.from_history(x, 10), self.close)
+
+    def test_tema(self):
+        expected = pandas_ta.tema(self.close, 10)
+        self.streamed(expected, self.stream.TEMA(10), lambda x: self.stream.TEMA.from_history(x, 10), self.close)
+
+    def test_t3(self):
+        expected = pandas_ta.t3(self.close, 10)
+        self.streamed(expected, self.stream.T3(10), lambda x: self.stream.T3.from_history(x, 10), self.close)
+
+    def test_ma(self):
+        self.assertIsInstance(self.stream.ma("rma", 14), self.stream.RMA)
+        self.assertIsInstance(self.stream.ma("unknown", 14), self.stream.EMA)
+        self.assertRaises(ValueError, self.stream.ma, "hma", 14)
+
+    def test_rsi(self):
+        expected = pandas_ta.rsi(self.close, 14)
+        self.streamed(expected, self.stream.RSI(14), lambda x: self.stream.RSI.from_history(x, 14), self.close)
+
+        expected = pandas_ta.rsi(self.close, 10, scalar=50, drift=2)
+        stream = self.stream.RSI(10, scalar=50, drift=2)
+        from_history = lambda x: self.stream.RSI.from_history(x, 10, scalar=50, drift=2)
+        self.streamed(expected, stream, from_history, self.close)
+
+    def test_kdj(self):
+        expected = pandas_ta.kdj(self.high, self.low, self.close)
+        from_history = lambda *x: self.stream.KDJ.from_history(*x)
+        self.streamed(expected, self.stream.KDJ(), from_history, self.high, self.low, self.close)
+
+    def test_adx(self):
+        sources = self.high, self.low, self.close
+        expected = pandas_ta.adx(*sources)
+        self.streamed(expected, self.stream.ADX(), lambda *x: self.stream.ADX.from_history(*x), *sources)
+
+        expected = pandas_ta.adx(*sources, length=10, lensig=7, mamode="ema", drift=2)
+        stream = self.stream.ADX(10, lensig=7, mamode="ema", drift=2)
+        from_history = lambda *x: self.stream.ADX.from_history(*x, 10, lensig=7, mamode="ema", drift=2)
+        self.streamed(expected, stream, from_history, *sources)
+
+    def test_true_range(self):
+        sources = self.high, self.low, self.close
+        expected = pandas_ta.true_range(*sources)
+        self.streamed(expected, self.stream.TrueRange(), lambda *x: self.stream.TrueRange.from_history(*x), *sources)
+
+    def test_atr(self):
+        sources = self.high, self.low, self.close
+        expected = pandas_ta.atr(*sources)
+        self.streamed(expected, self.stream.ATR(), lambda *x: self.stream.ATR.from_history(*x), *sources)
+
+        expected = pandas_ta.atr(*sources, length=10, mamode="ema", percent=True)
+        stream = self.stream.ATR(10, mamode="ema", percent=True)
+        from_history = lambda *x: self.stream.ATR.from_history(*x, 10, mamode="ema", percent=True)
+        self.streamed(expected, stream, from_history, *sources)
+
+    def test_natr(self):
+        sources = self.high, self.low, self.close
+        expected = pandas_ta.natr(*sources)
+        self.streamed(expected, self.stream.NATR(), lambda *x: self.stream.NATR.from_history(*x), *sources)
+
+    def test_update(self):
+        """Streams fed one OHLC bar at a time after from_history() on the
+        head of the DataFrame."""
+        history, bars = self.data.iloc[:-tail], self.data.iloc[-tail:]
+        rsi = self.stream.RSI.from_history(history["close"])
+        adx = self.stream.ADX.from_history(history["high"], history["low"], history["close"])
+        for _, bar in bars.iterrows():
+            rsi.update(bar["close"])
+            adx.update(bar["high"], bar["low"], bar["close"])
+        self.assertEqual(rsi.value, pandas_ta.rsi(self.close).iloc[-1])
+        self.assertEqual(adx.value, tuple(pandas_ta.adx(self.high, self.low, self.close).iloc[-1]))
+
+    def test_ring_buffer(self):
+        ring = self.stream.RingBuffer(3)
+        self.assertTrue(all(x != x for x in [ring.push(1.0), ring.push(2.0), ring.push(3.0)]))
+        self.assertEqual(ring.push(4.0), 1.0)
+        self.assertEqual(list(ring), [2.0, 3.0, 4.0])
+
+    def test_sma(self):
+        close = self.close.copy()
+        close.iloc[[3, 50, 51]] = npNaN
+        close.iloc[100:120] = close.iloc[100]
+        for kwargs in [{"length": 10}, {"length": 20, "min_periods": 5}]:
+            expected = pandas_ta.sma(close, **kwargs)
+            from_history = lambda x: self.stream.SMA.from_history(x, **kwargs)
+            self.streamed(expected, self.stream.SMA(**kwargs), from_history, close)
+
+    def test_variance(self):
+        close = self.close.copy()
+        close.iloc[[3, 50, 51]] = npNaN
+        close.iloc[100:120] = close.iloc[100]
+        for kwargs in [{"length": 30}, {"length": 10, "ddof": 1}, {"length": 20, "min_periods": 5}]:
+            expected = pandas_ta.variance(close, **kwargs)
+            from_history = lambda x: self.stream.VARIANCE.from_history(x, **kwargs)
+            self.streamed(expected, self.stream.VARIANCE(**kwargs), from_history, close)
+
+    def test_stdev(self):
+        expected = pandas_ta.stdev(self.close)
+        self.streamed(expected, self.stream.STDEV(), lambda x: self.stream.STDEV.from_history(x), self.close)
+
+    def test_zscore(self):
+        expected = pandas_ta.zscore(self.close, 20, std=2)
+        from_history = lambda x: self.stream.ZSCORE.from_history(x, 20, std=2)
+        self.streamed(expected, self.stream.ZSCORE(20, std=2), from_history, self.close)
+
+    def test_bbands(self):
+        for kwargs in [{}, {"length": 20, "std": 1.5, "mamode": "ema", "ddof": 1}]:
+            expected = pandas_ta.bbands(self.close, **kwargs)
+            from_history = lambda x: self.stream.BBANDS.from_history(x, **kwargs)
+            self.streamed(expected, self.stream.BBANDS(**kwargs), from_history, self.close)
+
+    def test_cmf(self):
+        sources = self.high, self.low, self.close, self.volume
+        expected = pandas_ta.cmf(*sources)
+        self.streamed(expected, self.stream.CMF(), lambda *x: self.stream.CMF.from_history(*x), *sources)
+
+        # Without zero close - open ranges, where the batch cmf adds epsilon
+        # to every bar instead of one
+        open_ = self.open.where(self.open != self.close, self.open + 0.01)
+        expected = pandas_ta.cmf(*sources, open_=open_, length=10)
+        from_history = lambda *x: self.stream.CMF.from_history(*x, length=10)
+        self.streamed(expected, self.stream.CMF(10), from_history, *sources, open_)
+
+    def test_rolling_max_min(self):
+        close = self.close.copy()
+        close.iloc[[3, 50, 51]] = npNaN
+        close.iloc[100:120] = close.iloc[100]
+        for length, min_periods in [(1, None), (14, None), (20, 5)]:
+            rolling = close.rolling(length, min_periods=min_periods if min_periods else length)
+            for stream, expected in [
+                (self.stream.RollingMax, rolling.max().rename(f"MAX_{length}")),
+                (self.stream.RollingMin, rolling.min().rename(f"MIN_{length}")),
+            ]:
+                from_history = lambda x: stream.from_history(x, length, min_periods)
+                self.streamed(expected, stream(length, min_periods), from_history, close)
+
+    def test_midpoint(self):
+        expected = pandas_ta.midpoint(self.close, 10)
+        self.streamed(expected, self.stream.MIDPOINT(10), lambda x: self.stream.MIDPOINT.from_history(x, 10), self.close)
+
+    def test_midprice(self):
+        expected = pandas_ta.midprice(self.high, self.low, 10, min_periods=5)
+        stream = self.stream.MIDPRICE(10, min_periods=5)
+        from_history = lambda *x: self.stream.MIDPRICE.from_history(*x, 10, min_periods=5)
+        self.streamed(expected, stream, from_history, self.high, self.low)
+
+    def test_donchian(self):
+        expected = pandas_ta.donchian(self.high, self.low, 10, 15)
+        from_history = lambda *x: self.stream.DONCHIAN.from_history(*x, 10, 15)
+        self.streamed(expected, self.stream.DONCHIAN(10, 15), from_history, self.high, self.low)
+
+    def test_ichimoku(self):
+        ichimoku, span = pandas_ta.ichimoku(self.high, self.low, self.close)
+        expected = ichimoku.iloc[:, :4]
+        expected.name = ichimoku.name
+        from_history = lambda *x: self.stream.ICHIMOKU.from_history(*x)
+        self.streamed(expected, self.stream.ICHIMOKU(), from_history, self.high, self.low, self.close)
+
+        stream = self.stream.ICHIMOKU.from_history(self.high, self.low, self.close)
+        self.assertEqual(stream.spans, list(span.itertuples(index=False, name=None)))
+
+    def test_stoch(self):
+        sources = self.high, self.low, self.close
+        expected = pandas_ta.stoch(*sources)
+        self.streamed(expected, self.stream.STOCH(), lambda *x: self.stream.STOCH.from_history(*x), *sources)
+
+    def test_willr(self):
+        sources = self.high, self.low, self.close
+        expected = pandas_ta.willr(*sources)
+        self.streamed(expected, self.stream.WILLR(), lambda *x: self.stream.WILLR.from_history(*x), *sources)
+
+    def test_fisher(self):
+        for kwargs in [{}, {"length": 5, "signal": 3}]:
+            expected = pandas_ta.fisher(self.high, self.low, **kwargs)
+            from_history = lambda *x: self.stream.FISHER.from_history(*x, **kwargs)
+            self.streamed(expected, self.stream.FISHER(**kwargs), from_history, self.high, self.low)
+
+    def test_psar(self):
+        expected = pandas_ta.psar(self.high, self.low, self.close)
+        from_history = lambda *x: self.stream.PSAR.from_history(*x)
+        self.streamed(expected, self.stream.PSAR(), from_history, self.high, self.low, self.close)
+
+        expected = pandas_ta.psar(self.high, self.low, af=0.01, max_af=0.1)
+        from_history = lambda *x: self.stream.PSAR.from_history(*x, af=0.01, max_af=0.1)
+        self.streamed(expected, self.stream.PSAR(0.01, 0.1), from_history, self.high, self.low)
+
+    def test_supertrend(self):
+        sources = self.high, self.low, self.close
+        expected = pandas_ta.supertrend(*sources)
+        from_history = lambda *x: self.stream.SUPERTREND.from_history(*x)
+        self.streamed(expected, self.stream.SUPERTREND(), from_history, *sources)
+
+    def test_state(self):
+        """Streams resumed from a json state() after a restart output the
+        batch result."""
+        sources = self.high, self.low, self.close
+        for stream, expected in [
+            (self.stream.PSAR, pandas_ta.psar(*sources)),
+            (self.stream.SUPERTREND, pandas_ta.supertrend(*sources)),
+            (self.stream.ADX, pandas_ta.adx(*sources)),
+            (self.stream.ICHIMOKU, pandas_ta.ichimoku(*sources)[0].iloc[:, :4]),
+            (self.stream.STOCH, pandas_ta.stoch(*sources)),
+        ]:
+            snapshot = dumps(stream.from_history(*[x.iloc[:-tail] for x in sources]).state())
+            resumed = stream().restore(loads(snapshot))
+            result = resumed.extend(*[x.iloc[-tail:] for x in sources])
+            result.columns = expected.columns
+            pdt.assert_frame_equal(result, expected.iloc[-tail:], check_exact=True)
+
+        sources = self.high, self.low, self.close, self.volume
+        cmf = self.stream.CMF.from_history(*[x.iloc[:-tail] for x in sources])
+        resumed = self.stream.CMF().restore(loads(dumps(cmf.state())))
+        result = resumed.extend(*[x.iloc[-tail:] for x in sources])
+        pdt.assert_series_equal(result, pandas_ta.cmf(*sources).iloc[-tail:], check_exact=True)
+        self.assertEqual(cmf.extend(*[x.iloc[-tail:] for x in sources]).tolist(), result.tolist())
+
+        rsi = self.stream.RSI.from_history(self.close.iloc[:-tail])
+        resumed = self.stream.RSI().restore(loads(dumps(rsi.state())))
+        self.assertEqual(resumed.extend(self.close.iloc[-tail:]).tolist(), rsi.extend(self.close.iloc[-tail:]).tolist())
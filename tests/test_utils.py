@@ -1,12 +1,15 @@
 from .config import sample_data
 from .context import pandas_ta
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest import skip, TestCase
 from unittest.mock import patch
+from tempfile import TemporaryDirectory
 
 import numpy as np
 import numpy.testing as npt
 from pandas import DataFrame, Series
+import pandas.testing as pdt
 from pandas.api.types import is_datetime64_ns_dtype, is_datetime64tz_dtype
 
 
@@ -222,6 +225,42 @@ class TestUtilities(TestCase):
         self.assertIsInstance(result["t"], float)
         self.assertIsInstance(result["line"], Series)
 
+    def test_holt_winters(self):
+        x = np.array([1.0, 2.0, 3.0])
+
+        for engine in ["numpy", "numba"]:
+            result = self.utils.holt_winters(x, 0.5, 0.5, 0.5, engine=engine)
+            self.assertIsInstance(result, np.ndarray)
+            npt.assert_allclose(result, [1.0, 1.8125, 3.17578125])
+
+    def test_iir_filter(self):
+        x = np.array([1.0, 2.0, 3.0, 4.0])
+        b, a = [0.5, 0.5], [1, -0.5]
+
+        for engine in [None, "numpy", "numba"]:
+            result = self.utils.iir_filter(b, a, x, engine=engine)
+            self.assertIsInstance(result, np.ndarray)
+            npt.assert_allclose(result, [0.5, 1.75, 3.375, 5.1875])
+
+            result = self.utils.iir_filter(b, a, x, x0=[2], y0=[4], engine=engine)
+            npt.assert_allclose(result, [3.5, 3.25, 4.125, 5.5625])
+
+    def test_linear_recurrence(self):
+        x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        a = np.array([0.5, 0.5, 0.25, 0.25, 1.0])
+
+        result = self.utils.linear_recurrence(a, x, y0=0, start=2)
+        self.assertIsInstance(result, np.ndarray)
+        npt.assert_array_equal(result, [np.nan, 0.0, 0.75, 1.5625, 5.0])
+
+        for engine in ["numpy", "numba"]:
+            result = self.utils.linear_recurrence(a, x, y0=1, engine=engine)
+            npt.assert_array_equal(result, [1.0, 1.5, 1.875, 2.40625, 5.0])
+
+        # Constant coefficient
+        result = self.utils.linear_recurrence(0.5, x, y0=1, start=1)
+        npt.assert_allclose(result, [1.0, 1.5, 2.25, 3.125, 4.0625])
+
     def test_log_geometric_mean(self):
         returns = pandas_ta.percent_return(self.data.close)
         result = self.utils.log_geometric_mean(returns)
@@ -260,6 +299,154 @@ class TestUtilities(TestCase):
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True), array_5w)
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True, inverse=True), array_5iw)
 
+    def test_result_cache(self):
+        df = self.data[["open", "high", "low", "close", "volume"]].copy()
+        self.assertRaises(TypeError, self.utils.set_cache, {})
+
+        with TemporaryDirectory() as directory:
+            with self.utils.ResultCache(maxsize=2, directory=directory) as cache:
+                self.assertIs(self.utils.get_cache(), cache)
+                expected = df.ta.rsi(length=14)
+                result = df.ta(kind="rsi", length=14)
+                pdt.assert_series_equal(result, expected)
+                self.assertEqual(result.name, expected.name)
+                self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+                # Hits still append and are copies
+                result = df.ta.rsi(14, append=True)
+                self.assertIn("RSI_14", df.columns)
+                result.iloc[-1] = 0
+                pdt.assert_series_equal(df.ta.rsi(length=14), expected)
+
+                # Least recently used results are spilled
+                df.ta.bbands(); df.ta.macd()
+                self.assertEqual(cache.spilled, 1)
+                pdt.assert_series_equal(df.ta.rsi(length=14), expected)
+                self.assertEqual(cache.stats()["disk_hits"], 1)
+
+                # New data is a new key
+                df.loc[df.index[-1], "close"] += 1
+                self.assertNotEqual(df.ta.rsi(length=14).iloc[-1], expected.iloc[-1])
+
+                # Spelled-out defaults of the indicator are the same call
+                hits = cache.hits
+                df.ta.dpo(); df.ta.dpo(centered=True); df.ta.dpo(length=None)
+                self.assertEqual(cache.hits, hits + 2)
+
+                # Results of one DataFrame are never returned for another
+                other = df[["open", "high", "low", "close", "volume"]].iloc[:100].copy()
+                self.assertIs(df.ta.long_run(), df)
+                self.assertIs(other.ta.long_run(append=True), other)
+                self.assertEqual(other.shape, (100, 5))
+                self.assertEqual(other.ta.rsi(length=14).shape, (100,))
+
+                self.assertEqual(cache.invalidate(df, kind="dpo"), 1)
+                self.assertEqual(cache.invalidate(df), 1)
+                self.assertEqual(cache.invalidate(kind="bbands"), 1)
+                cache.clear()
+                self.assertEqual(len(cache), 0)
+                self.assertEqual(cache.stats()["hits"], 0)
+            self.assertIsNone(self.utils.get_cache())
+
+    def test_rolling_argmax(self):
+        x = np.array([1.0, 3.0, 2.0, 3.0, np.nan, 1.0, 2.0, 0.0])
+
+        for engine in ["numpy", "numba"]:
+            result = self.utils.rolling_argmax(x, 3, engine=engine)
+            self.assertIsInstance(result, np.ndarray)
+            npt.assert_array_equal(result, [np.nan, np.nan, 1, 0, np.nan, np.nan, np.nan, 1])
+
+            result = self.utils.rolling_argmin(x, 3, engine=engine)
+            npt.assert_array_equal(result, [np.nan, np.nan, 2, 1, np.nan, np.nan, np.nan, 0])
+
+        expected = Series(self.data.high).rolling(15).apply(self.utils.recent_maximum_index, raw=True)
+        npt.assert_array_equal(self.utils.rolling_argmax(self.data.high, 15), expected.values)
+
+    def test_rolling_mad(self):
+        x = np.array([1.0, 2.0, 4.0, 8.0, np.nan, 1.0, 3.0])
+
+        result = self.utils.rolling_mad(x, 3, chunk_size=2)
+        self.assertIsInstance(result, np.ndarray)
+        npt.assert_allclose(result, [np.nan, np.nan, 10 / 9, 20 / 9, np.nan, np.nan, np.nan])
+
+        result = self.utils.rolling_mad(x, 3, min_periods=2)
+        npt.assert_allclose(result[:3], [np.nan, 0.5, 10 / 9])
+
+    def test_run_length(self):
+        result = self.utils.run_length([False, True, True, False, True])
+        self.assertIsInstance(result, np.ndarray)
+        npt.assert_array_equal(result, [0, 1, 2, 0, 1])
+
+        npt.assert_array_equal(self.utils.run_length([True, True, True]), [1, 2, 3])
+        npt.assert_array_equal(self.utils.run_length([]), [])
+
+    def test_shared_frame(self):
+        df = self.data.copy()
+        df["flag"] = df["close"] > df["open"]
+        df["name"] = "x"
+
+        with self.utils.SharedFrame(df) as frame:
+            result = self.utils.SharedFrame.attach(frame.spec)
+            self.assertIsInstance(result, DataFrame)
+            self.assertNotIn("name", result.columns)  # Not numeric
+            pdt.assert_frame_equal(result[df.columns[:-1]], df[df.columns[:-1]])
+            self.assertFalse(result["close"].to_numpy().flags.writeable)
+
+            shm = pandas_ta.utils._shared_memory._attached["shm"]
+            del result
+            pandas_ta.utils._shared_memory._detach()  # Closes the views
+            self.assertIsNone(shm.buf)
+
+        result = pandas_ta.bbands(df["close"])
+        packed = self.utils.pack_result(result, df.index)
+        self.assertIsInstance(packed, self.utils.PackedResult)
+        unpacked = self.utils.unpack_result(packed, df.index)
+        pdt.assert_frame_equal(unpacked, result)
+        self.assertEqual(unpacked.name, result.name)
+        self.assertEqual(unpacked.category, result.category)
+
+        result = pandas_ta.rsi(df["close"]).iloc[10:]
+        self.assertIs(self.utils.pack_result(result, df.index), result)
+
+        result = ("a", "tuple", "of", "four")  # Not a packed result
+        self.assertIs(self.utils.unpack_result(result, df.index), result)
+
+    def test_strategy_plan(self):
+        high, low, close = self.data["high"], self.data["low"], self.data["close"]
+        expected = pandas_ta.adx(high, low, close), pandas_ta.atr(high, low, close)
+
+        with self.utils.StrategyPlan() as plan:
+            self.assertIs(self.utils.active_plan(), plan)
+            with ThreadPoolExecutor(1) as pool:  # Only active in this thread
+                self.assertIsNone(pool.submit(self.utils.active_plan).result())
+            result = pandas_ta.adx(high, low, close), pandas_ta.atr(high, low, close, length=14)
+        self.assertIsNone(self.utils.active_plan())
+
+        # adx's atr is reused
+        self.assertEqual(plan.misses, len(plan))
+        self.assertEqual(plan.hits, 1)
+        self.assertEqual(len(plan.edges), 2)  # atr's true_range and rma
+        pdt.assert_frame_equal(result[0], expected[0])
+        pdt.assert_series_equal(result[1], expected[1])
+
+        # Results are copies of the nodes
+        result[1].iloc[-1] = 0
+        with plan:
+            pdt.assert_series_equal(pandas_ta.atr(high, low, close, length=14), expected[1])
+
+        # The same column of another DataFrame is another source
+        df = self.data[["high", "low", "close"]] * 2
+        with self.utils.StrategyPlan(["high", "low", "close"]) as plan:
+            a = pandas_ta.atr(*[plan.column(self.data, c) for c in ["high", "low", "close"]])
+            b = pandas_ta.atr(*[plan.column(df, c) for c in ["high", "low", "close"]])
+        self.assertEqual(plan.hits, 0)
+        pdt.assert_series_equal(b, 2 * a)
+
+        # close() releases the results and sources, not the statistics
+        plan.close()
+        self.assertEqual((len(plan), len(plan.edges), len(plan._refs)), (0, 0, 0))
+        self.assertEqual(plan.misses, 6)
+
     def test_symmetric_triangle(self):
         npt.assert_array_equal(self.utils.symmetric_triangle(), np.array([1,1]))
         npt.assert_array_equal(self.utils.symmetric_triangle(weighted=True), np.array([0.5, 0.5]))
@@ -274,6 +461,30 @@ class TestUtilities(TestCase):
         npt.assert_array_equal(self.utils.symmetric_triangle(n=5), array_5)
         npt.assert_array_equal(self.utils.symmetric_triangle(n=5, weighted=True), array_5w)
 
+    def test_weighted_window(self):
+        x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        w = np.array([1.0, 2.0, 3.0])
+        expected = Series(x).rolling(3).apply(self.utils.weights(w), raw=True)
+
+        result = self.utils.weighted_window(x, w)
+        self.assertIsInstance(result, np.ndarray)
+        npt.assert_allclose(result, expected.values)
+
+        result = self.utils.weighted_window(x[:2], w)
+        self.assertTrue(np.isnan(result).all())
+
+    def test_window_weights(self):
+        result = self.utils.window_weights("linear", 4)
+        npt.assert_array_equal(result, np.array([1.0, 2.0, 3.0, 4.0]))
+        self.assertFalse(result.flags.writeable)
+        self.assertIs(self.utils.window_weights("linear", 4), result)
+
+        npt.assert_array_equal(self.utils.window_weights("symmetric", 4), self.utils.symmetric_triangle(n=4, weighted=True))
+        npt.assert_array_equal(self.utils.window_weights("pascal", 5), self.utils.pascals_triangle(n=4, weighted=True))
+        npt.assert_array_equal(self.utils.window_weights("fibonacci", 5), self.utils.fibonacci(n=5, weighted=True))
+        self.assertAlmostEqual(self.utils.window_weights("sine", 5).sum(), 1.0)
+        self.assertRaises(ValueError, self.utils.window_weights, "unknown", 5)
+
     def test_zero(self):
         self.assertEqual(self.utils.zero(-0.0000000000000001), 0)
         self.assertEqual(self.utils.zero(0), 0)
@@ -284,6 +495,17 @@ class TestUtilities(TestCase):
         self.assertNotEqual(self.utils.zero(0.000000000000001), 0)
         self.assertNotEqual(self.utils.zero(1), 0)
 
+    def test_get_engine(self):
+        self.assertEqual(self.utils.get_engine("numpy"), "numpy")
+        self.assertEqual(self.utils.get_engine("NumPy"), "numpy")
+
+        engine = "numba" if pandas_ta.Imports["numba"] else "numpy"
+        self.assertEqual(self.utils.get_engine(), engine)
+        self.assertEqual(self.utils.get_engine("numba"), engine)
+
+        for x in ["nunba", "", "scipy", 1]:
+            self.assertRaises(ValueError, self.utils.get_engine, x)
+
     def test_get_drift(self):
         for s in [0, None, "", [], {}]:
             self.assertIsInstance(self.utils.get_drift(s), int)